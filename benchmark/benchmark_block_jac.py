@@ -0,0 +1,81 @@
+import unittest
+
+import numpy as np
+
+import openmdao.api as om
+from openmdao.utils.assert_utils import assert_near_equal
+
+
+class CycleComp(om.ExplicitComponent):
+    """Component of a cycle that does some extra work each time it computes its outputs."""
+
+    def initialize(self):
+        self.options.declare('size', types=int, default=10)
+        self.options.declare('work', values=('numpy', 'python'), default='numpy',
+                             desc='numpy work releases the GIL, python work holds it.')
+
+    def setup(self):
+        size = self.options['size']
+        self.add_input('x', np.ones(size))
+        self.add_output('y', np.ones(size))
+
+        arange = np.arange(size)
+        self.declare_partials('y', 'x', rows=arange, cols=arange, val=0.5)
+
+        rng = np.random.RandomState(11)
+        mat = rng.random_sample((200, 200))
+        self._mat = mat.dot(mat.T)
+
+    def compute(self, inputs, outputs):
+        if self.options['work'] == 'numpy':
+            np.linalg.eigvalsh(self._mat)
+        else:
+            total = 0
+            for i in range(50000):
+                total += i % 7
+
+        outputs['y'] = 0.5 * inputs['x'] + 1.0
+
+
+def _build(num_comp, work, **solver_options):
+    prob = om.Problem()
+    model = prob.model
+
+    for i in range(num_comp):
+        model.add_subsystem('c%d' % i, CycleComp(work=work))
+        model.connect('c%d.y' % i, 'c%d.x' % ((i + 1) % num_comp))
+
+    model.nonlinear_solver = om.NonlinearBlockJac(maxiter=50, atol=1e-10, rtol=1e-10,
+                                                  **solver_options)
+
+    prob.setup()
+    prob.set_solver_print(level=0)
+    return prob
+
+
+def _check_results(prob, num_comp):
+    for i in range(num_comp):
+        assert_near_equal(prob['c%d.y' % i], 2.0 * np.ones(10), 1e-8)
+
+
+class BM(unittest.TestCase):
+
+    def benchmark_comp8_numpy_nlbj(self):
+        prob = _build(8, 'numpy')
+        prob.run_model()
+        _check_results(prob, 8)
+
+    def benchmark_comp8_numpy_nlbj_threads(self):
+        prob = _build(8, 'numpy', num_threads=4)
+        prob.run_model()
+        _check_results(prob, 8)
+
+    def benchmark_comp8_python_nlbj(self):
+        prob = _build(8, 'python')
+        prob.run_model()
+        _check_results(prob, 8)
+
+    def benchmark_comp8_python_nlbj_threads(self):
+        prob = _build(8, 'python', num_threads=4)
+        prob.run_model()
+        _check_results(prob, 8)
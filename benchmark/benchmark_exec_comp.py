@@ -0,0 +1,49 @@
+import unittest
+
+import numpy as np
+
+import openmdao.api as om
+from openmdao.components.exec_comp import _expr_dict, _IODict
+
+
+NCOMPS = 200
+NCALLS = 50
+
+EXPRS = ['y1 = sin(x) * cos(z) + 2.0 * x',
+         'y2 = sin(x) * cos(z) - 3.0 * z',
+         'y3 = sum(x * z) + exp(-x * x)']
+
+
+def _build():
+    p = om.Problem()
+    for i in range(NCOMPS):
+        p.model.add_subsystem('comp%d' % i, om.ExecComp(EXPRS, x=np.ones(5), z=np.ones(5),
+                                                        y1=np.ones(5), y2=np.ones(5),
+                                                        y3=np.ones(5)))
+    p.setup()
+    p.final_setup()
+    return p
+
+
+def _exec_compute(comp, inputs, outputs):
+    # evaluation path used before ExecComp generated a single function per component
+    for code in comp._codes:
+        exec(code, _expr_dict, _IODict(outputs, inputs))
+
+
+class BM(unittest.TestCase):
+    """Per-call cost of evaluating many ExecComps."""
+
+    def benchmark_compiled(self):
+        p = _build()
+        comps = list(p.model.system_iter(typ=om.ExecComp))
+        for i in range(NCALLS):
+            for comp in comps:
+                comp.compute(comp._inputs, comp._outputs)
+
+    def benchmark_exec(self):
+        p = _build()
+        comps = list(p.model.system_iter(typ=om.ExecComp))
+        for i in range(NCALLS):
+            for comp in comps:
+                _exec_compute(comp, comp._inputs, comp._outputs)
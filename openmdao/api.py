@@ -2,6 +2,7 @@
 
 # Core
 from openmdao.core.problem import Problem, slicer
+from openmdao.core.problem_template import ProblemTemplate
 from openmdao.core.group import Group
 from openmdao.core.parallel_group import ParallelGroup
 from openmdao.core.explicitcomponent import ExplicitComponent
@@ -78,7 +79,8 @@ from openmdao.drivers.genetic_algorithm_driver import SimpleGADriver
 from openmdao.drivers.differential_evolution_driver import DifferentialEvolutionDriver
 from openmdao.drivers.doe_driver import DOEDriver
 from openmdao.drivers.doe_generators import ListGenerator, CSVGenerator, UniformGenerator, \
-    FullFactorialGenerator, PlackettBurmanGenerator, BoxBehnkenGenerator, LatinHypercubeGenerator
+    FullFactorialGenerator, PlackettBurmanGenerator, BoxBehnkenGenerator, LatinHypercubeGenerator, \
+    NumpyFileGenerator
 
 # System-Building Tools
 from openmdao.utils.options_dictionary import OptionsDictionary
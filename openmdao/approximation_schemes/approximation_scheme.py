@@ -1,9 +1,10 @@
 """Base class used to define the interface for derivative approximation schemes."""
 from collections import defaultdict
 from itertools import chain
-from scipy.sparse import coo_matrix
+from scipy.sparse import coo_matrix, csc_matrix, csr_matrix
 import numpy as np
 
+from openmdao.core.constants import INT_DTYPE
 from openmdao.utils.array_utils import sub2full_indices, get_input_idx_split
 import openmdao.utils.coloring as coloring_mod
 from openmdao.utils.mpi import MPI
@@ -185,6 +186,7 @@ class ApproximationScheme(object):
             '@out_slices': out_slices,
             '@approxs': keys,
             '@jac_slices': {},
+            '@scatter': {},
         }
 
         # FIXME: need to deal with mix of local/remote indices
@@ -350,15 +352,15 @@ class ApproximationScheme(object):
                         if nz_rows is None:  # uncolored column
                             if do_rows_cols:
                                 nrows = tmpJ['@nrows']
-                                jrows.extend(range(nrows))
-                                jcols.extend(col_idxs * nrows)
-                            jdata.extend(result)
+                                jrows.append(np.arange(nrows))
+                                jcols.append(np.repeat(col_idxs, nrows))
+                            jdata.append(result)
                         else:
                             for i, col in enumerate(col_idxs):
                                 if do_rows_cols:
-                                    jrows.extend(nz_rows[i])
-                                    jcols.extend([col] * len(nz_rows[i]))
-                                jdata.extend(result[nz_rows[i]])
+                                    jrows.append(nz_rows[i])
+                                    jcols.append(np.full(len(nz_rows[i]), col, dtype=INT_DTYPE))
+                                jdata.append(result[nz_rows[i]])
                     else:  # parallel model (some vars are remote)
                         raise NotImplementedError("simul approx coloring with parallel FD/CS is "
                                                   "only supported currently when using "
@@ -397,13 +399,17 @@ class ApproximationScheme(object):
 
         mult = self._get_multiplier(data)
         if colored_shape is not None:  # coloring is active
+            jdata = np.concatenate(jdata) if jdata else np.zeros(0)
+            if do_rows_cols:
+                jrows = np.concatenate(jrows) if jrows else np.zeros(0, dtype=INT_DTYPE)
+                jcols = np.concatenate(jcols) if jcols else np.zeros(0, dtype=INT_DTYPE)
+
             if par_fd_w_serial_model:
                 if self._j_colored is None:
                     jstuff = mycomm.allgather((jrows, jcols, jdata))
-                    rowlist = [rows for rows, _, _ in jstuff if rows]
-                    allrows = np.hstack(rowlist)
-                    allcols = np.hstack(cols for _, cols, _ in jstuff if cols)
-                    alldata = np.hstack(dat for _, _, dat in jstuff if dat)
+                    allrows = np.hstack([rows for rows, _, _ in jstuff])
+                    allcols = np.hstack([cols for _, cols, _ in jstuff])
+                    alldata = np.hstack([dat for _, _, dat in jstuff])
                     self._j_colored = coo_matrix((alldata, (allrows, allcols)), shape=colored_shape)
                     self._j_data_sizes = sizes = np.array([len(x) for x, _, _ in jstuff])
                     self._j_data_offsets = offsets = np.zeros(mycomm.size)
@@ -423,25 +429,24 @@ class ApproximationScheme(object):
             if mult != 1.0:
                 self._j_colored.data *= mult
 
-            # convert COO matrix to dense for easier slicing
-            Jcolored = self._j_colored.toarray()
-
         elif is_parallel and not is_distributed:  # uncolored with parallel systems
             results = _gather_jac_results(mycomm, results)
 
-        if colored_approx_groups is not None:
-            for _, _, tmpJ, _, _ in colored_approx_groups:
-                # TODO: coloring when using parallel FD and/or FD with remote comps
-                for key in tmpJ['@approxs']:
-                    slc = tmpJ['@jac_slices'][key]
-                    if uses_voi_indices:
-                        jac._override_checks = True
-                        jac[key] = _from_dense(jacobian, key, Jcolored[slc])
-                        jac._override_checks = False
-                    else:
-                        jac[key] = _from_dense(jacobian, key, Jcolored[slc])
-
-        Jcolored = None  # clean up memory
+        if colored_approx_groups:
+            # all of the colored approx groups share the same tmpJ
+            tmpJ = colored_approx_groups[0][2]
+            scatter = tmpJ['@scatter']
+            # TODO: coloring when using parallel FD and/or FD with remote comps
+            for key in tmpJ['@approxs']:
+                if key not in scatter:
+                    scatter[key] = _get_colored_scatter(jacobian, key, self._j_colored,
+                                                        tmpJ['@jac_slices'][key])
+                if uses_voi_indices:
+                    jac._override_checks = True
+                    jac[key] = _from_colored(self._j_colored.data, scatter[key])
+                    jac._override_checks = False
+                else:
+                    jac[key] = _from_colored(self._j_colored.data, scatter[key])
 
         for wrt, _, _, tmpJ, _, _ in approx_groups:
             J = tmpJ[wrt]
@@ -497,18 +502,102 @@ def _from_dense(jac, key, subjac, reduced_rows=_full_slice, reduced_cols=_full_s
     elif isinstance(val, np.ndarray):
         return subjac
     elif isinstance(val, coo_matrix):
-        return coo_matrix(((val.row, val.col), subjac[val.row, val.col]))
+        return coo_matrix((subjac[val.row, val.col], (val.row, val.col)), shape=val.shape)
     elif isinstance(val, csc_matrix):
         coo = val.tocoo()
-        return coo_matrix(((coo.row, coo.col), subjac[coo.row, coo.col])).tocsc()
+        return coo_matrix((subjac[coo.row, coo.col], (coo.row, coo.col)),
+                          shape=val.shape).tocsc()
     elif isinstance(val, csr_matrix):
         coo = val.tocoo()
-        return coo_matrix(((coo.row, coo.col), subjac[coo.row, coo.col])).tocsr()
+        return coo_matrix((subjac[coo.row, coo.col], (coo.row, coo.col)),
+                          shape=val.shape).tocsr()
     else:
         raise TypeError("Don't know how to convert dense ndarray to type '%s'" %
                         val.__class__.__name__)
 
 
+def _get_colored_scatter(jac, key, J, slices):
+    """
+    Return the mapping from the colored jacobian data to the internal storage of a subjac.
+
+    Parameters
+    ----------
+    jac : Jacobian or None
+        Jacobian object.
+    key : (str, str)
+        Tuple of absolute names of of and wrt variables.
+    J : coo_matrix
+        The colored jacobian.
+    slices : (slice, slice)
+        Row and column slices of the subjac within the colored jacobian.
+
+    Returns
+    -------
+    tuple
+        Shape of the subjac values, indices into the subjac values, indices of the corresponding
+        entries of the colored jacobian data, and, if the subjac is a scipy sparse matrix, its
+        rows, cols, shape and format.
+    """
+    rslice, cslice = slices
+    ncols = cslice.stop - cslice.start
+    src = np.nonzero((J.row >= rslice.start) & (J.row < rslice.stop) &
+                     (J.col >= cslice.start) & (J.col < cslice.stop))[0]
+    lin = (J.row[src] - rslice.start) * ncols + (J.col[src] - cslice.start)
+
+    sparse = None
+    if jac is not None:
+        meta = jac._subjacs_info[key]
+        val = meta['value']
+        if meta['rows'] is not None:  # internal format is our home grown COO
+            rows, cols = meta['rows'], meta['cols']
+        elif isinstance(val, np.ndarray):
+            rows = None
+        elif isinstance(val, (coo_matrix, csc_matrix, csr_matrix)):
+            coo = val.tocoo()
+            rows, cols = coo.row, coo.col
+            sparse = (rows, cols, val.shape, val.format)
+        else:
+            raise TypeError("Don't know how to convert colored jacobian data to type '%s'" %
+                            val.__class__.__name__)
+
+        if rows is not None:
+            # match the nonzeros of the subjac to the colored nonzeros in its block
+            tlin = rows * ncols + cols
+            order = np.argsort(lin)
+            slin = lin[order]
+            pos = np.minimum(np.searchsorted(slin, tlin), max(slin.size - 1, 0))
+            found = np.nonzero(slin[pos] == tlin)[0] if slin.size else np.zeros(0, dtype=int)
+            return (tlin.size, found, src[order[pos[found]]], sparse)
+
+    return ((rslice.stop - rslice.start, ncols), lin, src, sparse)
+
+
+def _from_colored(data, scatter):
+    """
+    Return a subjac, in the form of our internal subjac, from the colored jacobian data.
+
+    Parameters
+    ----------
+    data : ndarray
+        Data array of the colored jacobian.
+    scatter : tuple
+        Mapping from the colored jacobian data to the subjac, from _get_colored_scatter.
+
+    Returns
+    -------
+    ndarray or sparse matrix
+        The subjac.
+    """
+    shape, dst, src, sparse = scatter
+    vals = np.zeros(shape, dtype=data.dtype)
+    # vals is contiguous, so its flattened version is a view
+    vals.reshape(-1)[dst] = data[src]
+    if sparse is None:
+        return vals
+    rows, cols, shape, fmt = sparse
+    return coo_matrix((vals, (rows, cols)), shape=shape).asformat(fmt)
+
+
 def _gather_jac_results(comm, results):
     new_results = defaultdict(list)
 
@@ -76,6 +76,8 @@ class FiniteDifference(ApproximationScheme):
         A copy of the starting inputs array used to restore the inputs to original values.
     _results_tmp : ndarray
         An array the same size as the system outputs. Used to store the results temporarily.
+    _precomputed : iterator of ndarray or None
+        Results of points that were run ahead of time, in the order that they are needed.
     """
 
     DEFAULT_OPTIONS = {
@@ -92,6 +94,7 @@ class FiniteDifference(ApproximationScheme):
         """
         super().__init__()
         self._starting_ins = self._starting_outs = self._results_tmp = None
+        self._precomputed = None
 
     def add_approximation(self, abs_key, system, kwargs, vector=None):
         """
@@ -195,10 +198,46 @@ class FiniteDifference(ApproximationScheme):
         else:
             self._results_tmp = self._starting_resids.copy()
 
-        self._compute_approximations(system, jac, total, system._outputs._under_complex_step)
+        # external codes can run all of their points at once, each in its own directory
+        runner = getattr(system, '_external_code_runner', None)
+        if runner is not None and not total and runner._can_run_concurrently():
+            self._precomputed = iter(runner._run_concurrently(self._get_points(system)))
 
-        # reclaim some memory
-        self._starting_ins = self._starting_outs = self._results_tmp = None
+        try:
+            self._compute_approximations(system, jac, total, system._outputs._under_complex_step)
+        finally:
+            # reclaim some memory
+            self._starting_ins = self._starting_outs = self._results_tmp = None
+            self._precomputed = None
+
+    def _get_points(self, system):
+        """
+        Return the perturbations in the order that _compute_approximations runs them.
+
+        Parameters
+        ----------
+        system : System
+            System whose derivatives are being approximated.
+
+        Returns
+        -------
+        list of (tuple, float or ndarray)
+            The wrt indices info and the perturbation of each point.
+        """
+        approx_groups, colored_approx_groups = self._get_approx_groups(system, False)
+
+        points = []
+        if colored_approx_groups is not None:
+            for data, _, _, idx_info, _ in colored_approx_groups:
+                points.extend((idx_info, delta) for delta in data[0])
+
+        for wrt, data, col_idxs, tmpJ, idx_info, _ in approx_groups:
+            vector = tmpJ[wrt]['vector']
+            deltas = data[0] if vector is None else self.apply_directional(data, vector)[0]
+            for idxs in col_idxs:
+                points.extend((((idx_info[0][0], idxs),), delta) for delta in deltas)
+
+        return points
 
     def _get_multiplier(self, data):
         """
@@ -294,6 +333,10 @@ class FiniteDifference(ApproximationScheme):
         ndarray
             The results from running the perturbed system.
         """
+        if self._precomputed is not None:
+            self._results_tmp[:] = next(self._precomputed)
+            return self._results_tmp
+
         for vec, idxs in idx_info:
             if vec is not None:
                 vec.iadd(delta, idxs)
@@ -1,5 +1,9 @@
 """Define the ExecComp class, a component that evaluates an expression."""
 import re
+import ast
+import sys
+import marshal
+from importlib.util import MAGIC_NUMBER
 from itertools import product
 
 import numpy as np
@@ -19,7 +23,22 @@ _allowed_meta = {'value', 'shape', 'units', 'res_units', 'desc',
                  'flat_src_indices', 'tags', 'shape_by_conn', 'copy_shape'}
 
 # Names that are not allowed for input or output variables (keywords for options)
-_disallowed_names = {'has_diag_partials', 'units', 'shape'}
+_disallowed_names = {'has_diag_partials', 'units', 'shape', 'do_coloring'}
+
+# Functions that return a new array.  Calls to these are never shared between expressions
+# because an expression may modify the returned array in place.
+_array_creation_funcs = {'arange', 'ones', 'zeros', 'linspace'}
+
+# Node types that may appear in a subexpression that is computed once and shared.
+_cse_node_types = (ast.BinOp, ast.UnaryOp, ast.Call, ast.Subscript, ast.Name, ast.Constant,
+                   ast.Slice, ast.Tuple, ast.keyword, ast.operator, ast.unaryop, ast.expr_context)
+if sys.version_info < (3, 9):
+    # older versions wrap subscripts in Index and ExtSlice nodes, and before 3.8 numbers are
+    # parsed as Num nodes instead of Constant nodes
+    _cse_node_types += (ast.Num, ast.Index, ast.ExtSlice)
+
+# Node types that are worth computing once when they appear more than once.
+_cse_root_types = (ast.BinOp, ast.UnaryOp, ast.Call, ast.Subscript)
 
 
 def check_option(option, value):
@@ -66,6 +85,12 @@ class ExecComp(ExplicitComponent):
         List of expressions.
     _codes : list
         List of code objects.
+    _func : function or None
+        Function generated from all expressions that computes the outputs from the inputs.
+    _func_code : code or None
+        Compiled code that defines _func.
+    _func_lines : list of int
+        Index of the expression that each line of the generated function belongs to.
     _has_diag_partials : bool
         If True, treat all array/array partials as diagonal if both arrays have size > 1.
         All arrays with size > 1 must have the same flattened size or an exception will be raised.
@@ -86,6 +111,11 @@ class ExecComp(ExplicitComponent):
                                   'arrays have size > 1. All arrays with size > 1 must have the '
                                   'same flattened size or an exception will be raised.')
 
+        self.options.declare('do_coloring', types=bool, default=False,
+                             desc='If True, compute the sparsity of the partial jacobian at the '
+                                  'first linearization and use a coloring to complex step '
+                                  'groups of input entries in a single evaluation.')
+
         self.options.declare('units', types=str, allow_none=True, default=None,
                              desc='Units to be assigned to all variables in this component. '
                                   'Default is None, which means units are provided for variables '
@@ -220,6 +250,9 @@ class ExecComp(ExplicitComponent):
 
         self._exprs = exprs[:]
         self._codes = None
+        self._func = None
+        self._func_code = None
+        self._func_lines = []
         self._kwargs = kwargs
 
     def setup(self):
@@ -322,7 +355,16 @@ class ExecComp(ExplicitComponent):
             else:
                 self.add_input(var, val, **meta)
 
-        for expr in self._exprs:
+        if self.options['do_coloring'] and not self.options['has_diag_partials']:
+            # all partials are complex stepped by the approximation scheme, which finds their
+            # sparsity and colors them at the first linearization
+            self.declare_coloring(wrt='*', method='cs', step=self.complex_stepsize,
+                                  show_summary=False)
+            exprs = []
+        else:
+            exprs = self._exprs
+
+        for expr in exprs:
             lhs, _ = expr.split('=', 1)
             outs = self._parse_for_out_vars(lhs)
             all = self._parse_for_vars(expr)  # gets in and out
@@ -349,6 +391,8 @@ class ExecComp(ExplicitComponent):
                         self.declare_partials(of=out, wrt=inp)
 
         self._codes = self._compile_exprs(self._exprs)
+        self._func_code, self._func_lines = self._compile_func(self._exprs)
+        self._func = self._load_func(self._func_code)
 
     def _compile_exprs(self, exprs):
         compiled = []
@@ -360,6 +404,135 @@ class ExecComp(ExplicitComponent):
                                    (self.msginfo, exprs[i]))
         return compiled
 
+    def _compile_func(self, exprs):
+        """
+        Generate the code of a single function that evaluates all of the given expressions.
+
+        Inputs are bound to local names once per call and outputs are written back after the
+        statement that assigns them.  Subexpressions that depend only on inputs and appear more
+        than once are computed once, just before the first expression that uses them.
+
+        Parameters
+        ----------
+        exprs : list of str
+            The expressions to be evaluated.
+
+        Returns
+        -------
+        code
+            Compiled code that defines a function with signature func(inputs, outputs).
+        list of int
+            Index of the expression that each line of the function belongs to.
+        """
+        outs = set()
+        allvars = set()
+        stmts = []
+        for expr in exprs:
+            lhs, _ = expr.split('=', 1)
+            outs.update(self._parse_for_out_vars(lhs))
+            allvars.update(self._parse_for_vars(expr))
+            stmts.append(ast.parse(expr, mode='exec').body)
+
+        ins = allvars - outs
+        cse_defs = _replace_common_subexprs(stmts, ins)
+
+        # figure out which variables each expression reads and writes
+        reads = []
+        writes = []
+        for expr_stmts in stmts:
+            rd = set()
+            wr = set()
+            for stmt in expr_stmts:
+                for node in ast.walk(stmt):
+                    if isinstance(node, ast.Name) and node.id in allvars:
+                        if isinstance(node.ctx, ast.Store):
+                            wr.add(node.id)
+                        else:
+                            rd.add(node.id)
+            reads.append(rd)
+            writes.append(wr)
+
+        for node, first in cse_defs.values():
+            reads[first].update(n.id for n in ast.walk(node)
+                                if isinstance(n, ast.Name) and n.id in ins)
+
+        body = []
+        lines = []
+        defined = set()
+        for i, (rd, wr) in enumerate(zip(reads, writes)):
+            # outputs that are read (or assigned by index) before being assigned here
+            # are taken from the output vector.
+            for name in sorted(rd - defined):
+                src = '_inputs' if name in ins else '_outputs'
+                body.append(ast.parse("%s = %s['%s']" % (name, src, name)).body[0])
+                lines.append(i)
+                defined.add(name)
+            for cname, (node, first) in cse_defs.items():
+                if first == i:
+                    assign = ast.parse("%s = None" % cname).body[0]
+                    assign.value = node
+                    body.append(assign)
+                    lines.append(i)
+            for stmt in stmts[i]:
+                body.append(stmt)
+                lines.append(i)
+            for name in sorted(wr):
+                body.append(ast.parse("_outputs['%s'] = %s" % (name, name)).body[0])
+                lines.append(i)
+                # rebind to the output so later in-place changes modify the output vector
+                if any(name in r for r in reads[i + 1:]):
+                    body.append(ast.parse("%s = _outputs['%s']" % (name, name)).body[0])
+                    lines.append(i)
+            defined.update(wr)
+
+        mod = ast.parse("def _exec_comp_func(_inputs, _outputs):\n    pass")
+        if body:
+            mod.body[0].body = body
+        # line 1 is the def, so statement j is on line j + 2
+        for j, stmt in enumerate(body):
+            for node in ast.walk(stmt):
+                if 'lineno' in node._attributes:
+                    node.lineno = j + 2
+                    if hasattr(node, 'end_lineno'):
+                        node.end_lineno = j + 2
+        ast.fix_missing_locations(mod)
+
+        try:
+            code = compile(mod, self._func_filename(), 'exec')
+        except Exception:
+            raise RuntimeError("%s: failed to compile expressions %s." % (self.msginfo, exprs))
+
+        return code, [0] + lines
+
+    def _load_func(self, code):
+        """
+        Return the function defined by the given code.
+
+        Parameters
+        ----------
+        code : code
+            Compiled code returned by _compile_func.
+
+        Returns
+        -------
+        function
+            Function with signature func(inputs, outputs).
+        """
+        namespace = {}
+        exec(code, _expr_dict, namespace)
+        return namespace['_exec_comp_func']
+
+    def _func_filename(self):
+        """
+        Return the file name used for the generated function.
+
+        Returns
+        -------
+        str
+            Name identifying the generated function in tracebacks.
+        """
+        return '<ExecComp %s>' % self.pathname
+
     def _parse_for_out_vars(self, s):
         vnames = set([x.strip() for x in re.findall(VAR_RGX, s)
                       if not x.endswith('(') and not x.startswith('.')])
@@ -399,6 +572,12 @@ class ExecComp(ExplicitComponent):
         """
         state = self.__dict__.copy()
         del state['_codes']
+        del state['_func']
+        del state['_func_code']
+        if self._func_code is not None:
+            # code objects can't be pickled, but they can be marshaled for the same version of
+            # Python, which saves generating and compiling the function again when it's loaded
+            state['_func_code'] = (MAGIC_NUMBER, marshal.dumps((self._codes, self._func_code)))
         return state
 
     def __setstate__(self, state):
@@ -411,7 +590,13 @@ class ExecComp(ExplicitComponent):
             State to restore.
         """
         self.__dict__.update(state)
-        self._codes = self._compile_exprs(self._exprs)
+        marshaled = state.get('_func_code')
+        if marshaled is not None and marshaled[0] == MAGIC_NUMBER:
+            self._codes, self._func_code = marshal.loads(marshaled[1])
+        else:
+            self._codes = self._compile_exprs(self._exprs)
+            self._func_code, self._func_lines = self._compile_func(self._exprs)
+        self._func = self._load_func(self._func_code)
 
     def compute(self, inputs, outputs):
         """
@@ -425,12 +610,20 @@ class ExecComp(ExplicitComponent):
         outputs : `Vector`
             `Vector` containing outputs.
         """
-        for i, expr in enumerate(self._codes):
-            try:
-                exec(expr, _expr_dict, _IODict(outputs, inputs))
-            except Exception as err:
-                raise RuntimeError("%s: Error occurred evaluating '%s'\n%s"
-                                   % (self.msginfo, self._exprs[i], str(err)))
+        try:
+            self._func(inputs, outputs)
+        except Exception as err:
+            # find the expression being evaluated from the line of the generated function
+            # where the error occurred.
+            fname = self._func_filename()
+            i = 0
+            tb = sys.exc_info()[2]
+            while tb is not None:
+                if tb.tb_frame.f_code.co_filename == fname:
+                    i = self._func_lines[tb.tb_lineno - 1]
+                tb = tb.tb_next
+            raise RuntimeError("%s: Error occurred evaluating '%s'\n%s"
+                               % (self.msginfo, self._exprs[i], str(err)))
 
     def compute_partials(self, inputs, partials):
         """
@@ -449,6 +642,10 @@ class ExecComp(ExplicitComponent):
         inv_stepsize = 1.0 / self.complex_stepsize
         has_diag_partials = self.options['has_diag_partials']
 
+        if self.options['do_coloring'] and not has_diag_partials:
+            # the colored approximation has already computed the partials
+            return
+
         for input in inputs:
 
             pwrap = _TmpDict(inputs)
@@ -593,6 +790,161 @@ class _IODict(object):
         return name in self._outputs or name in self._inputs
 
 
+def _scanned_node(stmt):
+    """
+    Return the part of a statement that may contain shared subexpressions.
+
+    Parameters
+    ----------
+    stmt : ast.AST
+        The statement, or an expression node.
+
+    Returns
+    -------
+    ast.AST
+        The value of an assignment, otherwise the node itself.
+    """
+    return stmt.value if isinstance(stmt, ast.Assign) else stmt
+
+
+def _is_cse_candidate(node, ins):
+    """
+    Return True if the given expression node may be computed once and shared.
+
+    Parameters
+    ----------
+    node : ast.AST
+        The expression node.
+    ins : set of str
+        Names of the input variables.
+
+    Returns
+    -------
+    bool
+        True if the node only depends on inputs and on functions without side effects.
+    """
+    for sub in ast.walk(node):
+        if not isinstance(sub, _cse_node_types):
+            return False
+        if isinstance(sub, ast.Name):
+            if sub.id not in ins and (sub.id not in _expr_dict or
+                                      sub.id in _array_creation_funcs):
+                return False
+        elif isinstance(sub, ast.Call) and not isinstance(sub.func, ast.Name):
+            return False
+    return True
+
+
+def _replace_common_subexprs(stmts, ins):
+    """
+    Replace repeated input-only subexpressions in the given statements with local names.
+
+    The largest repeated subexpression is replaced first, so the value of a replaced
+    subexpression may itself refer to the names of smaller ones.
+
+    Parameters
+    ----------
+    stmts : list of list of ast.stmt
+        Parsed statements for each expression.  These are modified in place.
+    ins : set of str
+        Names of the input variables.
+
+    Returns
+    -------
+    dict
+        Mapping of local name to (expression node, index of first expression using it),
+        in the order the names must be computed.
+    """
+    defs = []
+
+    while True:
+        counts = {}
+        scanned = [[_scanned_node(s) for s in expr_stmts] for expr_stmts in stmts]
+        for i, nodes in enumerate(scanned + [[dnode] for _, dnode, _ in defs]):
+            for top in nodes:
+                for node in ast.walk(top):
+                    if isinstance(node, _cse_root_types):
+                        key = ast.dump(node)
+                        if key in counts:
+                            counts[key][1] += 1
+                        else:
+                            counts[key] = [node, 1, i]
+
+        best = None
+        best_size = 0
+        for key, (node, count, _) in counts.items():
+            if count > 1:
+                size = sum(1 for _ in ast.walk(node))
+                if size > best_size and _is_cse_candidate(node, ins):
+                    best = key
+                    best_size = size
+
+        if best is None:
+            break
+
+        name = '_cse%d' % len(defs)
+        node, _, first = counts[best]
+        replacer = _SubexprReplacer(best, name)
+
+        for expr_stmts in stmts:
+            for stmt in expr_stmts:
+                if isinstance(stmt, ast.Assign):
+                    stmt.value = replacer.visit(stmt.value)
+                else:
+                    replacer.visit(stmt)
+
+        # the new name must be available to the first expression that uses it either
+        # directly or through one of the previously defined names.
+        if first >= len(stmts):
+            first = defs[first - len(stmts)][2]
+        for k, (dname, dnode, dfirst) in enumerate(defs):
+            replacer.found = False
+            defs[k] = (dname, replacer.visit(dnode), dfirst)
+            if replacer.found:
+                first = min(first, dfirst)
+
+        # smaller subexpressions must be computed before the larger ones that contain them
+        defs.insert(0, (name, node, first))
+
+    return {name: (node, first) for name, node, first in defs}
+
+
+class _SubexprReplacer(ast.NodeTransformer):
+    """
+    Replace every occurrence of an expression with a local variable name.
+
+    Attributes
+    ----------
+    _key : str
+        Dump of the expression to be replaced.
+    _name : str
+        Name of the local variable.
+    found : bool
+        True if a replacement was made.
+    """
+
+    def __init__(self, key, name):
+        """
+        Initialize attributes.
+
+        Parameters
+        ----------
+        key : str
+            Dump of the expression to be replaced.
+        name : str
+            Name of the local variable.
+        """
+        self._key = key
+        self._name = name
+        self.found = False
+
+    def visit(self, node):
+        if isinstance(node, ast.expr) and ast.dump(node) == self._key:
+            self.found = True
+            return ast.copy_location(ast.Name(id=self._name, ctx=ast.Load()), node)
+        return super().visit(node)
+
+
 def _import_functs(mod, dct, names=None):
     """
     Map attributes attrs from the given module into the given dict.
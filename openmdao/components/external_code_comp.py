@@ -2,14 +2,20 @@
 import os
 import sys
 import re
+import shutil
+import tempfile
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 
+import numpy as np
 import numpy.distutils
 from numpy.distutils.exec_command import find_executable
 
 from openmdao.core.analysis_error import AnalysisError
 from openmdao.core.explicitcomponent import ExplicitComponent
 from openmdao.core.implicitcomponent import ImplicitComponent
-from openmdao.utils.shell_proc import STDOUT, DEV_NULL, ShellProc
+from openmdao.utils.run_cache import RunCache
+from openmdao.utils.shell_proc import STDOUT, DEV_NULL, ShellProc, WorkerProc
 
 
 class ExternalCodeDelegate(object):
@@ -20,6 +26,12 @@ class ExternalCodeDelegate(object):
     ----------
     _comp : ExternalCodeComp or ExternalCodeImplicitComp object
         The external code object this delegate is associated with.
+    _cache : RunCache or None
+        Cache of the runs of the external code, if caching is enabled.
+    _cache_args : tuple or None
+        The cache_dir and cache_max_size options used to create the cache.
+    _workers : dict
+        Persistent worker processes, keyed by their command.
     """
 
     def __init__(self, comp):
@@ -32,6 +44,21 @@ class ExternalCodeDelegate(object):
             The external code object this delegate is associated with.
         """
         self._comp = comp
+        self._cache = self._cache_args = None
+        self._workers = {}
+
+    def __getstate__(self):
+        """
+        Return state as a dict, without the worker processes.
+
+        Returns
+        -------
+        dict
+            State to get.
+        """
+        state = self.__dict__.copy()
+        state['_workers'] = {}
+        return state
 
     def declare_options(self):
         """
@@ -45,7 +72,7 @@ class ExternalCodeDelegate(object):
         comp.options.declare('env_vars', {}, desc='Environment variables required by the command.')
         comp.options.declare('poll_delay', 0.0, lower=0.0,
                              desc='Delay between polling for command completion. '
-                                  'A value of zero will use an internally computed default.')
+                                  'A value of zero waits for completion without polling.')
         comp.options.declare('timeout', 0.0, lower=0.0,
                              desc='Maximum time to wait for command completion. '
                                   'A value of zero implies an infinite wait.')
@@ -61,6 +88,35 @@ class ExternalCodeDelegate(object):
                                   "(AnalysisError).")
         comp.options.declare('allowed_return_codes', [0],
                              desc="List of return codes that are considered successful.")
+        comp.options.declare('persistent', types=bool, default=False,
+                             desc="If True, the command is started once and kept running as a "
+                                  "worker process. Each run sends a request to the worker "
+                                  "through its stdin and waits for its reply on its stdout, "
+                                  "rather than starting the command again. The command must "
+                                  "implement the protocol of "
+                                  "openmdao.utils.shell_proc.WorkerProc.")
+        comp.options.declare('fd_num_workers', 1, types=int, lower=1,
+                             desc="Maximum number of finite difference points that are run "
+                                  "concurrently when partials are approximated using "
+                                  "method='fd'. Each point is run in a separate process in its "
+                                  "own scratch directory. Not supported on Windows or under MPI, "
+                                  "where the points are always run one at a time.")
+        comp.options.declare('fd_scratch_dir', None, types=str, allow_none=True,
+                             desc="Directory where the scratch directories of concurrent finite "
+                                  "difference points are created. If None, a temporary "
+                                  "directory is used.")
+        comp.options.declare('fd_scratch_files', [],
+                             desc="List of files, other than the external input files, that are "
+                                  "copied into the scratch directory of each concurrent finite "
+                                  "difference point, e.g., scripts or data used by the command.")
+        comp.options.declare('cache_dir', None, types=str, allow_none=True,
+                             desc="Directory where the external output files of successful runs "
+                                  "are cached. A run with the same command, inputs and external "
+                                  "input file contents as a cached run restores its output files "
+                                  "instead of running the command. If None, runs aren't cached.")
+        comp.options.declare('cache_max_size', 2**30, types=int, lower=0,
+                             desc="Maximum total size in bytes of the files in the cache. When "
+                                  "it's exceeded, the least recently used runs are removed.")
 
     def check_config(self, logger):
         """
@@ -140,12 +196,25 @@ class ExternalCodeDelegate(object):
             err_class = AnalysisError
 
         return_code = None
+        cache = self._get_cache()
 
         try:
             missing = self._check_for_files(comp.options['external_input_files'])
             if missing:
                 raise err_class("The following input files are missing: %s"
                                 % sorted(missing))
+
+            if cache is not None:
+                output_files = self._get_cached_files()
+                key = cache.get_key(command, comp.options['env_vars'],
+                                    comp.options['external_input_files'], output_files,
+                                    self._get_cache_values())
+                return_code = cache.restore(key, output_files)
+                if return_code is not None:
+                    comp.cache_hits += 1
+                    return
+                comp.cache_misses += 1
+
             return_code, error_msg = self._execute_local(command)
 
             if return_code is None:
@@ -171,6 +240,9 @@ class ExternalCodeDelegate(object):
                 raise err_class("The following output files are missing: %s"
                                 % sorted(missing))
 
+            if cache is not None:
+                cache.store(key, output_files, return_code)
+
         finally:
             comp.return_code = -999999 if return_code is None else return_code
 
@@ -190,9 +262,15 @@ class ExternalCodeDelegate(object):
         str
             Error Message
         """
-        # Check to make sure command exists
         comp = self._comp
 
+        if comp.options['persistent']:
+            key = command if isinstance(command, str) else tuple(command)
+            worker = self._workers.get(key)
+            if worker is not None and worker._owner == os.getpid() and worker.poll() is None:
+                return worker.request(command, comp.options['timeout'])
+
+        # Check to make sure command exists
         if isinstance(command, str):
             program_to_execute = re.findall(r"^([\w\-]+)", command)[0]
         else:
@@ -218,6 +296,14 @@ class ExternalCodeDelegate(object):
                                  "cannot be found" % program_to_execute)
             command_for_shell_proc = command
 
+        if comp.options['persistent']:
+            # start a new worker if there isn't one, or the one there is exited or was forked
+            if worker is not None and worker._owner == os.getpid():
+                worker.stop()
+            worker = self._workers[key] = WorkerProc(command_for_shell_proc, comp.stderr,
+                                                     comp.options['env_vars'])
+            return worker.request(command, comp.options['timeout'])
+
         comp._process = \
             ShellProc(command_for_shell_proc, comp.stdin,
                       comp.stdout, comp.stderr, comp.options['env_vars'])
@@ -231,6 +317,211 @@ class ExternalCodeDelegate(object):
 
         return (return_code, error_msg)
 
+    def _stop_workers(self):
+        """
+        Stop the persistent worker processes started by this process.
+        """
+        for worker in self._workers.values():
+            if worker._owner == os.getpid():
+                worker.stop()
+        self._workers = {}
+
+    def _get_cache(self):
+        """
+        Return the cache of the runs of the external code.
+
+        Returns
+        -------
+        RunCache or None
+            The cache, or None if caching isn't enabled.
+        """
+        options = self._comp.options
+        args = (options['cache_dir'], options['cache_max_size'])
+
+        if args[0] is None:
+            self._cache = None
+        elif self._cache is None or self._cache_args != args:
+            # a relative cache directory is relative to the directory of the first run
+            self._cache = RunCache(*args)
+            self._cache_args = args
+
+        return self._cache
+
+    def _get_cached_files(self):
+        """
+        Return the files written by a run that are cached.
+
+        Returns
+        -------
+        list of str
+            The external output files, along with the stdout and stderr files.
+        """
+        comp = self._comp
+        files = list(comp.options['external_output_files'])
+        for stream in (comp.stdout, comp.stderr):
+            if isinstance(stream, str) and stream != DEV_NULL and stream not in files:
+                files.append(stream)
+        return files
+
+    def _get_cache_values(self):
+        """
+        Return the values of the variables that a run may depend on.
+
+        Returns
+        -------
+        ndarray
+            The values of the inputs, along with the outputs of an implicit component.
+        """
+        comp = self._comp
+        if isinstance(comp, ImplicitComponent):
+            return np.concatenate((comp._inputs.asarray(), comp._outputs.asarray()))
+        return comp._inputs.asarray()
+
+    def _can_run_concurrently(self):
+        """
+        Return True if finite difference points of the component can be run concurrently.
+
+        Returns
+        -------
+        bool
+            True if finite difference points can be run concurrently.
+        """
+        comp = self._comp
+        return (comp.options['fd_num_workers'] > 1 and comp.comm.size == 1 and
+                comp._num_par_fd == 1 and not comp.under_complex_step and
+                'fork' in multiprocessing.get_all_start_methods())
+
+    def _run_concurrently(self, points):
+        """
+        Run the given finite difference points concurrently, each in its own scratch directory.
+
+        Parameters
+        ----------
+        points : list of (tuple, float or ndarray)
+            The wrt indices info and the perturbation of each point.
+
+        Returns
+        -------
+        list of ndarray
+            The residuals of each perturbed point.
+        """
+        global _fd_delegate, _fd_points, _fd_scratch_dir
+
+        comp = self._comp
+        scratch_dir = comp.options['fd_scratch_dir']
+        if scratch_dir is None:
+            _fd_scratch_dir = tempfile.mkdtemp(prefix=comp.pathname + '-fd-')
+        else:
+            if not os.path.isdir(scratch_dir):
+                os.makedirs(scratch_dir)
+            _fd_scratch_dir = scratch_dir
+
+        # the workers are forked, so they get the component, the points and the cache from here
+        _fd_delegate = self
+        _fd_points = points
+        self._get_cache()
+
+        try:
+            with ProcessPoolExecutor(max_workers=min(comp.options['fd_num_workers'], len(points)),
+                                     mp_context=multiprocessing.get_context('fork')) as executor:
+                results = list(executor.map(_run_fd_point, range(len(points))))
+        finally:
+            _fd_delegate = _fd_points = None
+            if scratch_dir is None:
+                shutil.rmtree(_fd_scratch_dir, ignore_errors=True)
+            _fd_scratch_dir = None
+
+        for _, hits, misses in results:
+            comp.cache_hits += hits
+            comp.cache_misses += misses
+
+        return [resids for resids, _, _ in results]
+
+    def _run_point(self, point, rundir):
+        """
+        Run a single perturbed point in the given directory.
+
+        Parameters
+        ----------
+        point : (tuple, float or ndarray)
+            The wrt indices info and the perturbation of the point.
+        rundir : str
+            Directory where the point is run.
+
+        Returns
+        -------
+        ndarray
+            The residuals of the perturbed point.
+        int
+            Number of cache hits of the run.
+        int
+            Number of cache misses of the run.
+        """
+        comp = self._comp
+        startdir = os.getcwd()
+        hits, misses = comp.cache_hits, comp.cache_misses
+
+        for fname in comp.options['external_input_files'] + comp.options['fd_scratch_files']:
+            if not os.path.isabs(fname) and os.path.exists(fname):
+                dest = os.path.join(rundir, fname)
+                os.makedirs(os.path.dirname(dest), exist_ok=True)
+                if os.path.isdir(fname):
+                    shutil.copytree(fname, dest)
+                else:
+                    shutil.copy2(fname, dest)
+
+        starting_ins = comp._inputs.asarray(copy=True)
+        starting_outs = comp._outputs.asarray(copy=True)
+        starting_resids = comp._residuals.asarray(copy=True)
+
+        idx_info, delta = point
+        for vec, idxs in idx_info:
+            if vec is not None:
+                vec.iadd(delta, idxs)
+
+        os.chdir(rundir)
+        try:
+            comp.run_apply_nonlinear()
+            return (comp._residuals.asarray(copy=True), comp.cache_hits - hits,
+                    comp.cache_misses - misses)
+        finally:
+            os.chdir(startdir)
+
+            # worker processes run several points, so restore the starting values
+            comp._inputs.set_val(starting_ins)
+            comp._outputs.set_val(starting_outs)
+            comp._residuals.set_val(starting_resids)
+
+
+_fd_delegate = None
+_fd_points = None
+_fd_scratch_dir = None
+
+
+def _run_fd_point(i):
+    """
+    Run the given finite difference point in a worker process.
+
+    Parameters
+    ----------
+    i : int
+        Index of the point.
+
+    Returns
+    -------
+    ndarray
+        The residuals of the perturbed point.
+    int
+        Number of cache hits of the run.
+    int
+        Number of cache misses of the run.
+    """
+    rundir = tempfile.mkdtemp(prefix='point_%d-' % i, dir=_fd_scratch_dir)
+    try:
+        return _fd_delegate._run_point(_fd_points[i], rundir)
+    finally:
+        shutil.rmtree(rundir, ignore_errors=True)
+
 
 class ExternalCodeComp(ExplicitComponent):
     """
@@ -251,6 +542,10 @@ class ExternalCodeComp(ExplicitComponent):
         The delegate object that handles all the running of the external code for this object.
     return_code : int
         Exit status of the child process.
+    cache_hits : int
+        Number of runs whose output files were restored from the cache.
+    cache_misses : int
+        Number of runs that weren't found in the cache, so the command was run.
     """
 
     def __init__(self, **kwargs):
@@ -270,6 +565,8 @@ class ExternalCodeComp(ExplicitComponent):
         self.stderr = "external_code_comp_error.out"
 
         self.return_code = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
 
     def _declare_options(self):
         """
@@ -293,6 +590,13 @@ class ExternalCodeComp(ExplicitComponent):
         # check for the command
         self._external_code_runner.check_config(logger)
 
+    def cleanup(self):
+        """
+        Clean up resources prior to exit.
+        """
+        super().cleanup()
+        self._external_code_runner._stop_workers()
+
     def compute(self, inputs, outputs):
         """
         Run this component.
@@ -328,6 +632,10 @@ class ExternalCodeImplicitComp(ImplicitComponent):
         The delegate object that handles all the running of the external code for this object.
     return_code : int
         Exit status of the child process.
+    cache_hits : int
+        Number of runs whose output files were restored from the cache.
+    cache_misses : int
+        Number of runs that weren't found in the cache, so the command was run.
     """
 
     def __init__(self, **kwargs):
@@ -347,6 +655,8 @@ class ExternalCodeImplicitComp(ImplicitComponent):
         self.stderr = "external_code_comp_error.out"
 
         self.return_code = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
 
     def _declare_options(self):
         """
@@ -376,6 +686,13 @@ class ExternalCodeImplicitComp(ImplicitComponent):
         """
         self._external_code_runner.check_config(logger)
 
+    def cleanup(self):
+        """
+        Clean up resources prior to exit.
+        """
+        super().cleanup()
+        self._external_code_runner._stop_workers()
+
     def apply_nonlinear(self, inputs, outputs, residuals):
         """
         Compute residuals given inputs and outputs.
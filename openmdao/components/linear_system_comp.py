@@ -16,8 +16,11 @@ class LinearSystemComp(ImplicitComponent):
 
     Attributes
     ----------
-    _lup : None or list(object)
-        matrix factorizations returned from scipy.linag.lu_factor for each A matrix
+    _lup : None or tuple
+        matrix factorization returned from scipy.linalg.lu_factor when there is a single A
+        matrix.
+    _inv : None or ndarray
+        inverses of the stacked A matrices when A is vectorized, all computed in one call.
     """
 
     def __init__(self, **kwargs):
@@ -31,6 +34,7 @@ class LinearSystemComp(ImplicitComponent):
         """
         super().__init__(**kwargs)
         self._lup = None
+        self._inv = None
 
     def initialize(self):
         """
@@ -50,7 +54,8 @@ class LinearSystemComp(ImplicitComponent):
         vec_size_A = self.vec_size_A = vec_size if self.options['vectorize_A'] else 1
         size = self.options['size']
 
-        self._lup = []
+        self._lup = None
+        self._inv = None
         shape = (vec_size, size) if vec_size > 1 else (size, )
         shape_A = (vec_size_A, size, size) if vec_size_A > 1 else (size, size)
 
@@ -123,22 +128,35 @@ class LinearSystemComp(ImplicitComponent):
         outputs : Vector
             unscaled, dimensional output variables read via outputs[key]
         """
-        vec_size = self.options['vec_size']
-        vec_size_A = self.vec_size_A
-
-        # lu factorization for use with solve_linear
-        self._lup = []
-        if vec_size > 1:
-            for j in range(vec_size_A):
-                lhs = inputs['A'][j] if vec_size_A > 1 else inputs['A']
-                self._lup.append(linalg.lu_factor(lhs))
-
-            for j in range(vec_size):
-                idx = j if vec_size_A > 1 else 0
-                outputs['x'][j] = linalg.lu_solve(self._lup[idx], inputs['b'][j])
+        # factorizations for use with solve_linear
+        if self.vec_size_A > 1:
+            # all of the stacked matrices are inverted in a single LAPACK call
+            self._inv = np.linalg.inv(inputs['A'])
+            outputs['x'] = np.einsum('ijk,ik->ij', self._inv, inputs['b'])
         else:
             self._lup = linalg.lu_factor(inputs['A'])
-            outputs['x'] = linalg.lu_solve(self._lup, inputs['b'])
+            outputs['x'] = self._lu_solve(inputs['b'], 0)
+
+    def _lu_solve(self, rhs, trans):
+        """
+        Solve the system with the factorization of a single A matrix for one or more rhs.
+
+        Parameters
+        ----------
+        rhs : ndarray
+            Right hand side, with one row per linear system if vec_size > 1.
+        trans : int
+            0 to solve Ax=b, 1 to solve A^T x=b.
+
+        Returns
+        -------
+        ndarray
+            The solution.
+        """
+        if self.options['vec_size'] > 1:
+            # solve for all right hand sides at once
+            return linalg.lu_solve(self._lup, rhs.T, trans=trans).T
+        return linalg.lu_solve(self._lup, rhs, trans=trans)
 
     def linearize(self, inputs, outputs, J):
         """
@@ -181,23 +199,14 @@ class LinearSystemComp(ImplicitComponent):
         mode : str
             either 'fwd' or 'rev'
         """
-        vec_size = self.options['vec_size']
-        vec_size_A = self.vec_size_A
-
         if mode == 'fwd':
-            if vec_size > 1:
-                for j in range(vec_size):
-                    idx = j if vec_size_A > 1 else 0
-                    d_outputs['x'][j] = linalg.lu_solve(self._lup[idx], d_residuals['x'][j],
-                                                        trans=0)
+            if self.vec_size_A > 1:
+                d_outputs['x'] = np.einsum('ijk,ik->ij', self._inv, d_residuals['x'])
             else:
-                d_outputs['x'] = linalg.lu_solve(self._lup, d_residuals['x'], trans=0)
+                d_outputs['x'] = self._lu_solve(d_residuals['x'], 0)
 
         else:  # rev
-            if vec_size > 1:
-                for j in range(vec_size):
-                    idx = j if vec_size_A > 1 else 0
-                    d_residuals['x'][j] = linalg.lu_solve(self._lup[idx], d_outputs['x'][j],
-                                                          trans=1)
+            if self.vec_size_A > 1:
+                d_residuals['x'] = np.einsum('ikj,ik->ij', self._inv, d_outputs['x'])
             else:
-                d_residuals['x'] = linalg.lu_solve(self._lup, d_outputs['x'], trans=1)
+                d_residuals['x'] = self._lu_solve(d_outputs['x'], 1)
@@ -0,0 +1,39 @@
+#!/usr/bin/env python
+#
+# usage: extcode_paraboloid_worker.py input_filename output_filename
+#
+# A persistent version of extcode_paraboloid.py, that is started once and then evaluates
+# the equation f(x,y) = (x-3)^2 + xy + (y+4)^2 - 3 each time it's asked to.
+#
+# Read the values of `x` and `y` from input file
+# and write the value of `f_xy` to output file.
+
+import sys
+
+
+def run(args):
+    input_filename = args[2]
+    output_filename = args[3]
+
+    with open(input_filename, 'r') as input_file:
+        file_contents = input_file.readlines()
+
+    x, y = [float(f) for f in file_contents]
+
+    if x == 999.0:
+        # simulate a crash of the external code
+        sys.exit(3)
+
+    if x == -999.0:
+        raise ValueError("x can't be -999")
+
+    f_xy = (x-3.0)**2 + x*y + (y+4.0)**2 - 3.0
+
+    with open(output_filename, 'w') as output_file:
+        output_file.write('%.16f\n' % f_xy)
+
+
+if __name__ == '__main__':
+    from openmdao.utils.shell_proc import serve_requests
+
+    serve_requests(run)
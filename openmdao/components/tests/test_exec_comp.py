@@ -16,6 +16,7 @@ except ImportError:
 import openmdao.api as om
 from openmdao.components.exec_comp import _expr_dict
 from openmdao.utils.assert_utils import assert_near_equal, assert_check_partials, assert_warning
+from openmdao.utils.testing_utils import use_tempdirs
 
 _ufunc_test_data = {
     'abs': {
@@ -667,6 +668,50 @@ class TestExecComp(unittest.TestCase):
 
         assert_near_equal(C1._outputs['y'], np.array([2., 1.]), 0.00001)
 
+    def test_common_subexprs(self):
+        prob = om.Problem()
+        C1 = prob.model.add_subsystem('C1', om.ExecComp(['y1=sin(x)*cos(z) + 2.0*x',
+                                                         'y2=sin(x)*cos(z) - 3.0*z',
+                                                         'y3[0]=y1[1]*sin(x)[0]',
+                                                         'y4=y1 + y2'],
+                                                        x=np.array([1., 2., 3.]),
+                                                        z=np.array([4., 5., 6.]),
+                                                        y1=np.zeros(3), y2=np.zeros(3),
+                                                        y3=np.zeros(2), y4=np.zeros(3)))
+
+        prob.setup()
+        prob.run_model()
+
+        x = np.array([1., 2., 3.])
+        z = np.array([4., 5., 6.])
+        y1 = np.sin(x) * np.cos(z) + 2.0 * x
+        y2 = np.sin(x) * np.cos(z) - 3.0 * z
+        assert_near_equal(C1._outputs['y1'], y1, 1e-10)
+        assert_near_equal(C1._outputs['y2'], y2, 1e-10)
+        assert_near_equal(C1._outputs['y3'], [y1[1] * np.sin(x[0]), 0.], 1e-10)
+        assert_near_equal(C1._outputs['y4'], y1 + y2, 1e-10)
+
+        # the shared subexpressions are computed once, in local variables
+        self.assertTrue('_cse0' in C1._func.__code__.co_varnames)
+
+        C1._linearize()
+        assert_near_equal(C1._jacobian[('y2', 'x')], np.diag(np.cos(x) * np.cos(z)), 1e-10)
+        assert_near_equal(C1._jacobian[('y2', 'z')],
+                          np.diag(-np.sin(x) * np.sin(z) - 3.0), 1e-10)
+
+    def test_common_subexpr_error(self):
+        prob = om.Problem()
+        prob.model.add_subsystem('C1', om.ExecComp(['y1=log(x) + 1.0',
+                                                    'y2=log(x) + foo(x)'], x=2.0))
+        prob.setup()
+
+        with self.assertRaises(Exception) as context:
+            prob.run_model()
+
+        self.assertEqual(str(context.exception),
+                         "'C1' <class ExecComp>: Error occurred evaluating 'y2=log(x) + foo(x)'\n"
+                         "name 'foo' is not defined")
+
     def test_simple_array_model(self):
         prob = om.Problem()
         prob.model.add_subsystem('comp', om.ExecComp(['y[0]=2.0*x[0]+7.0*x[1]',
@@ -1129,6 +1174,63 @@ class TestExecComp(unittest.TestCase):
         assert_near_equal(prob.get_val('comp.y'), [2., 4.], 0.00001)
 
 
+@use_tempdirs
+class TestExecCompColoring(unittest.TestCase):
+
+    def test_do_coloring(self):
+        n = 20
+        exprs = ['y=sin(x)*z + 3.0*x**2', 'w=z[0]*x[2]', 'v[0:3]=2.0*x[1:4]']
+        kwargs = {'y': np.zeros(n), 'w': 0.0, 'v': np.zeros(4)}
+
+        prob = om.Problem()
+        model = prob.model
+        rng = np.random.RandomState(11)
+        ivc = model.add_subsystem('ivc', om.IndepVarComp(), promotes=['*'])
+        ivc.add_output('x', rng.random_sample(n))
+        ivc.add_output('z', rng.random_sample(n))
+
+        C1 = model.add_subsystem('C1', om.ExecComp(exprs, x=np.ones(n), z=np.ones(n),
+                                                   do_coloring=True, **kwargs),
+                                 promotes_inputs=['x', 'z'])
+        model.add_subsystem('C2', om.ExecComp(exprs, x=np.ones(n), z=np.ones(n), **kwargs),
+                            promotes_inputs=['x', 'z'])
+
+        prob.setup(mode='fwd')
+        prob.run_model()
+
+        # the colored partials are the same as those complex stepped one column at a time
+        totals = prob.compute_totals(['C1.y', 'C1.w', 'C1.v', 'C2.y', 'C2.w', 'C2.v'],
+                                     ['x', 'z'])
+        for out in ('y', 'w', 'v'):
+            for inp in ('x', 'z'):
+                assert_near_equal(totals['C1.' + out, inp], totals['C2.' + out, inp], 1e-12)
+
+        # all columns of x and z can be perturbed in just 2 evaluations
+        coloring = C1._coloring_info['coloring']
+        self.assertEqual(len(list(coloring.color_iter('fwd'))), 2)
+
+        # sparsity is known for each subjac
+        rows, cols, shape = C1._subjacs_info[('C1.y', 'C1.x')]['sparsity']
+        np.testing.assert_equal(rows, np.arange(n))
+        np.testing.assert_equal(cols, np.arange(n))
+
+    def test_do_coloring_no_improvement(self):
+        prob = om.Problem()
+        C1 = prob.model.add_subsystem('C1', om.ExecComp('y=sum(x)*x', x=np.ones(5), y=np.ones(5),
+                                                        do_coloring=True))
+        prob.setup(force_alloc_complex=True)
+        prob.run_model()
+
+        msg = ("'C1' <class ExecComp>: Coloring was deactivated.  Improvement of 0.0% was less "
+               "than min allowed (5.0%).")
+        with assert_warning(UserWarning, msg):
+            totals = prob.compute_totals('C1.y', 'C1.x')
+        assert_near_equal(totals['C1.y', 'C1.x'], 5.0 * np.eye(5) + 1.0, 1e-12)
+
+        # jacobian is dense, so coloring isn't used
+        self.assertIsNone(C1._coloring_info['coloring'])
+
+
 class TestExecCompParameterized(unittest.TestCase):
 
     @parameterized.expand(itertools.product([
@@ -511,6 +511,282 @@ class TestExternalCodeCompFeature(unittest.TestCase):
         assert_near_equal(prob.get_val('p.y'), -7.3333333, 1e-6)
 
 
+@unittest.skipIf(sys.platform == 'win32', "Concurrent FD points aren't supported on Windows.")
+class TestExternalCodeCompConcurrentFD(unittest.TestCase):
+
+    def setUp(self):
+        self.startdir = os.getcwd()
+        self.tempdir = tempfile.mkdtemp(prefix='test_extcode-')
+        os.chdir(self.tempdir)
+        shutil.copy(os.path.join(DIRECTORY, 'extcode_paraboloid.py'),
+                    os.path.join(self.tempdir, 'extcode_paraboloid.py'))
+
+    def tearDown(self):
+        os.chdir(self.startdir)
+        try:
+            shutil.rmtree(self.tempdir)
+        except OSError:
+            pass
+
+    def _run_partials(self, form='forward', **options):
+        prob = om.Problem()
+        comp = prob.model.add_subsystem('p', ParaboloidExternalCodeCompFD(**options))
+        comp.options['fd_scratch_files'] = ['extcode_paraboloid.py']
+
+        prob.setup()
+        comp.declare_partials(of='*', wrt='*', method='fd', form=form)
+
+        prob.set_val('p.x', 3.0)
+        prob.set_val('p.y', -4.0)
+        prob.run_model()
+
+        totals = prob.compute_totals(of=['p.f_xy'], wrt=['p.x', 'p.y'], return_format='array')
+
+        with open('paraboloid_input.dat', 'r') as f:
+            inp = [float(line) for line in f]
+
+        return totals, inp
+
+    def test_concurrent(self):
+        expected, _ = self._run_partials()
+
+        for form in ('forward', 'central'):
+            totals, inp = self._run_partials(form=form, fd_num_workers=4)
+            assert_near_equal(totals, expected, 1e-5)
+
+            # the points were run in their own directories, so the files written by the
+            # run of the unperturbed point are still there
+            self.assertEqual(inp, [3.0, -4.0])
+
+        self.assertEqual(sorted(os.listdir('.')), ['extcode_paraboloid.py',
+                                                   'external_code_comp_error.out',
+                                                   'paraboloid_input.dat',
+                                                   'paraboloid_output.dat'])
+
+    def test_scratch_dir(self):
+        totals, _ = self._run_partials(fd_num_workers=2, fd_scratch_dir='scratch')
+        assert_near_equal(totals, [[-4.0, 3.0]], 1e-5)
+
+        # the directories of the points are removed once they've been run
+        self.assertEqual(os.listdir('scratch'), [])
+
+    def test_error(self):
+        prob = om.Problem()
+        comp = prob.model.add_subsystem('p', ParaboloidExternalCodeCompFD(fd_num_workers=2))
+        prob.setup()
+        prob.run_model()
+
+        # the script isn't copied into the scratch directories, so the points fail
+        with self.assertRaises(RuntimeError) as cm:
+            prob.compute_totals(of=['p.f_xy'], wrt=['p.x', 'p.y'])
+
+        self.assertRegex(str(cm.exception), r"can't open file '.*extcode_paraboloid\.py'")
+
+
+class TestExternalCodeCompCache(unittest.TestCase):
+
+    def setUp(self):
+        self.startdir = os.getcwd()
+        self.tempdir = tempfile.mkdtemp(prefix='test_extcode-')
+        os.chdir(self.tempdir)
+        shutil.copy(os.path.join(DIRECTORY, 'extcode_paraboloid.py'),
+                    os.path.join(self.tempdir, 'extcode_paraboloid.py'))
+
+    def tearDown(self):
+        os.chdir(self.startdir)
+        try:
+            shutil.rmtree(self.tempdir)
+        except OSError:
+            pass
+
+    def _run(self, prob, x, y):
+        prob.set_val('p.x', x)
+        prob.set_val('p.y', y)
+        prob.run_model()
+        return prob.get_val('p.f_xy')
+
+    def test_cache(self):
+        prob = om.Problem()
+        comp = prob.model.add_subsystem('p', ParaboloidExternalCodeComp(cache_dir='cache'))
+        prob.setup()
+
+        assert_near_equal(self._run(prob, 3.0, -4.0), -15.0)
+        assert_near_equal(self._run(prob, 1.0, 2.0), 39.0)
+        self.assertEqual((comp.cache_hits, comp.cache_misses), (0, 2))
+        self.assertEqual(len(os.listdir('cache')), 2)
+
+        # cached runs don't run the command
+        os.remove('extcode_paraboloid.py')
+
+        assert_near_equal(self._run(prob, 3.0, -4.0), -15.0)
+        assert_near_equal(self._run(prob, 1.0, 2.0), 39.0)
+        self.assertEqual((comp.cache_hits, comp.cache_misses), (2, 2))
+        self.assertEqual(comp.return_code, 0)
+
+        # the cache is shared by components that use the same directory
+        prob = om.Problem()
+        comp = prob.model.add_subsystem('p', ParaboloidExternalCodeComp(cache_dir='cache'))
+        prob.setup()
+
+        assert_near_equal(self._run(prob, 3.0, -4.0), -15.0)
+        self.assertEqual((comp.cache_hits, comp.cache_misses), (1, 0))
+
+        with self.assertRaises(RuntimeError) as cm:
+            self._run(prob, 3.0, -3.0)
+
+        self.assertRegex(str(cm.exception), r"can't open file '.*extcode_paraboloid\.py'")
+        self.assertEqual((comp.cache_hits, comp.cache_misses), (1, 1))
+
+        # failed runs aren't cached
+        self.assertEqual(len(os.listdir('cache')), 2)
+
+    def test_eviction(self):
+        prob = om.Problem()
+        comp = prob.model.add_subsystem('p', ParaboloidExternalCodeComp(cache_dir='cache'))
+        prob.setup()
+
+        self._run(prob, 1.0, 1.0)
+        entry = os.path.join('cache', os.listdir('cache')[0])
+        size = sum(os.path.getsize(os.path.join(entry, f)) for f in os.listdir(entry))
+
+        # room for the two most recently used runs
+        comp.options['cache_max_size'] = 2 * size
+        self._run(prob, 2.0, 2.0)
+        self._run(prob, 1.0, 1.0)
+        self._run(prob, 3.0, 3.0)
+        self.assertEqual((comp.cache_hits, comp.cache_misses), (1, 3))
+        self.assertEqual(len(os.listdir('cache')), 2)
+
+        self._run(prob, 1.0, 1.0)
+        self._run(prob, 3.0, 3.0)
+        self._run(prob, 2.0, 2.0)
+        self.assertEqual((comp.cache_hits, comp.cache_misses), (3, 4))
+
+    @unittest.skipIf(sys.platform == 'win32', "Concurrent FD points aren't supported on Windows.")
+    def test_concurrent_fd(self):
+        prob = om.Problem()
+        comp = prob.model.add_subsystem('p', ParaboloidExternalCodeCompFD(cache_dir='cache',
+                                                                          fd_num_workers=2))
+        comp.options['fd_scratch_files'] = ['extcode_paraboloid.py']
+        prob.setup()
+
+        self._run(prob, 3.0, -4.0)
+        expected = prob.compute_totals(of=['p.f_xy'], wrt=['p.x', 'p.y'], return_format='array')
+        self.assertEqual((comp.cache_hits, comp.cache_misses), (0, 3))
+
+        # the runs done by the workers are cached too
+        totals = prob.compute_totals(of=['p.f_xy'], wrt=['p.x', 'p.y'], return_format='array')
+        self.assertEqual((comp.cache_hits, comp.cache_misses), (2, 3))
+        assert_near_equal(totals, expected, 1e-15)
+
+
+class ParaboloidExternalCodeCompWorker(ParaboloidExternalCodeComp):
+    def setup(self):
+        super().setup()
+
+        self.options['command'] = [
+            sys.executable, 'extcode_paraboloid_worker.py', self.input_file, self.output_file
+        ]
+        self.options['persistent'] = True
+
+
+class TestExternalCodeCompPersistent(unittest.TestCase):
+
+    def setUp(self):
+        self.startdir = os.getcwd()
+        self.tempdir = tempfile.mkdtemp(prefix='test_extcode-')
+        os.chdir(self.tempdir)
+        shutil.copy(os.path.join(DIRECTORY, 'extcode_paraboloid_worker.py'),
+                    os.path.join(self.tempdir, 'extcode_paraboloid_worker.py'))
+
+        self.prob = prob = om.Problem()
+        self.comp = prob.model.add_subsystem('p', ParaboloidExternalCodeCompWorker())
+        prob.setup()
+
+    def tearDown(self):
+        self.prob.cleanup()
+        os.chdir(self.startdir)
+        try:
+            shutil.rmtree(self.tempdir)
+        except OSError:
+            pass
+
+    def _run(self, x, y):
+        self.prob.set_val('p.x', x)
+        self.prob.set_val('p.y', y)
+        self.prob.run_model()
+        return self.prob.get_val('p.f_xy')
+
+    def _get_worker(self):
+        workers = list(self.comp._external_code_runner._workers.values())
+        self.assertEqual(len(workers), 1)
+        return workers[0]
+
+    def test_persistent(self):
+        assert_near_equal(self._run(3.0, -4.0), -15.0)
+        worker = self._get_worker()
+
+        for i in range(5):
+            assert_near_equal(self._run(float(i), 2.0), (i - 3.0)**2 + 2.0 * i + 33.0)
+
+        # all of the runs were done by the same process
+        self.assertIs(self._get_worker(), worker)
+        self.assertIsNone(worker.poll())
+
+        self.prob.cleanup()
+        self.assertEqual(worker.returncode, 0)
+        self.assertEqual(self.comp._external_code_runner._workers, {})
+
+    def test_errors(self):
+        self._run(3.0, -4.0)
+        worker = self._get_worker()
+
+        with self.assertRaises(RuntimeError) as cm:
+            self._run(-999.0, 0.0)
+
+        self.assertIn("ValueError: x can't be -999", str(cm.exception))
+        self.assertEqual(self.comp.return_code, 1)
+
+        # the worker keeps running after a failed run
+        self.assertIs(self._get_worker(), worker)
+        assert_near_equal(self._run(3.0, -4.0), -15.0)
+
+        with self.assertRaises(RuntimeError) as cm:
+            self._run(999.0, 0.0)
+
+        self.assertEqual(self.comp.return_code, 3)
+
+        # a new worker is started if the old one exited
+        assert_near_equal(self._run(3.0, -4.0), -15.0)
+        self.assertIsNot(self._get_worker(), worker)
+
+    def test_timeout(self):
+        self.comp.options['timeout'] = 0.5
+        self.comp.options['command'] = [
+            sys.executable, '-c', 'import time; time.sleep(10)'
+        ]
+
+        with self.assertRaises(om.AnalysisError) as cm:
+            self.prob.run_model()
+
+        self.assertTrue(str(cm.exception).endswith("Timed out after 0.5 sec."))
+
+    def test_clone(self):
+        self._run(3.0, -4.0)
+
+        # the copy starts its own worker
+        clone = self.prob.clone()
+        clone.set_val('p.x', 1.0)
+        clone.set_val('p.y', 2.0)
+        clone.run_model()
+        assert_near_equal(clone.get_val('p.f_xy'), 39.0)
+
+        clone_workers = list(clone.model.p._external_code_runner._workers.values())
+        self.assertEqual(len(clone_workers), 1)
+        self.assertNotEqual(clone_workers[0].pid, self._get_worker().pid)
+        clone.cleanup()
+
+
 class TestExternalCodeImplicitCompFeature(unittest.TestCase):
 
     def setUp(self):
@@ -307,6 +307,52 @@ class TestLinearSystemComp(unittest.TestCase):
         self.assertTrue(len(abs_errors) > 0)
         self.assertTrue(abs_errors[0] < 1.e-6)
 
+    def test_many_systems(self):
+        """Check the batched solves against numpy for many systems."""
+        size = 4
+        vec_size = 200
+
+        np.random.seed(11)
+        x = np.random.random((vec_size, size))
+
+        for vectorize_A in (False, True):
+            with self.subTest(vectorize_A=vectorize_A):
+                if vectorize_A:
+                    A = np.random.random((vec_size, size, size)) + 4 * np.eye(size)
+                    b = np.einsum('ijk,ik->ij', A, x)
+                    A_stack = A
+                else:
+                    A = np.random.random((size, size)) + 4 * np.eye(size)
+                    b = np.einsum('jk,ik->ij', A, x)
+                    A_stack = np.repeat(A[np.newaxis], vec_size, axis=0)
+
+                prob = om.Problem()
+                prob.model.add_subsystem('lin', om.LinearSystemComp(size=size, vec_size=vec_size,
+                                                                    vectorize_A=vectorize_A))
+                prob.setup()
+
+                prob.set_val('lin.A', A)
+                prob.set_val('lin.b', b)
+                prob.run_model()
+
+                assert_near_equal(prob.get_val('lin.x'), x, 1e-10)
+
+                lin = prob.model.lin
+                prob.model.run_linearize()
+                d_inputs, d_outputs, d_residuals = lin.get_linear_vectors()
+
+                rhs = np.random.random((vec_size, size))
+                d_residuals['x'] = rhs
+                lin.run_solve_linear(['linear'], 'fwd')
+                assert_near_equal(d_outputs['x'],
+                                  np.linalg.solve(A_stack, rhs[..., np.newaxis])[..., 0], 1e-10)
+
+                d_outputs['x'] = rhs
+                lin.run_solve_linear(['linear'], 'rev')
+                assert_near_equal(d_residuals['x'],
+                                  np.linalg.solve(A_stack.transpose(0, 2, 1),
+                                                  rhs[..., np.newaxis])[..., 0], 1e-10)
+
     def test_feature_basic(self):
         import numpy as np
 
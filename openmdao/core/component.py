@@ -389,7 +389,8 @@ class Component(System):
         The sparsity of the partial derivatives in this component will be used when computing
         the sparsity of the total jacobian for the entire model.  Without this, all of this
         component's partials would be treated as dense, resulting in an overly conservative
-        coloring of the total jacobian.
+        coloring of the total jacobian.  Approximated partials that are colored are also
+        converted to a sparse format, since only their nonzeros are ever computed.
 
         Parameters
         ----------
@@ -405,7 +406,17 @@ class Component(System):
                 abs_key = (of_abs, wrt_abs)
                 if abs_key in self._subjacs_info:
                     # add sparsity info to existing partial info
-                    self._subjacs_info[abs_key]['sparsity'] = tup
+                    meta = self._subjacs_info[abs_key]
+                    meta['sparsity'] = tup
+
+                    # store colored approx partials using only their nonzeros, so the
+                    # approximation can be scattered directly into them
+                    if meta.get('coloring') and meta['rows'] is None and \
+                            isinstance(meta['value'], ndarray):
+                        rows, cols, _ = tup
+                        meta['rows'] = np.asarray(rows, dtype=INT_DTYPE)
+                        meta['cols'] = np.asarray(cols, dtype=INT_DTYPE)
+                        meta['value'] = meta['value'][meta['rows'], meta['cols']]
 
     def add_input(self, name, val=1.0, shape=None, src_indices=None, flat_src_indices=None,
                   units=None, desc='', tags=None, shape_by_conn=False, copy_shape=None):
@@ -94,6 +94,9 @@ class Driver(object):
         Dict of sparse subjacobians for use with certain optimizers, e.g. pyOptSparseDriver.
     _total_jac : _TotalJacInfo or None
         Cached total jacobian handling object.
+    _voi_plans : dict
+        Cached _VOIPlan, or None if the variables can't be packed, for each group of variables
+        of interest.
     """
 
     def __init__(self, **kwargs):
@@ -113,6 +116,7 @@ class Driver(object):
         self._cons = None
         self._objs = None
         self._responses = None
+        self._voi_plans = {}
 
         # Driver options
         self.options = OptionsDictionary(parent_name=type(self).__name__)
@@ -261,6 +265,7 @@ class Driver(object):
         model = problem.model
 
         self._total_jac = None
+        self._voi_plans = {}
 
         self._has_scaling = (
             np.any([r['total_scaler'] is not None for r in self._responses.values()]) or
@@ -590,6 +595,41 @@ class Driver(object):
 
         return val
 
+    def _get_voi_plan(self, key, vois, remote_vois):
+        """
+        Return the plan for packing the given variables of interest into a flat array.
+
+        Parameters
+        ----------
+        key : hashable
+            Key identifying this group of variables of interest.
+        vois : dict
+            Metadata for the variables of interest, keyed by name.
+        remote_vois : dict
+            Dict containing (owning_rank, size) for all remote vois of a particular
+            type (design var, constraint, or objective).
+
+        Returns
+        -------
+        _VOIPlan or None
+            The plan, or None if any of the variables is remote, distributed, or discrete.
+        """
+        try:
+            return self._voi_plans[key]
+        except KeyError:
+            pass
+
+        plan = None
+        if vois:
+            model = self._problem().model
+            plan = _VOIPlan(vois, model._outputs.get_slice_dict(),
+                            set(remote_vois).union(self._dist_driver_vars))
+            if plan.idxs is None:
+                plan = None
+
+        self._voi_plans[key] = plan
+        return plan
+
     def get_design_var_values(self):
         """
         Return the design variable values.
@@ -599,9 +639,32 @@ class Driver(object):
         dict
            Dictionary containing values of each design variable.
         """
+        plan = self._get_voi_plan('design_var', self._designvars, self._remote_dvs)
+        if plan is not None:
+            return plan.get(self._problem().model._outputs._data, self._has_scaling)
+
         return {n: self._get_voi_val(n, dv, self._remote_dvs)
                 for n, dv in self._designvars.items()}
 
+    def _set_design_var_array(self, x):
+        """
+        Set the values of all design variables from a flat array.
+
+        Parameters
+        ----------
+        x : ndarray
+            Values of the design variables, concatenated in the order of self._designvars.
+        """
+        plan = self._get_voi_plan('design_var', self._designvars, self._remote_dvs)
+        if plan is not None and plan.settable:
+            plan.set(self._problem().model._outputs._data, x, self._has_scaling)
+        else:
+            i = 0
+            for name, meta in self._designvars.items():
+                size = meta['size']
+                self.set_design_var(name, x[i:i + size])
+                i += size
+
     def set_design_var(self, name, value):
         """
         Set the value of a design variable.
@@ -679,6 +742,11 @@ class Driver(object):
         dict
            Dictionary containing values of each objective.
         """
+        plan = self._get_voi_plan('objective', self._objs, self._remote_objs)
+        if plan is not None:
+            return plan.get(self._problem().model._outputs._data,
+                            self._has_scaling and driver_scaling)
+
         return {n: self._get_voi_val(n, obj, self._remote_objs,
                                      driver_scaling=driver_scaling)
                 for n, obj in self._objs.items()}
@@ -705,24 +773,32 @@ class Driver(object):
         dict
            Dictionary containing values of each constraint.
         """
-        con_dict = {}
-        for name, meta in self._cons.items():
-            if lintype == 'linear' and not meta['linear']:
-                continue
+        key = ('constraint', ctype, lintype)
+        plan = self._voi_plans.get(key)
+        if plan is None:
+            cons = OrderedDict()
+            for name, meta in self._cons.items():
+                if lintype == 'linear' and not meta['linear']:
+                    continue
+
+                if lintype == 'nonlinear' and meta['linear']:
+                    continue
 
-            if lintype == 'nonlinear' and meta['linear']:
-                continue
+                if ctype == 'eq' and meta['equals'] is None:
+                    continue
 
-            if ctype == 'eq' and meta['equals'] is None:
-                continue
+                if ctype == 'ineq' and meta['equals'] is not None:
+                    continue
 
-            if ctype == 'ineq' and meta['equals'] is not None:
-                continue
+                cons[name] = meta
 
-            con_dict[name] = self._get_voi_val(name, meta, self._remote_cons,
-                                               driver_scaling=driver_scaling)
+            plan = self._get_voi_plan(key, cons, self._remote_cons)
+            if plan is None:
+                return {name: self._get_voi_val(name, meta, self._remote_cons,
+                                                driver_scaling=driver_scaling)
+                        for name, meta in cons.items()}
 
-        return con_dict
+        return plan.get(self._problem().model._outputs._data, self._has_scaling and driver_scaling)
 
     def _get_ordered_nl_responses(self):
         """
@@ -1160,6 +1236,137 @@ class RecordingDebugging(Recording):
         super().__exit__()
 
 
+class _VOIPlan(object):
+    """
+    Plan for packing a group of variables of interest to and from the flat output vector.
+
+    The values of all of the variables are gathered with a single index array, and scaled with
+    concatenated adder and scaler arrays.
+
+    Attributes
+    ----------
+    names : list of str
+        Names of the variables of interest.
+    bounds : list of (int, int)
+        Start and end of each variable in the packed array.
+    idxs : ndarray or None
+        Index of each entry of the packed array in the flat output vector, or None if any of
+        the variables can't be packed.
+    adder : ndarray or None
+        Concatenated total adders, or None if no variable has scaling.
+    scaler : ndarray or None
+        Concatenated total scalers, or None if no variable has scaling.
+    inv_scaler : ndarray or None
+        Reciprocal of scaler.
+    settable : bool
+        True if no entry of the flat output vector appears more than once in idxs.
+    """
+
+    def __init__(self, vois, slices, unpackable):
+        """
+        Initialize attributes.
+
+        Parameters
+        ----------
+        vois : dict
+            Metadata for the variables of interest, keyed by name.
+        slices : dict
+            Slice of each variable in the flat output vector, keyed by absolute name.
+        unpackable : set
+            Absolute names of variables that are remote or distributed.
+        """
+        self.names = []
+        self.bounds = []
+        self.idxs = None
+        self.adder = self.scaler = self.inv_scaler = None
+        self.settable = False
+
+        idxs = []
+        adders = []
+        scalers = []
+        has_scaling = False
+        start = 0
+        for name, meta in vois.items():
+            src = meta['ivc_source'] if meta.get('ivc_source') is not None else name
+
+            # discrete variables aren't in the flat output vector
+            if src in unpackable or src not in slices:
+                return
+
+            slc = slices[src]
+            idx = np.arange(slc.start, slc.stop, dtype=INT_DTYPE)
+            indices = meta['indices']
+            if indices is not None:
+                # only flat integer indices can be packed
+                if not isinstance(indices, (list, np.ndarray)):
+                    return
+                indices = np.asarray(indices)
+                if indices.ndim != 1 or not np.issubdtype(indices.dtype, np.integer):
+                    return
+                idx = idx[indices]
+
+            end = start + idx.size
+            self.names.append(name)
+            self.bounds.append((start, end))
+            idxs.append(idx)
+            start = end
+
+            adder = meta['total_adder']
+            scaler = meta['total_scaler']
+            has_scaling |= adder is not None or scaler is not None
+            adders.append(np.broadcast_to(0. if adder is None else adder, idx.shape))
+            scalers.append(np.broadcast_to(1. if scaler is None else scaler, idx.shape))
+
+        self.idxs = np.concatenate(idxs) if idxs else np.zeros(0, dtype=INT_DTYPE)
+        self.settable = np.unique(self.idxs).size == self.idxs.size
+
+        if has_scaling:
+            self.adder = np.concatenate(adders)
+            self.scaler = np.concatenate(scalers)
+            self.inv_scaler = 1.0 / self.scaler
+
+    def get(self, data, scaling):
+        """
+        Return the values of the variables.
+
+        Parameters
+        ----------
+        data : ndarray
+            The flat output vector.
+        scaling : bool
+            If True, apply driver scaling.
+
+        Returns
+        -------
+        dict
+            Value of each variable, as views into a single packed array.
+        """
+        val = data[self.idxs]
+        if scaling and self.scaler is not None:
+            val += self.adder
+            val *= self.scaler
+
+        return {name: val[start:end] for name, (start, end) in zip(self.names, self.bounds)}
+
+    def set(self, data, x, scaling):
+        """
+        Set the values of the variables.
+
+        Parameters
+        ----------
+        data : ndarray
+            The flat output vector.
+        x : ndarray
+            Packed values of the variables.
+        scaling : bool
+            If True, undo driver scaling.
+        """
+        if scaling and self.scaler is not None:
+            x = x * self.inv_scaler
+            x -= self.adder
+        data[self.idxs] = x
+
+
 def record_iteration(requester, prob, case_name):
     """
     Record an iteration of the current Problem or Driver.
@@ -1177,6 +1384,28 @@ def record_iteration(requester, prob, case_name):
     if not rec_mgr._recorders:
         return
 
+    data = _get_iteration_data(requester, prob)
+    rec_mgr.record_iteration(requester, data, requester._get_recorder_metadata(case_name))
+
+
+def _get_iteration_data(requester, prob):
+    """
+    Return the data to be recorded for the current iteration of the Problem or Driver.
+
+    Parameters
+    ----------
+    requester : Problem or Driver
+        The recording requester.
+    prob : Problem
+        The Problem.
+
+    Returns
+    -------
+    dict
+        The data to be recorded.
+    """
+    rec_mgr = requester._rec_mgr
+
     # Get the data to record (collective calls that get across all ranks)
     model = prob.model
     parallel = rec_mgr._check_parallel() if model.comm.size > 1 else False
@@ -1214,4 +1443,4 @@ def record_iteration(requester, prob, case_name):
             norm0 = solver._norm0 if solver._norm0 != 0.0 else 1.0  # runonce never sets _norm0
             data['rel'] = norm / norm0
 
-    rec_mgr.record_iteration(requester, data, requester._get_recorder_metadata(case_name))
+    return data
@@ -20,6 +20,8 @@ from openmdao.jacobians.jacobian import SUBJAC_META_DEFAULTS
 from openmdao.recorders.recording_iteration_stack import Recording
 from openmdao.solvers.nonlinear.nonlinear_runonce import NonlinearRunOnce
 from openmdao.solvers.linear.linear_runonce import LinearRunOnce
+from openmdao.solvers.nonlinear.newton import NewtonSolver
+from openmdao.solvers.linear.direct import DirectSolver
 from openmdao.utils.array_utils import array_connection_compatible, _flatten_src_indices, \
     shape_to_len
 from openmdao.utils.general_utils import ContainsAll, simple_warning, common_subpath, \
@@ -28,6 +30,7 @@ from openmdao.utils.units import is_compatible, unit_conversion, _has_val_mismat
     _is_unitless
 from openmdao.utils.mpi import MPI, check_mpi_exceptions
 import openmdao.utils.coloring as coloring_mod
+from openmdao.utils.graph_utils import get_min_feedback_order, get_feedback_weight
 from openmdao.utils.array_utils import evenly_distrib_idxs
 from openmdao.core.constants import _SetupStatus
 
@@ -51,6 +54,31 @@ class _SysInfo(object):
         yield self.index
 
 
+def _apply_nonlinear(subsys):
+    """
+    Compute the residuals of a subsystem.
+
+    Parameters
+    ----------
+    subsys : System
+        The subsystem.
+    """
+    subsys._apply_nonlinear()
+
+
+def _linearize_solver(subsys):
+    """
+    Linearize the linear solver of a subsystem, if it has one.
+
+    Parameters
+    ----------
+    subsys : System
+        The subsystem.
+    """
+    if subsys._linear_solver is not None:
+        subsys._linear_solver._linearize()
+
+
 class Group(System):
     """
     Class used to group systems together; instantiate or inherit.
@@ -99,6 +127,9 @@ class Group(System):
         Flag indicating whether connection errors are raised as an Exception.
     _order_set : bool
         Flag to check if set_order has been called.
+    _auto_order_info : tuple or None
+        If the auto_order option is set, the previous order of the subsystems, its number of
+        feedback connections, the new order and its number of feedback connections.
     _auto_ivc_warnings : list
         List of Auto IVC warnings to be raised later with simple_warnings.
     _shapes_graph : nx.OrderedGraph
@@ -138,6 +169,7 @@ class Group(System):
         self._contains_parallel_group = False
         self._raise_connection_errors = True
         self._order_set = False
+        self._auto_order_info = None
         self._shapes_graph = None
         self._shape_knowns = None
 
@@ -149,6 +181,35 @@ class Group(System):
         if not self._linear_solver:
             self._linear_solver = LinearRunOnce()
 
+    def _declare_options(self):
+        """
+        Declare options before kwargs are processed in the init method.
+        """
+        super()._declare_options()
+
+        self.options.declare('auto_order', types=bool, default=False,
+                             desc='If True, reorder the subsystems at setup so that the strongly '
+                                  'connected ones run in topological order and each cycle has '
+                                  'as few feedback connections as possible.')
+        self.options.declare('partition_cycles', types=bool, default=False,
+                             desc='If True, move the subsystems of each cycle into a new group '
+                                  'at setup, so that each cycle is converged by its own solvers '
+                                  'and the subsystems outside of the cycles only run once. All '
+                                  'variables of the new groups are promoted, so promoted names '
+                                  "don't change, but absolute names do. If any cycles are found, "
+                                  'the model hierarchy is built a second time, so the setup and '
+                                  'configure methods of every system in the model are called '
+                                  'twice.')
+        self.options.declare('cycle_nonlinear_solver', default=None, allow_none=True,
+                             recordable=False,
+                             desc='Function that returns the nonlinear solver of each group made '
+                                  'by partition_cycles. If None, a NewtonSolver with '
+                                  'solve_subsystems=False is used.')
+        self.options.declare('cycle_linear_solver', default=None, allow_none=True,
+                             recordable=False,
+                             desc='Function that returns the linear solver of each group made by '
+                                  'partition_cycles. If None, a DirectSolver is used.')
+
     def setup(self):
         """
         Build this group.
@@ -430,6 +491,11 @@ class Group(System):
         # Call setup function for this group.
         self.setup()
 
+        # the layout is only used once, when the hierarchy is built again
+        layout = prob_meta['cycle_partitions'].pop(self.pathname, None)
+        if layout is not None:
+            self._setup_cycle_groups(layout)
+
         # need to save these because _setup_var_data can be called multiple times
         # during the config process and we don't want to wipe out any group_inputs
         # that were added during self.setup()
@@ -2307,11 +2373,231 @@ class Group(System):
         """
         self._transfer('nonlinear', 'fwd')
         # Apply recursion
-        for subsys in self._subsystems_myproc:
-            subsys._apply_nonlinear()
+        self._run_subsystems(_apply_nonlinear)
 
         self.iter_count_apply += 1
 
+    def _run_subsystems(self, func):
+        """
+        Call a function on each local subsystem.
+
+        Parameters
+        ----------
+        func : function
+            The function, which takes the subsystem as its only argument.
+        """
+        for subsys in self._subsystems_myproc:
+            func(subsys)
+
+    def _runs_subsystems_concurrently(self):
+        """
+        Return True if the local subsystems are run concurrently by _run_subsystems.
+
+        Returns
+        -------
+        bool
+            True if the local subsystems are run concurrently.
+        """
+        return False
+
+    def _setup_cycle_partitions(self):
+        """
+        Find the cycles to move into new groups in this group and its descendants.
+
+        Each group with partition_cycles set that contains cycles gets a layout of its
+        subsystems, keyed by the pathname the group will have when the model hierarchy is built
+        again.  The layout lists the
+        subsystems in topological order, with the subsystems of each cycle in a nested list, in
+        the order with the fewest feedback connections.
+
+        Returns
+        -------
+        bool
+            True if any cycles have to be moved into new groups.
+        """
+        found = False
+        for subsys in self._subgroups_myproc:
+            if subsys._setup_cycle_partitions():
+                found = True
+
+        partitions = self._problem_meta['cycle_partitions']
+
+        if self.options['partition_cycles']:
+            if len(self._subsystems_myproc) != len(self._subsystems_allprocs):
+                raise RuntimeError(f"{self.msginfo}: partition_cycles can't be used on a group "
+                                   "whose subsystems are spread over more than one process.")
+
+            graph = self.compute_sys_graph()
+
+            def weight(src, tgt):
+                # number of variables connected from src to tgt
+                return len(graph.edges[src, tgt]['conns'])
+
+            cycles = {}
+            for scc in nx.strongly_connected_components(graph):
+                if len(scc) > 1:
+                    for name in scc:
+                        cycles[name] = scc
+
+            if cycles:
+                # the subsystems of each cycle are next to each other in this order
+                layout = []
+                for name in get_min_feedback_order(graph, list(self._subsystems_allprocs),
+                                                   weight):
+                    if name not in cycles:
+                        layout.append(name)
+                    elif layout and isinstance(layout[-1], list) and \
+                            layout[-1][0] in cycles[name]:
+                        layout[-1].append(name)
+                    else:
+                        layout.append([name])
+
+                # the layouts of groups below a subsystem that is moved into a new group are
+                # keyed by the pathnames they'll have once it has been moved
+                prefix = self.pathname + '.' if self.pathname else ''
+                count = 0
+                for item in layout:
+                    if isinstance(item, list):
+                        for name in item:
+                            old = prefix + name
+                            new = '%s_cycle%d.%s' % (prefix, count, name)
+                            for path in [p for p in partitions
+                                         if p == old or p.startswith(old + '.')]:
+                                partitions[new + path[len(old):]] = partitions.pop(path)
+                        count += 1
+
+                partitions[self.pathname] = layout
+                found = True
+
+        return found
+
+    def _setup_cycle_groups(self, layout):
+        """
+        Move the subsystems of each cycle into a new group with its own solvers.
+
+        Parameters
+        ----------
+        layout : list
+            Names of the subsystems in their new order, with the names of the subsystems of
+            each cycle in a nested list.
+        """
+        nonlinear_solver = self.options['cycle_nonlinear_solver']
+        linear_solver = self.options['cycle_linear_solver']
+
+        old_subsystems = self._subsystems_allprocs
+        self._subsystems_allprocs = subsystems = OrderedDict()
+
+        count = 0
+        for item in layout:
+            if isinstance(item, list):
+                group = Group()
+                for name in item:
+                    min_procs, max_procs, proc_weight = self._proc_info[name]
+                    group.add_subsystem(name, old_subsystems[name].system, min_procs=min_procs,
+                                        max_procs=max_procs, proc_weight=proc_weight)
+
+                if nonlinear_solver is None:
+                    group.nonlinear_solver = NewtonSolver(solve_subsystems=False)
+                else:
+                    group.nonlinear_solver = nonlinear_solver()
+
+                if linear_solver is None:
+                    group.linear_solver = DirectSolver()
+                else:
+                    group.linear_solver = linear_solver()
+
+                # names that start with an underscore can't clash with the names of subsystems
+                # added by the user
+                group.name = '_cycle%d' % count
+                group._var_promotes['any'] = ['*']
+                count += 1
+
+                self._proc_info[group.name] = (1, None, 1.0)
+                subsystems[group.name] = _SysInfo(group, len(subsystems))
+            else:
+                sinfo = old_subsystems[item]
+                sinfo.index = len(subsystems)
+                subsystems[item] = sinfo
+
+    def _setup_auto_order(self):
+        """
+        Reorder the subsystems of this group and its descendants that have auto_order set.
+
+        The variable data of each group whose subsystems, or whose descendants' subsystems, were
+        reordered is computed again.
+
+        Returns
+        -------
+        bool
+            True if the order of any subsystems changed.
+        """
+        changed = False
+        for subsys in self._subgroups_myproc:
+            if subsys._setup_auto_order():
+                changed = True
+
+        self._auto_order_info = None
+
+        if self.options['auto_order']:
+            if len(self._subsystems_myproc) != len(self._subsystems_allprocs):
+                raise RuntimeError(f"{self.msginfo}: auto_order can't be used on a group whose "
+                                   "subsystems are spread over more than one process.")
+
+            graph = self.compute_sys_graph()
+
+            def weight(src, tgt):
+                # number of variables connected from src to tgt
+                return len(graph.edges[src, tgt]['conns'])
+
+            old_order = list(self._subsystems_allprocs)
+            new_order = get_min_feedback_order(graph, old_order, weight)
+
+            self._auto_order_info = (old_order, get_feedback_weight(graph, old_order, weight),
+                                     new_order, get_feedback_weight(graph, new_order, weight))
+
+            if new_order != old_order:
+                old_subsystems = self._subsystems_allprocs
+                self._subsystems_allprocs = subsystems = OrderedDict()
+                for i, name in enumerate(new_order):
+                    sinfo = old_subsystems[name]
+                    sinfo.index = i
+                    subsystems[name] = sinfo
+
+                self._subsystems_myproc = [s for s, _ in subsystems.values()]
+                self._subgroups_myproc = [s for s in self._subsystems_myproc
+                                          if isinstance(s, Group)]
+                changed = True
+
+        if changed:
+            # the variables are ordered by subsystem
+            self._setup_var_data()
+
+        return changed
+
+    def _check_concurrent_recording(self, runner, how):
+        """
+        Raise an error if a system below this group, or one of their solvers, records cases.
+
+        Parameters
+        ----------
+        runner : Group or Solver
+            The object that runs the subsystems concurrently.
+        how : str
+            How the subsystems are run, for the error message.
+        """
+        for subsys in self.system_iter(recurse=True):
+            recorders = [subsys]
+            for solver in (subsys._nonlinear_solver, subsys._linear_solver):
+                if solver is not None:
+                    recorders.append(solver)
+                    if getattr(solver, 'linesearch', None) is not None:
+                        recorders.append(solver.linesearch)
+
+            for obj in recorders:
+                if obj._rec_mgr._recorders:
+                    raise RuntimeError(f"{runner.msginfo}: Can't record cases of "
+                                       f"{obj.msginfo} because it runs {how}.")
+
     def _solve_nonlinear(self):
         """
         Compute outputs. The model is assumed to be in a scaled state.
@@ -2531,19 +2817,19 @@ class Group(System):
                 jac = self._assembled_jac
 
             # Only linearize subsystems if we aren't approximating the derivs at this level.
-            for subsys in self._subsystems_myproc:
+            def linearize(subsys):
                 do_ln = sub_do_ln and (subsys._linear_solver is not None and
                                        subsys._linear_solver._linearize_children())
                 subsys._linearize(jac, sub_do_ln=do_ln)
 
+            self._run_subsystems(linearize)
+
             # Update jacobian
             if self._assembled_jac is not None:
                 self._assembled_jac._update(self)
 
             if sub_do_ln:
-                for subsys in self._subsystems_myproc:
-                    if subsys._linear_solver is not None:
-                        subsys._linear_solver._linearize()
+                self._run_subsystems(_linearize_solver)
 
     def _check_first_linearize(self):
         if self._first_call_to_linearize:
@@ -1,6 +1,7 @@
 """Define the ParallelGroup class."""
 
 from openmdao.core.group import Group
+from openmdao.utils.concurrent import thread_map
 
 
 class ParallelGroup(Group):
@@ -20,3 +21,53 @@ class ParallelGroup(Group):
         """
         super().__init__(**kwargs)
         self._mpi_proc_allocator.parallel = True
+
+    def _declare_options(self):
+        """
+        Declare options before kwargs are processed in the init method.
+        """
+        super()._declare_options()
+
+        self.options.declare('num_threads', types=int, default=1, lower=1,
+                             desc='Number of threads used to run the subsystems that are local '
+                                  'to this process concurrently. This only speeds things up '
+                                  'when the subsystems release the GIL, for example in compiled '
+                                  'code or while waiting on an external code.')
+
+    def _runs_subsystems_concurrently(self):
+        """
+        Return True if the local subsystems are run concurrently by _run_subsystems.
+
+        Returns
+        -------
+        bool
+            True if the local subsystems are run concurrently.
+        """
+        return self.options['num_threads'] > 1 and len(self._subsystems_myproc) > 1
+
+    def _run_subsystems(self, func):
+        """
+        Call a function on each local subsystem, in threads if num_threads is more than 1.
+
+        The subsystems write to disjoint parts of the vectors, so they can run concurrently
+        without copying any data.
+
+        Parameters
+        ----------
+        func : function
+            The function, which takes the subsystem as its only argument.
+        """
+        if self._runs_subsystems_concurrently():
+            thread_map(self, self.options['num_threads'], func, self._subsystems_myproc,
+                       self._recording_iter)
+        else:
+            super()._run_subsystems(func)
+
+    def _setup_recording(self):
+        """
+        Set up case recording, checking that nothing below this group records when threaded.
+        """
+        super()._setup_recording()
+
+        if self.options['num_threads'] > 1:
+            self._check_concurrent_recording(self, 'in a thread when num_threads is more than 1')
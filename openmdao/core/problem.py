@@ -7,6 +7,7 @@ import logging
 import weakref
 
 from collections import defaultdict, namedtuple, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from fnmatch import fnmatchcase
 from itertools import product
 
@@ -20,6 +21,7 @@ from openmdao.core.driver import Driver, record_iteration
 from openmdao.core.explicitcomponent import ExplicitComponent
 from openmdao.core.group import Group, System
 from openmdao.core.indepvarcomp import IndepVarComp
+from openmdao.core.problem_template import ProblemTemplate
 from openmdao.core.total_jac import _TotalJacInfo
 from openmdao.core.constants import _DEFAULT_OUT_STREAM, _UNDEFINED, INT_DTYPE
 from openmdao.approximation_schemes.complex_step import ComplexStep
@@ -181,6 +183,10 @@ class Problem(object):
         self.options.declare('coloring_dir', types=str,
                              default=os.path.join(os.getcwd(), 'coloring_files'),
                              desc='Directory containing coloring files (if any) for this Problem.')
+        self.options.declare('coloring_cache', types=bool, default=False,
+                             desc='If True, dynamic colorings are saved in coloring_dir along '
+                                  'with a hash of the model structure, and are reused by later '
+                                  'runs if that structure has not changed.')
         self.options.update(options)
 
         # Case recording options
@@ -865,6 +871,7 @@ class Problem(object):
         # this metadata will be shared by all Systems/Solvers in the system tree
         self._metadata = {
             'coloring_dir': self.options['coloring_dir'],  # directory for coloring files
+            'coloring_cache': self.options['coloring_cache'],  # reuse colorings across runs
             'recording_iter': _RecIteration(),  # manager of recorder iterations
             'local_vector_class': local_vector_class,
             'distributed_vector_class': distributed_vector_class,
@@ -881,6 +888,7 @@ class Problem(object):
                                    # Problem setup and they are never wiped out or re-created.
             'config_info': None,  # used during config to determine if additional updates required
             'parallel_groups': [],  # list of pathnames of parallel groups in this model (all procs)
+            'cycle_partitions': {},  # subsystem layout of each group to partition, keyed by pathname
             'setup_status': _SetupStatus.PRE_SETUP,
             'vec_names': None,  # names of all nonlinear and linear vectors
             'lin_vec_names': None,  # names of linear vectors
@@ -975,10 +983,25 @@ class Problem(object):
                 logger = TestLogger()
             self.check_config(logger, checks=checks)
 
+    def clone(self):
+        """
+        Return an independent copy of this Problem that doesn't need to be set up again.
+
+        The copy has the same model, driver, and variable values as this Problem, but case
+        recorders are not copied.  To create many copies, create a ProblemTemplate once and
+        call its create method for each copy.
+
+        Returns
+        -------
+        <Problem>
+            The copy.
+        """
+        return ProblemTemplate(self).create()
+
     def check_partials(self, out_stream=_DEFAULT_OUT_STREAM, includes=None, excludes=None,
                        compact_print=False, abs_err_tol=1e-6, rel_err_tol=1e-6,
                        method='fd', step=None, form='forward', step_calc='abs',
-                       force_dense=True, show_only_incorrect=False):
+                       force_dense=True, show_only_incorrect=False, num_workers=None):
         """
         Check partial derivatives comprehensively for all components in your model.
 
@@ -1017,6 +1040,10 @@ class Problem(object):
             If True, analytic derivatives will be coerced into arrays. Default is True.
         show_only_incorrect : bool, optional
             Set to True if output should print only the subjacs found to be incorrect.
+        num_workers : int or None
+            If greater than 1, the components are checked concurrently by this many worker
+            processes, each of which checks a share of the components using its own copy of
+            this Problem.  Default is None, which checks all of the components in this process.
 
         Returns
         -------
@@ -1076,6 +1103,60 @@ class Problem(object):
 
         self.set_solver_print(level=0)
 
+        if num_workers is not None and num_workers > 1:
+            data = self._check_partials_parallel(comps, num_workers, method, step, form,
+                                                 step_calc, force_dense)
+        else:
+            data = self._compute_partials_data(comps, method, step, form, step_calc, force_dense)
+
+        partials_data, indep_key, all_fd_options, comps_could_not_cs, print_reverse = data
+
+        if out_stream == _DEFAULT_OUT_STREAM:
+            out_stream = sys.stdout
+
+        if len(comps_could_not_cs) > 0:
+            msg = "The following components requested complex step, but force_alloc_complex " + \
+                  "has not been set to True, so finite difference was used: "
+            msg += str(list(comps_could_not_cs))
+            msg += "\nTo enable complex step, specify 'force_alloc_complex=True' when calling " + \
+                   "setup on the problem, e.g. 'problem.setup(force_alloc_complex=True)'"
+            simple_warning(msg)
+
+        _assemble_derivative_data(partials_data, rel_err_tol, abs_err_tol, out_stream,
+                                  compact_print, comps, all_fd_options, indep_key=indep_key,
+                                  print_reverse=print_reverse,
+                                  show_only_incorrect=show_only_incorrect)
+
+        return partials_data
+
+    def _compute_partials_data(self, comps, method, step, form, step_calc, force_dense):
+        """
+        Compute the analytic and approximated partials of the given components.
+
+        Parameters
+        ----------
+        comps : list of <Component>
+            The components whose partials are checked.
+        method : str
+            Method, 'fd' for finite difference or 'cs' for complex step.
+        step : float or None
+            Step size for approximation.
+        form : string
+            Form for finite difference.
+        step_calc : string
+            Step type for finite difference.
+        force_dense : bool
+            If True, analytic derivatives will be coerced into arrays.
+
+        Returns
+        -------
+        tuple
+            The partials data, the keys of partials that aren't dependent, the approximation
+            options, the names of components that couldn't use complex step, and whether reverse
+            mode results should be printed.
+        """
+        model = self.model
+
         # This is a defaultdict of (defaultdict of dicts).
         partials_data = defaultdict(lambda: defaultdict(dict))
 
@@ -1384,27 +1465,80 @@ class Problem(object):
         # Conversion of defaultdict to dicts
         partials_data = {comp_name: dict(outer) for comp_name, outer in partials_data.items()}
 
-        if out_stream == _DEFAULT_OUT_STREAM:
-            out_stream = sys.stdout
+        return partials_data, indep_key, all_fd_options, comps_could_not_cs, print_reverse
 
-        if len(comps_could_not_cs) > 0:
-            msg = "The following components requested complex step, but force_alloc_complex " + \
-                  "has not been set to True, so finite difference was used: "
-            msg += str(list(comps_could_not_cs))
-            msg += "\nTo enable complex step, specify 'force_alloc_complex=True' when calling " + \
-                   "setup on the problem, e.g. 'problem.setup(force_alloc_complex=True)'"
-            simple_warning(msg)
+    def _check_partials_parallel(self, comps, num_workers, method, step, form, step_calc,
+                                 force_dense):
+        """
+        Compute the analytic and approximated partials of the given components in worker processes.
 
-        _assemble_derivative_data(partials_data, rel_err_tol, abs_err_tol, out_stream,
-                                  compact_print, comps, all_fd_options, indep_key=indep_key,
-                                  print_reverse=print_reverse,
-                                  show_only_incorrect=show_only_incorrect)
+        Each worker creates its own copy of this Problem from a ProblemTemplate and computes the
+        partials of a share of the components.
 
-        return partials_data
+        Parameters
+        ----------
+        comps : list of <Component>
+            The components whose partials are checked.
+        num_workers : int
+            Number of worker processes.
+        method : str
+            Method, 'fd' for finite difference or 'cs' for complex step.
+        step : float or None
+            Step size for approximation.
+        form : string
+            Form for finite difference.
+        step_calc : string
+            Step type for finite difference.
+        force_dense : bool
+            If True, analytic derivatives will be coerced into arrays.
+
+        Returns
+        -------
+        tuple
+            The partials data, the keys of partials that aren't dependent, the approximation
+            options, the names of components that couldn't use complex step, and whether reverse
+            mode results should be printed.
+        """
+        if self.comm.size > 1:
+            raise RuntimeError(f"{self.msginfo}: check_partials can't use worker processes when "
+                               "running under MPI.")
+
+        names = [comp.pathname for comp in comps]
+        num_workers = min(num_workers, len(names))
+        if num_workers < 2:
+            return self._compute_partials_data(comps, method, step, form, step_calc, force_dense)
+
+        template = ProblemTemplate(self)
+        args = (method, step, form, step_calc, force_dense)
+
+        # deal the components out so that the work is spread evenly even if similar (and
+        # similarly expensive) components are next to each other in the model
+        with ProcessPoolExecutor(num_workers, initializer=_init_check_partials_worker,
+                                 initargs=(template,)) as executor:
+            results = list(executor.map(_check_partials_worker,
+                                        [(names[i::num_workers], args)
+                                         for i in range(num_workers)]))
+
+        partials_data = {}
+        indep_key = {}
+        all_fd_options = {}
+        comps_could_not_cs = set()
+        print_reverse = False
+        for data, ikey, fd_opts, no_cs, prev in results:
+            partials_data.update(data)
+            indep_key.update(ikey)
+            all_fd_options.update(fd_opts)
+            comps_could_not_cs.update(no_cs)
+            print_reverse |= prev
+
+        # keep the results in the same order as a serial check
+        partials_data = {n: partials_data[n] for n in names if n in partials_data}
+
+        return partials_data, indep_key, all_fd_options, comps_could_not_cs, print_reverse
 
     def check_totals(self, of=None, wrt=None, out_stream=_DEFAULT_OUT_STREAM, compact_print=False,
                      driver_scaling=False, abs_err_tol=1e-6, rel_err_tol=1e-6,
-                     method='fd', step=None, form=None, step_calc='abs'):
+                     method='fd', step=None, form=None, step_calc='abs', streaming=False):
         """
         Check total derivatives for the model vs. finite difference.
 
@@ -1443,6 +1577,11 @@ class Problem(object):
         step_calc : string
             Step type for finite difference, can be 'abs' for absolute', or 'rel' for relative.
             Default is 'abs'.
+        streaming : bool
+            If True, the total jacobian is computed in sparse form and compared to its
+            approximation one column at a time, so neither is ever stored as a dense array.  The
+            returned data then contains only the norms and errors, not 'J_fwd' and 'J_fd'.
+            Default is False.
 
         Returns
         -------
@@ -1470,6 +1609,18 @@ class Problem(object):
 
         # TODO: Once we're tracking iteration counts, run the model if it has not been run before.
 
+        if streaming:
+            data = {'': self._check_totals_streaming(of, wrt, driver_scaling, method, step, form,
+                                                     step_calc)}
+            fd_args = {'step': step, 'form': form, 'step_calc': step_calc, 'method': method}
+
+            if out_stream == _DEFAULT_OUT_STREAM:
+                out_stream = sys.stdout
+
+            _assemble_derivative_data(data, rel_err_tol, abs_err_tol, out_stream, compact_print,
+                                      [model], {'': fd_args}, totals=True)
+            return data['']
+
         # Calculate Total Derivatives
         total_info = _TotalJacInfo(self, of, wrt, False, return_format='flat_dict',
                                    driver_scaling=driver_scaling)
@@ -1531,6 +1682,81 @@ class Problem(object):
                                   [model], {'': fd_args}, totals=True)
         return data['']
 
+    def _check_totals_streaming(self, of, wrt, driver_scaling, method, step, form, step_calc):
+        """
+        Compare the total jacobian to its approximation one column at a time.
+
+        Parameters
+        ----------
+        of : list of variable name strings or None
+            Variables whose derivatives will be computed.
+        wrt : list of variable name strings or None
+            Variables with respect to which the derivatives will be computed.
+        driver_scaling : bool
+            If True, compare derivatives that are scaled by the driver.
+        method : str
+            Method, 'fd' for finite difference or 'cs' for complex step.
+        step : float or None
+            Step size for approximation.
+        form : string or None
+            Form for finite difference.
+        step_calc : string
+            Step type for finite difference.
+
+        Returns
+        -------
+        dict
+            Norms of the computed and approximated derivatives and of their difference, keyed
+            by (of, wrt).
+        """
+        total_info = _TotalJacInfo(self, of, wrt, False, return_format='coo',
+                                   driver_scaling=driver_scaling)
+        J = total_info.compute_totals().tocsc()
+        J.sum_duplicates()
+
+        of_sizes = [total_info.of_meta[n][0].stop - total_info.of_meta[n][0].start
+                    for n in total_info.of]
+        wrt_sizes = [total_info.wrt_meta[n][0].stop - total_info.wrt_meta[n][0].start
+                     for n in total_info.wrt]
+        row_var = np.repeat(np.arange(len(of_sizes)), of_sizes)
+        col_var = np.repeat(np.arange(len(wrt_sizes)), wrt_sizes)
+
+        # sums of squares of the computed and approximated derivatives and of their difference
+        calc2 = np.zeros((len(of_sizes), len(wrt_sizes)))
+        fd2 = np.zeros(calc2.shape)
+        err2 = np.zeros(calc2.shape)
+        calc = np.zeros(J.shape[0])
+
+        for col, fd in total_info.approx_column_iter(method, step, form, step_calc):
+            start, end = J.indptr[col], J.indptr[col + 1]
+            calc[:] = 0.0
+            calc[J.indices[start:end]] = J.data[start:end]
+
+            w = col_var[col]
+            calc2[:, w] += np.bincount(row_var, calc * calc, calc2.shape[0])
+            fd2[:, w] += np.bincount(row_var, fd * fd, calc2.shape[0])
+            diff = calc - fd
+            err2[:, w] += np.bincount(row_var, diff * diff, calc2.shape[0])
+
+        calc2 = np.sqrt(calc2)
+        fd2 = np.sqrt(fd2)
+        err2 = np.sqrt(err2)
+
+        resp = self.driver._responses
+        data = {}
+        for i, prom_of in enumerate(total_info.prom_of):
+            for j, prom_wrt in enumerate(total_info.prom_wrt):
+                data[prom_of, prom_wrt] = meta = {
+                    'abs error': ErrorTuple(err2[i, j], None, None),
+                    'magnitude': MagnitudeTuple(calc2[i, j], None, fd2[i, j]),
+                }
+
+                # Display whether indices were declared when response was added.
+                if prom_of in resp and resp[prom_of]['indices'] is not None:
+                    meta['indices'] = len(resp[prom_of]['indices'])
+
+        return data
+
     def compute_totals(self, of=None, wrt=None, return_format='flat_dict', debug_print=False,
                        driver_scaling=False, use_abs_names=False):
         """
@@ -1545,9 +1771,11 @@ class Problem(object):
             Variables with respect to which the derivatives will be computed.
             Default is None, which uses the driver's desvars.
         return_format : string
-            Format to return the derivatives. Can be 'dict', 'flat_dict', or 'array'.
+            Format to return the derivatives. Can be 'dict', 'flat_dict', 'array', or 'coo'.
             Default is a 'flat_dict', which returns them in a dictionary whose keys are
-            tuples of form (of, wrt).
+            tuples of form (of, wrt).  The 'coo' format returns the nonzeros of the jacobian as
+            a scipy coo_matrix, and unless the total derivatives are approximated, the dense
+            jacobian is never allocated.
         debug_print : bool
             Set to True to print out some debug information during linear solve.
         driver_scaling : bool
@@ -1566,6 +1794,9 @@ class Problem(object):
             self.final_setup()
 
         if self.model._owns_approx_jac:
+            if return_format == 'coo':
+                return sparse.coo_matrix(self.compute_totals(of, wrt, 'array', debug_print,
+                                                             driver_scaling, use_abs_names))
             total_info = _TotalJacInfo(self, of, wrt, use_abs_names, return_format,
                                        approx=True, driver_scaling=driver_scaling)
             return total_info.compute_totals_approx(initialize=True)
@@ -1822,6 +2053,43 @@ class Problem(object):
             _all_checks[c](self, logger)
 
 
+# copy of the Problem used by a check_partials worker process
+_check_partials_prob = None
+
+
+def _init_check_partials_worker(template):
+    """
+    Create the copy of the Problem used by a check_partials worker process.
+
+    Parameters
+    ----------
+    template : <ProblemTemplate>
+        Template of the Problem whose partials are checked.
+    """
+    global _check_partials_prob
+    _check_partials_prob = template.create()
+
+
+def _check_partials_worker(task):
+    """
+    Compute the analytic and approximated partials of some components in a worker process.
+
+    Parameters
+    ----------
+    task : tuple
+        Pathnames of the components and the args to _compute_partials_data.
+
+    Returns
+    -------
+    tuple
+        The return value of _compute_partials_data.
+    """
+    names, args = task
+    model = _check_partials_prob.model
+    comps = [model if name == '' else model._get_subsystem(name) for name in names]
+    return _check_partials_prob._compute_partials_data(comps, *args)
+
+
 def _assemble_derivative_data(derivative_data, rel_error_tol, abs_error_tol, out_stream,
                               compact_print, system_list, global_options, totals=False,
                               indep_key=None, print_reverse=False,
@@ -1976,12 +2244,16 @@ def _assemble_derivative_data(derivative_data, rel_error_tol, abs_error_tol, out
 
             derivative_info = derivatives[of, wrt]
             # TODO total derivs may have been computed in rev mode, not fwd
-            forward = derivative_info['J_fwd']
-            fd = derivative_info['J_fd']
+            forward = derivative_info.get('J_fwd')
+            fd = derivative_info.get('J_fd')
             if do_rev:
                 reverse = derivative_info.get('J_rev')
 
-            fwd_error = np.linalg.norm(forward - fd)
+            if forward is None:
+                # only the norms were kept (streaming check_totals)
+                fwd_error = derivative_info['abs error'].forward
+            else:
+                fwd_error = np.linalg.norm(forward - fd)
             if do_rev_dp:
                 fwd_rev_error = derivative_info['directional_fwd_rev']
                 rev_error = derivative_info['directional_fd_rev']
@@ -1991,8 +2263,12 @@ def _assemble_derivative_data(derivative_data, rel_error_tol, abs_error_tol, out
             else:
                 rev_error = fwd_rev_error = None
 
-            fwd_norm = np.linalg.norm(forward)
-            fd_norm = np.linalg.norm(fd)
+            if forward is None:
+                fwd_norm = derivative_info['magnitude'].forward
+                fd_norm = derivative_info['magnitude'].fd
+            else:
+                fwd_norm = np.linalg.norm(forward)
+                fd_norm = np.linalg.norm(fd)
             if do_rev:
                 rev_norm = np.linalg.norm(reverse)
             else:
@@ -2179,7 +2455,7 @@ def _assemble_derivative_data(derivative_data, rel_error_tol, abs_error_tol, out
                         out_buffer.write('\n')
 
                     # Raw Derivatives
-                    if out_stream:
+                    if out_stream and forward is not None:
                         if do_rev_dp:
                             out_buffer.write('    Directional Forward Derivative (Jfor)\n')
                         else:
@@ -2194,7 +2470,7 @@ def _assemble_derivative_data(derivative_data, rel_error_tol, abs_error_tol, out
                                 out_buffer.write(str(reverse) + '\n')
                                 out_buffer.write('\n')
 
-                    if out_stream:
+                    if out_stream and fd is not None:
                         if directional:
                             out_buffer.write('    Directional FD Derivative (Jfd)\n')
                         else:
@@ -0,0 +1,442 @@
+"""
+Define the ProblemTemplate class, used to create independent copies of a set up Problem.
+"""
+
+import io
+import copyreg
+import pickle
+import weakref
+
+import numpy as np
+
+from openmdao.core.constants import _SetupStatus
+from openmdao.recorders.recording_manager import RecordingManager
+from openmdao.utils.mpi import MPI
+from openmdao.utils.timing import _all_subclasses
+from openmdao.vectors.vector import Vector
+
+
+class ProblemTemplate(object):
+    """
+    A snapshot of a set up Problem that can be used to create independent copies of it.
+
+    Creating a copy from a template is much faster than setting up a new Problem, since the
+    model hierarchy, variable metadata, connections, vectors, transfers and relevance are all
+    copied rather than recomputed.  Each copy starts with the variable values that the Problem
+    had when the template was created.
+
+    Case recorders are not copied, so a copy doesn't record anything.  A template of a Problem
+    that isn't running under MPI can be pickled, so it can be sent to other processes, where
+    it can be used to create copies there.
+
+    Attributes
+    ----------
+    _data : bytes
+        The pickled Problem.
+    _shared : list
+        Objects referenced by the Problem that are shared by all of the copies rather than
+        copied, e.g., MPI communicators.
+    """
+
+    def __init__(self, problem):
+        """
+        Take a snapshot of the given Problem.
+
+        Parameters
+        ----------
+        problem : <Problem>
+            The Problem.  It must have been set up, and final_setup will be called if it hasn't
+            been called already.
+        """
+        if problem._metadata is None or \
+                problem._metadata['setup_status'] < _SetupStatus.POST_SETUP:
+            raise RuntimeError(f"{problem.msginfo}: setup() must be called before creating a "
+                               "ProblemTemplate.")
+
+        if problem._metadata['setup_status'] < _SetupStatus.POST_FINAL_SETUP:
+            problem.final_setup()
+
+        self._shared = []
+        stream = io.BytesIO()
+        pickler_class = _MPITemplatePickler if MPI else _TemplatePickler
+        try:
+            pickler_class(stream, self._shared).dump(problem)
+        except (pickle.PicklingError, TypeError, AttributeError) as err:
+            raise RuntimeError(f"{problem.msginfo}: Can't create a ProblemTemplate because the "
+                               f"Problem can't be copied: {err}")
+        self._data = stream.getvalue()
+
+    def create(self):
+        """
+        Create a new copy of the Problem.
+
+        Returns
+        -------
+        <Problem>
+            The copy.
+        """
+        unpickler = _TemplateUnpickler(io.BytesIO(self._data), self._shared)
+        problem = unpickler.load()
+
+        # the views of subsystem vectors are views of the root vectors, so do those first
+        for vec in sorted(unpickler._vectors, key=lambda v: v._root_vector is not v):
+            if vec._root_vector is not vec:
+                vec._data, vec._cplx_data, vec._scaling = vec._extract_root_data()
+            vec._initialize_views()
+
+        return problem
+
+    def __getstate__(self):
+        """
+        Return state as a dict.
+
+        Returns
+        -------
+        dict
+            State to get.
+        """
+        if self._shared:
+            raise RuntimeError("ProblemTemplate: A template of a Problem that uses MPI "
+                               "communicators can't be pickled.")
+        return self.__dict__
+
+
+class _TemplatePickler(pickle.Pickler):
+    """
+    Pickler that can pickle a set up Problem.
+
+    Weak references are pickled along with the objects they refer to, arrays that are views
+    remain views of the same array, vectors are pickled without their views, and recording
+    managers are replaced by empty ones.
+
+    Attributes
+    ----------
+    _shared : list
+        Objects that are shared rather than pickled.
+    """
+
+    def __init__(self, stream, shared):
+        """
+        Initialize attributes.
+
+        Parameters
+        ----------
+        stream : file-like
+            Where the pickled data is written.
+        shared : list
+            List that objects that are shared rather than pickled are appended to.
+        """
+        super().__init__(stream, pickle.HIGHEST_PROTOCOL)
+        self._shared = shared
+
+        # the dispatch table is per pickler, so it doesn't affect pickling done elsewhere
+        self.dispatch_table = dispatch = copyreg.dispatch_table.copy()
+        dispatch[weakref.ReferenceType] = _reduce_weakref
+        dispatch[np.ndarray] = _reduce_ndarray
+        dispatch[RecordingManager] = _reduce_rec_mgr
+
+        for klass in _all_subclasses(Vector):
+            dispatch[klass] = _reduce_vector
+
+
+class _MPITemplatePickler(_TemplatePickler):
+    """
+    Pickler that can pickle a set up Problem that uses MPI communicators.
+
+    The communicators are shared rather than pickled.  This is a separate class because
+    persistent_id is called for every object that is pickled.
+
+    Attributes
+    ----------
+    _shared_ids : dict
+        Mapping of id of each shared object to its index in _shared.
+    """
+
+    def __init__(self, stream, shared):
+        """
+        Initialize attributes.
+
+        Parameters
+        ----------
+        stream : file-like
+            Where the pickled data is written.
+        shared : list
+            List that objects that are shared rather than pickled are appended to.
+        """
+        super().__init__(stream, shared)
+        self._shared_ids = {}
+
+    def persistent_id(self, obj):
+        """
+        Return the index of the object in the shared objects, or None if it isn't shared.
+
+        Parameters
+        ----------
+        obj : object
+            The object being pickled.
+
+        Returns
+        -------
+        int or None
+            Index into the shared objects.
+        """
+        if isinstance(obj, MPI.Comm):
+            idx = self._shared_ids.get(id(obj))
+            if idx is None:
+                idx = self._shared_ids[id(obj)] = len(self._shared)
+                self._shared.append(obj)
+            return idx
+
+
+class _TemplateUnpickler(pickle.Unpickler):
+    """
+    Unpickler for data written by _TemplatePickler.
+
+    Attributes
+    ----------
+    _shared : list
+        Objects that were shared rather than pickled.
+    _vectors : list of <Vector>
+        The vectors that have been loaded, whose views still need to be created.
+    """
+
+    def __init__(self, stream, shared):
+        """
+        Initialize attributes.
+
+        Parameters
+        ----------
+        stream : file-like
+            Where the pickled data is read from.
+        shared : list
+            Objects that were shared rather than pickled.
+        """
+        super().__init__(stream)
+        self._shared = shared
+        self._vectors = []
+
+    def find_class(self, module, name):
+        """
+        Return the named global, keeping track of the vectors that are created.
+
+        Parameters
+        ----------
+        module : str
+            Name of the module containing the global.
+        name : str
+            Name of the global.
+
+        Returns
+        -------
+        object
+            The global.
+        """
+        if module == __name__ and name == '_new_vector':
+            return self._new_vector
+        return super().find_class(module, name)
+
+    def _new_vector(self, vec_class):
+        """
+        Create an uninitialized vector.
+
+        Parameters
+        ----------
+        vec_class : class
+            The class of the vector.
+
+        Returns
+        -------
+        <Vector>
+            The vector.
+        """
+        vec = _new_vector(vec_class)
+        self._vectors.append(vec)
+        return vec
+
+    def persistent_load(self, pid):
+        """
+        Return the shared object with the given index.
+
+        Parameters
+        ----------
+        pid : int
+            Index into the shared objects.
+
+        Returns
+        -------
+        object
+            The shared object.
+        """
+        return self._shared[pid]
+
+
+def _dead_ref():
+    """
+    Stand in for a weak reference whose referent no longer exists.
+
+    Returns
+    -------
+    None
+        Always None.
+    """
+    return None
+
+
+def _make_weakref(obj):
+    """
+    Return a weak reference to the given object.
+
+    Parameters
+    ----------
+    obj : object or None
+        The referent, or None if the original referent no longer existed.
+
+    Returns
+    -------
+    weakref or function
+        The weak reference.
+    """
+    if obj is None:
+        return _dead_ref
+    return weakref.ref(obj)
+
+
+def _reduce_weakref(ref):
+    """
+    Reduce a weak reference so that it's recreated with a copy of its referent.
+
+    Parameters
+    ----------
+    ref : weakref
+        The weak reference.
+
+    Returns
+    -------
+    tuple
+        Function and args that recreate the weak reference.
+    """
+    return _make_weakref, (ref(),)
+
+
+def _make_view(base, shape, dtype, offset, strides, writeable):
+    """
+    Return a view of the given array.
+
+    Parameters
+    ----------
+    base : ndarray
+        The array that owns the data.
+    shape : tuple
+        Shape of the view.
+    dtype : dtype
+        Data type of the view.
+    offset : int
+        Offset of the view in bytes from the start of base.
+    strides : tuple
+        Strides of the view.
+    writeable : bool
+        Whether the view is writeable.
+
+    Returns
+    -------
+    ndarray
+        The view.
+    """
+    view = np.ndarray(shape, dtype, buffer=base, offset=offset, strides=strides)
+    if not writeable:
+        view.flags.writeable = False
+    return view
+
+
+def _reduce_ndarray(arr):
+    """
+    Reduce an array so that a view is recreated as a view of a copy of the array it views.
+
+    Views into the data arrays of vectors are stored all over the model, so without this
+    each of them would become an independent array.
+
+    Parameters
+    ----------
+    arr : ndarray
+        The array.
+
+    Returns
+    -------
+    tuple
+        Function and args that recreate the array.
+    """
+    base = arr.base
+    if base is None or arr.dtype.hasobject:
+        return arr.__reduce_ex__(pickle.HIGHEST_PROTOCOL)
+
+    while isinstance(base, np.ndarray) and base.base is not None:
+        base = base.base
+
+    if type(base) is not np.ndarray or not base.flags.c_contiguous or base.dtype.hasobject:
+        return arr.__reduce_ex__(pickle.HIGHEST_PROTOCOL)
+
+    offset = arr.__array_interface__['data'][0] - base.__array_interface__['data'][0]
+    return _make_view, (base, arr.shape, arr.dtype, offset, arr.strides, arr.flags.writeable)
+
+
+def _reduce_rec_mgr(rec_mgr):
+    """
+    Reduce a recording manager so that it's recreated without any recorders.
+
+    Parameters
+    ----------
+    rec_mgr : <RecordingManager>
+        The recording manager.
+
+    Returns
+    -------
+    tuple
+        Function and args that create an empty recording manager.
+    """
+    return RecordingManager, ()
+
+
+def _new_vector(vec_class):
+    """
+    Create an uninitialized vector.
+
+    Parameters
+    ----------
+    vec_class : class
+        The class of the vector.
+
+    Returns
+    -------
+    <Vector>
+        The vector.
+    """
+    return vec_class.__new__(vec_class)
+
+
+def _reduce_vector(vec):
+    """
+    Reduce a vector so that it keeps its system but its views aren't pickled.
+
+    There are many more views than variables, so it's faster to create them again after
+    loading, along with the data arrays of subsystem vectors, which are views of the data arrays
+    of the root vectors.
+
+    Parameters
+    ----------
+    vec : <Vector>
+        The vector.
+
+    Returns
+    -------
+    tuple
+        Function, args, and state that recreate the vector.
+    """
+    state = vec.__dict__.copy()
+    for name in ('_views', '_views_flat', '_cplx_views', '_cplx_views_flat'):
+        del state[name]
+    if vec._root_vector is not vec:
+        del state['_data']
+        del state['_cplx_data']
+        del state['_scaling']
+
+    return _new_vector, (type(vec),), state
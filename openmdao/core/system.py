@@ -94,6 +94,35 @@ allowed_meta_names.update(global_meta_names['input'])
 allowed_meta_names.update(global_meta_names['output'])
 
 
+# The default factories below are module level functions rather than lambdas so that a set up
+# system can be pickled.
+def _empty_relevant_names():
+    """
+    Return the relevant input and output names of a vector with no relevant variables.
+
+    Returns
+    -------
+    dict
+        Empty lists of names keyed by 'input' and 'output'.
+    """
+    return {'input': [], 'output': []}
+
+
+def _input_scale_factors():
+    """
+    Return the scale factors of an input that doesn't require scaling.
+
+    Returns
+    -------
+    dict
+        Scale factor tuples keyed by (io type, 'phys' or 'norm').
+    """
+    return {
+        ('input', 'phys'): (0.0, 1.0),
+        ('input', 'norm'): (0.0, 1.0)
+    }
+
+
 class System(object):
     """
     Base class for all systems in OpenMDAO.
@@ -687,28 +716,26 @@ class System(object):
         self._relevant = None
         self._mode = mode
 
-        # Besides setting up the processors, this method also builds the model hierarchy.
-        self._setup_procs(self.pathname, comm, mode, self._problem_meta)
-
-        prob_meta['config_info'] = _ConfigInfo()
-
-        try:
-            # Recurse model from the bottom to the top for configuring.
-            self._configure()
-        finally:
-            prob_meta['config_info'] = None
+        self._setup_hierarchy(comm, mode)
 
-        self._configure_check()
+        # cycles can only be found once the connections are known, so if any of them have to be
+        # moved into new groups, the hierarchy and the connections are built again, once, with
+        # those groups in it, which calls setup and configure of every system again.  Nothing
+        # past the connections has been set up yet.
+        if self._setup_cycle_partitions():
+            self._setup_hierarchy(comm, mode)
 
-        self._setup_var_data()
+            if prob_meta['cycle_partitions']:
+                raise RuntimeError(f"{self.msginfo}: The cycles of the following groups could "
+                                   "not be moved into new groups because the groups weren't "
+                                   "found when the model was built again: "
+                                   f"{sorted(prob_meta['cycle_partitions'])}")
 
-        self._setup_vec_names(mode)
+        # the variables are ordered by subsystem, so if any subsystems were reordered, the
+        # connections have to be computed again from the new variable data
+        if self._setup_auto_order():
+            self._setup_global_connections()
 
-        # promoted names must be known to determine implicit connections so this must be
-        # called after _setup_var_data, and _setup_var_data will have to be partially redone
-        # after auto_ivcs have been added, but auto_ivcs can't be added until after we know all of
-        # the connections.
-        self._setup_global_connections()
         self._setup_dynamic_shapes()
 
         self._top_level_post_connections(mode)
@@ -728,6 +755,45 @@ class System(object):
         # determine which connections are managed by which group, and check validity of connections
         self._setup_connections()
 
+    def _setup_hierarchy(self, comm, mode):
+        """
+        Build the model hierarchy, its variables and the global connections.
+
+        Parameters
+        ----------
+        comm : MPI.Comm or <FakeComm> or None
+            The global communicator.
+        mode : str
+            Derivative direction, either 'fwd', or 'rev', or 'auto'
+        """
+        prob_meta = self._problem_meta
+
+        # the parallel groups are found as the hierarchy is built
+        prob_meta['parallel_groups'] = []
+
+        # Besides setting up the processors, this method also builds the model hierarchy.
+        self._setup_procs(self.pathname, comm, mode, prob_meta)
+
+        prob_meta['config_info'] = _ConfigInfo()
+
+        try:
+            # Recurse model from the bottom to the top for configuring.
+            self._configure()
+        finally:
+            prob_meta['config_info'] = None
+
+        self._configure_check()
+
+        self._setup_var_data()
+
+        self._setup_vec_names(mode)
+
+        # promoted names must be known to determine implicit connections so this must be
+        # called after _setup_var_data, and _setup_var_data will have to be partially redone
+        # after auto_ivcs have been added, but auto_ivcs can't be added until after we know all of
+        # the connections.
+        self._setup_global_connections()
+
     def _top_level_post_connections(self, mode):
         # this runs after all connections are known
         pass
@@ -742,6 +808,28 @@ class System(object):
         """
         pass
 
+    def _setup_cycle_partitions(self):
+        """
+        Find the cycles to move into new groups in any groups in this system with partition_cycles.
+
+        Returns
+        -------
+        bool
+            True if any cycles have to be moved into new groups.
+        """
+        return False
+
+    def _setup_auto_order(self):
+        """
+        Reorder the subsystems of any groups in this system that have auto_order set.
+
+        Returns
+        -------
+        bool
+            True if the order of any subsystems changed.
+        """
+        return False
+
     def _setup_dynamic_shapes(self):
         pass
 
@@ -980,6 +1068,22 @@ class System(object):
                 approx_scheme._reset()
             return [coloring]
 
+        if self._problem_meta['coloring_cache']:
+            structure_hash = coloring_mod._get_structure_hash(
+                self, [info[n] for n in sorted(_DEF_COMP_SPARSITY_ARGS)
+                       if n not in ('show_summary', 'show_sparsity')] +
+                [info['method'], info['wrt_patterns'], info['per_instance']])
+            coloring = coloring_mod._load_cached_coloring(coloring_fname, structure_hash)
+            if coloring is not None:
+                print("%s: using cached coloring from file %s" % (self.msginfo, coloring_fname))
+                info['coloring'] = coloring
+                info.update(coloring._meta)
+                # force regen of approx groups during next compute_approximations
+                approx_scheme._reset()
+                if not info['per_instance']:
+                    coloring_mod._CLASS_COLORINGS[coloring_fname] = coloring
+                return [coloring]
+
         from openmdao.core.group import Group
         is_total = isinstance(self, Group)
 
@@ -1002,14 +1106,15 @@ class System(object):
         save_first_call = self._first_call_to_linearize
         self._first_call_to_linearize = False
         sparsity_start_time = time.time()
+        rng = coloring_mod._sparsity_rng()
 
         for i in range(info['num_full_jacs']):
             # randomize inputs (and outputs if implicit)
             if i > 0:
                 self._inputs.set_val(starting_inputs +
-                                     in_offsets * np.random.random(in_offsets.size))
+                                     in_offsets * rng.random_sample(in_offsets.size))
                 self._outputs.set_val(starting_outputs +
-                                      out_offsets * np.random.random(out_offsets.size))
+                                      out_offsets * rng.random_sample(out_offsets.size))
                 if is_total:
                     self._solve_nonlinear()
                 else:
@@ -1036,6 +1141,13 @@ class System(object):
         sp_info['class'] = type(self).__name__
         sp_info['type'] = 'semi-total' if self._subsystems_allprocs else 'partial'
 
+        # restore original inputs/outputs
+        self._inputs.set_val(starting_inputs)
+        self._outputs.set_val(starting_outputs)
+        self._residuals.set_val(starting_resids)
+
+        self._first_call_to_linearize = save_first_call
+
         info = self._coloring_info
 
         self._jacobian._jac_summ = None  # reclaim the memory
@@ -1063,6 +1175,8 @@ class System(object):
         coloring._meta.update(info)  # save metadata we used to create the coloring
         del coloring._meta['coloring']
         coloring._meta.update(sp_info)
+        if self._problem_meta['coloring_cache']:
+            coloring._meta['structure_hash'] = structure_hash
 
         info['coloring'] = coloring
 
@@ -1084,13 +1198,6 @@ class System(object):
             # save the class coloring for other instances of this class to use
             coloring_mod._CLASS_COLORINGS[coloring_fname] = coloring
 
-        # restore original inputs/outputs
-        self._inputs.set_val(starting_inputs)
-        self._outputs.set_val(starting_outputs)
-        self._residuals.set_val(starting_resids)
-
-        self._first_call_to_linearize = save_first_call
-
         return [coloring]
 
     def _setup_approx_coloring(self):
@@ -1368,8 +1475,8 @@ class System(object):
         self._owning_rank = defaultdict(int)
         self._var_sizes = {'nonlinear': {}}
         self._owned_sizes = None
-        self._var_allprocs_relevant_names = defaultdict(lambda: {'input': [], 'output': []})
-        self._var_relevant_names = defaultdict(lambda: {'input': [], 'output': []})
+        self._var_allprocs_relevant_names = defaultdict(_empty_relevant_names)
+        self._var_relevant_names = defaultdict(_empty_relevant_names)
 
     def _setup_var_index_maps(self, vec_name):
         """
@@ -1714,10 +1821,7 @@ class System(object):
             Mapping of each absoute var name to its corresponding scaling factor tuple.
         """
         # make this a defaultdict to handle the case of access using unconnected inputs
-        scale_factors = defaultdict(lambda: {
-            ('input', 'phys'): (0.0, 1.0),
-            ('input', 'norm'): (0.0, 1.0)
-        })
+        scale_factors = defaultdict(_input_scale_factors)
 
         for abs_name, meta in self._var_allprocs_abs2meta['output'].items():
             ref0 = meta['ref0']
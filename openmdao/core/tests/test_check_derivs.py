@@ -1349,6 +1349,51 @@ class TestProblemCheckPartials(unittest.TestCase):
         self.assertTrue('c1c.d1' in data)
         self.assertTrue('abc1cab' in data)
 
+    def test_num_workers(self):
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('p1', om.IndepVarComp('x', 3.0))
+        model.add_subsystem('good', MyCompGoodPartials())
+        model.add_subsystem('bad', MyCompBadPartials())
+        model.add_subsystem('mat_vec', ParaboloidMatVec())
+        sub = model.add_subsystem('sub', om.Group())
+        sub.add_subsystem('quad', QuadraticJacVec())
+        sub.add_subsystem('array', ArrayComp())
+        sub.add_subsystem('exec', om.ExecComp('y=sin(x)'))
+        model.connect('p1.x', 'good.x1')
+
+        prob.setup(force_alloc_complex=True)
+        prob.set_val('sub.quad.a', 1.0)
+        prob.set_val('sub.quad.b', -4.0)
+        prob.set_val('sub.quad.c', 3.0)
+        prob.run_model()
+
+        for method in ('fd', 'cs'):
+            serial_stream = StringIO()
+            serial = prob.check_partials(out_stream=serial_stream, method=method,
+                                         excludes=['*exec'])
+
+            stream = StringIO()
+            data = prob.check_partials(out_stream=stream, method=method, excludes=['*exec'],
+                                       num_workers=3)
+
+            self.assertEqual(list(data), ['good', 'bad', 'mat_vec', 'sub.quad', 'sub.array'])
+            self.assertEqual(stream.getvalue(), serial_stream.getvalue())
+
+            for comp_name, comp_data in serial.items():
+                self.assertEqual(list(data[comp_name]), list(comp_data))
+                for key, deriv in comp_data.items():
+                    self.assertEqual(set(data[comp_name][key]), set(deriv))
+                    for name in ('J_fwd', 'J_rev', 'J_fd'):
+                        if name in deriv:
+                            assert_near_equal(data[comp_name][key][name], deriv[name], 1e-12)
+
+        # more workers than components
+        data = prob.check_partials(out_stream=None, includes=['*exec'], num_workers=4)
+        self.assertEqual(list(data), ['sub.exec'])
+        assert_check_partials(data)
+
     def test_directional_derivative_option(self):
 
         prob = om.Problem()
@@ -2106,6 +2151,23 @@ class TestCheckPartialsFeature(unittest.TestCase):
         prob.check_partials(compact_print=True, show_only_incorrect=True)
         prob.check_partials(compact_print=False, show_only_incorrect=True)
 
+    def test_feature_num_workers(self):
+        import openmdao.api as om
+        from openmdao.test_suite.components.paraboloid import Paraboloid
+
+        prob = om.Problem()
+        model = prob.model
+
+        for i in range(8):
+            model.add_subsystem('comp%d' % i, Paraboloid())
+
+        prob.setup()
+        prob.run_model()
+
+        data = prob.check_partials(compact_print=True, num_workers=4)
+
+        self.assertEqual(len(data), 8)
+
     def test_includes_excludes(self):
         import openmdao.api as om
 
@@ -2848,6 +2910,67 @@ class TestProblemCheckTotals(unittest.TestCase):
         lines = stream.getvalue().splitlines()
         self.assertTrue('index size: 1' in lines[3])
 
+    def _build_streaming_sellar(self):
+        prob = om.Problem(SellarDerivatives())
+        model = prob.model
+        model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False)
+        model.linear_solver = om.DirectSolver()
+
+        model.add_design_var('x', lower=0.0, upper=10.0)
+        model.add_design_var('z', lower=np.array([-10.0, 0.0]), upper=np.array([10.0, 10.0]),
+                             ref=2.0)
+        model.add_objective('obj')
+        model.add_constraint('con1', upper=0.0)
+        model.add_constraint('con2', upper=0.0, indices=[0])
+
+        prob.setup(force_alloc_complex=True)
+        prob.set_solver_print(level=0)
+        prob.run_model()
+
+        return prob
+
+    def test_streaming(self):
+        prob = self._build_streaming_sellar()
+
+        for driver_scaling in (False, True):
+            expected = prob.check_totals(out_stream=None, driver_scaling=driver_scaling)
+            totals = prob.check_totals(out_stream=None, driver_scaling=driver_scaling,
+                                       streaming=True)
+
+            self.assertEqual(set(totals), set(expected))
+            for key, val in totals.items():
+                # the full jacobians are never stored
+                self.assertFalse('J_fwd' in val)
+                self.assertFalse('J_fd' in val)
+
+                for name in ('abs error', 'rel error', 'magnitude'):
+                    assert_near_equal([v for v in val[name] if v is not None],
+                                      [v for v in expected[key][name] if v is not None], 1e-8)
+
+        # complex step is only as accurate as the converged solution
+        prob.model.nonlinear_solver.options['atol'] = 1e-12
+        prob.model.nonlinear_solver.options['rtol'] = 1e-12
+        prob.run_model()
+
+        totals = prob.check_totals(method='cs', out_stream=None, streaming=True)
+        for key, val in totals.items():
+            assert_near_equal(val['rel error'][0], 0.0, 1e-7)
+
+    def test_streaming_output(self):
+        prob = self._build_streaming_sellar()
+
+        stream = StringIO()
+        prob.check_totals(out_stream=stream, streaming=True)
+        lines = stream.getvalue().splitlines()
+
+        self.assertTrue("Full Model: 'con_cmp1.con1' wrt 'x'" in lines[3])
+        self.assertFalse('Raw Forward Derivative' in stream.getvalue())
+
+        stream = StringIO()
+        prob.check_totals(out_stream=stream, streaming=True, compact_print=True)
+        self.assertEqual(len([line for line in stream.getvalue().splitlines()
+                              if line.startswith("'con") or line.startswith("'obj")]), 6)
+
 
 @unittest.skipUnless(MPI and PETScVector, "MPI and PETSc are required.")
 class TestProblemCheckTotalsMPI(unittest.TestCase):
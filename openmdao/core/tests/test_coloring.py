@@ -94,9 +94,9 @@ class DynPartialsComp(om.ExplicitComponent):
 
 def run_opt(driver_class, mode, assemble_type=None, color_info=None, derivs=True,
             recorder=None, has_lin_constraint=True, has_diag_partials=True, partial_coloring=False,
-            use_vois=True, auto_ivc=False, **options):
+            use_vois=True, auto_ivc=False, coloring_cache=False, **options):
 
-    p = om.Problem(model=CounterGroup())
+    p = om.Problem(model=CounterGroup(), coloring_cache=coloring_cache)
 
     if assemble_type is not None:
         p.model.linear_solver = om.DirectSolver(assemble_jac=True)
@@ -607,6 +607,47 @@ class SimulColoringScipyTestCase(unittest.TestCase):
         self.assertEqual((p.model._solve_count - 21) / 21,
                          (p_color.model._solve_count - 21 * 4) / 5)
 
+    def test_dynamic_total_coloring_cache(self):
+        p_dense = run_opt(om.ScipyOptimizeDriver, 'auto', optimizer='SLSQP', disp=False,
+                          dynamic_total_coloring=True, has_diag_partials=False)
+
+        p = run_opt(om.ScipyOptimizeDriver, 'auto', optimizer='SLSQP', disp=False,
+                    dynamic_total_coloring=True, coloring_cache=True)
+        p_cached = run_opt(om.ScipyOptimizeDriver, 'auto', optimizer='SLSQP', disp=False,
+                           dynamic_total_coloring=True, coloring_cache=True)
+
+        assert_almost_equal(p_cached['circle.area'], np.pi, decimal=7)
+        self.assertEqual(p_cached.driver._coloring_info['coloring'].total_solves(), 5)
+
+        # the cached coloring skips the 3 full compute_totals used to compute sparsity
+        self.assertEqual(p_cached.model._solve_count, p.model._solve_count - 21 * 3)
+
+        # declared partials have changed, so the cached coloring is stale
+        p_stale = run_opt(om.ScipyOptimizeDriver, 'auto', optimizer='SLSQP', disp=False,
+                          dynamic_total_coloring=True, coloring_cache=True,
+                          has_diag_partials=False)
+        self.assertEqual(p_stale.model._solve_count, p_dense.model._solve_count)
+
+        # the recomputed coloring replaced the stale one
+        p_cached = run_opt(om.ScipyOptimizeDriver, 'auto', optimizer='SLSQP', disp=False,
+                           dynamic_total_coloring=True, coloring_cache=True,
+                           has_diag_partials=False)
+        self.assertEqual(p_cached.model._solve_count, p_dense.model._solve_count - 21 * 3)
+
+    def test_dynamic_partial_coloring_cache(self):
+        p = run_opt(om.ScipyOptimizeDriver, 'auto', optimizer='SLSQP', disp=False,
+                    partial_coloring=True, coloring_cache=True)
+        p_cached = run_opt(om.ScipyOptimizeDriver, 'auto', optimizer='SLSQP', disp=False,
+                           partial_coloring=True, coloring_cache=True)
+
+        assert_almost_equal(p_cached['circle.area'], np.pi, decimal=7)
+        coloring = p_cached.model.arctan_yox._coloring_info['coloring']
+        self.assertEqual(coloring.total_solves(), 2)
+
+        # the cached coloring skips the full jacobians computed to determine sparsity
+        self.assertTrue(p_cached.model.arctan_yox.num_computes <
+                        p.model.arctan_yox.num_computes - 2 * 2 * SIZE)
+
     def test_problem_total_coloring_auto(self):
 
         p = run_opt(om.ScipyOptimizeDriver, 'auto', optimizer='SLSQP', disp=False, use_vois=False)
@@ -762,6 +762,48 @@ class TestDriver(unittest.TestCase):
         assert_near_equal(totals['sub.comp.f_xy', 'sub.x']['J_fd'], [[1.44e2]], 1e-5)
         assert_near_equal(totals['sub.comp.f_xy', 'sub.y']['J_fd'], [[1.58e2]], 1e-5)
 
+    def test_packed_voi_values(self):
+        # the packed gather and scatter of variables of interest give the same values as
+        # getting and setting each variable separately
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('p', om.IndepVarComp('x', np.arange(5.)), promotes=['*'])
+        model.add_subsystem('comp', om.ExecComp(['y = 2.0*x', 'z = sum(x**2)'],
+                                                x=np.ones(5), y=np.ones(5)), promotes=['*'])
+
+        model.add_design_var('x', indices=[0, 2, 4], lower=-10, upper=10, ref=3.0, ref0=1.0)
+        model.add_objective('z', adder=2.0)
+        model.add_constraint('y', indices=[1, 3], upper=20., scaler=np.array([2.0, 4.0]))
+        model.add_constraint('x', indices=[1], equals=1.)
+
+        prob.setup()
+        prob.run_model()
+
+        driver = prob.driver
+        for name, val in driver.get_design_var_values().items():
+            meta = driver._designvars[name]
+            assert_near_equal(val, driver._get_voi_val(name, meta, {}), 1e-15)
+        for name, val in driver.get_objective_values(driver_scaling=False).items():
+            meta = driver._objs[name]
+            assert_near_equal(val, driver._get_voi_val(name, meta, {}, driver_scaling=False),
+                              1e-15)
+        for ctype in ('all', 'eq', 'ineq'):
+            cons = driver.get_constraint_values(ctype=ctype)
+            self.assertEqual(len(cons), 2 if ctype == 'all' else 1)
+            for name, val in cons.items():
+                assert_near_equal(val, driver._get_voi_val(name, driver._cons[name], {}), 1e-15)
+
+        assert_near_equal(driver.get_objective_values()['comp.z'], 32.0, 1e-15)
+        assert_near_equal(driver.get_constraint_values()['comp.y'], [4.0, 24.0], 1e-15)
+
+        driver._set_design_var_array(np.array([1.0, 2.0, 3.0]))
+        assert_near_equal(prob['x'], [3.0, 1.0, 5.0, 3.0, 7.0], 1e-15)
+
+        x = driver.get_design_var_values()['p.x']
+        driver.set_design_var('p.x', x)
+        assert_near_equal(prob['x'], [3.0, 1.0, 5.0, 3.0, 7.0], 1e-15)
+
 
 class TestDriverFeature(unittest.TestCase):
 
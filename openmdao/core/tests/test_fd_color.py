@@ -154,6 +154,14 @@ _TOLS = {
     'cs': 1e-12,
 }
 
+def _dense_subjac(meta):
+    if meta['rows'] is None:
+        return meta['value']
+    subjac = np.zeros(meta['shape'])
+    subjac[meta['rows'], meta['cols']] = meta['value']
+    return subjac
+
+
 def _check_partial_matrix(system, jac, expected, method):
     blocks = []
     for of in system._var_allprocs_abs2meta['output']:
@@ -161,7 +169,7 @@ def _check_partial_matrix(system, jac, expected, method):
         for wrt in system._var_allprocs_abs2meta['input']:
             key = (of, wrt)
             if key in jac:
-                cblocks.append(jac[key]['value'])
+                cblocks.append(_dense_subjac(jac[key]))
         if cblocks:
             blocks.append(np.hstack(cblocks))
     fullJ = np.vstack(blocks)
@@ -633,6 +641,58 @@ class TestColoring(unittest.TestCase):
         jac = comp._jacobian._subjacs_info
         _check_partial_matrix(comp, jac, sparsity, method)
 
+    @parameterized.expand(itertools.product(
+        ['fd', 'cs'],
+        ), name_func=_test_func_name
+    )
+    def test_partials_explicit_sparse_subjacs(self, method):
+        prob = Problem(coloring_dir=self.tempdir)
+        model = prob.model
+
+        mask = np.array(
+                [[1, 0, 0, 1, 1, 1, 0],
+                 [0, 1, 0, 1, 0, 1, 0],
+                 [0, 1, 0, 1, 1, 1, 1],
+                 [1, 0, 0, 0, 0, 1, 0],
+                 [0, 0, 1, 0, 0, 0, 1]]
+            )
+
+        isplit = 2
+        sparsity = setup_sparsity(mask)
+        indeps, conns = setup_indeps(isplit, mask.shape[1], 'indeps', 'comp')
+
+        model.add_subsystem('indeps', indeps)
+        comp = model.add_subsystem('comp', SparseCompExplicit(sparsity, method,
+                                                              isplit=isplit, osplit=2))
+        comp.declare_coloring('x*', method=method)
+
+        for conn in conns:
+            model.connect(*conn)
+
+        prob.setup(check=False, mode='fwd')
+        prob.set_solver_print(level=0)
+        prob.run_model()
+
+        for i in range(2):
+            comp._linearize()
+
+            # colored subjacs only store their nonzeros
+            osizes, _ = evenly_distrib_idxs(2, mask.shape[0])
+            isizes, _ = evenly_distrib_idxs(isplit, mask.shape[1])
+            ostart = 0
+            for o, osz in enumerate(osizes):
+                istart = 0
+                for n, isz in enumerate(isizes):
+                    meta = comp._jacobian._subjacs_info['comp.y%d' % o, 'comp.x%d' % n]
+                    block = sparsity[ostart:ostart + osz, istart:istart + isz]
+                    self.assertEqual(meta['value'].shape, (np.count_nonzero(block),))
+                    assert_near_equal(meta['value'], block[meta['rows'], meta['cols']],
+                                      _TOLS[method])
+                    istart += isz
+                ostart += osz
+
+            _check_partial_matrix(comp, comp._jacobian._subjacs_info, sparsity, method)
+
     def test_partials_min_improvement(self):
         prob = Problem(coloring_dir=self.tempdir)
         model = prob.model
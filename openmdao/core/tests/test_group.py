@@ -14,7 +14,8 @@ except ImportError:
     from openmdao.utils.assert_utils import SkipParameterized as parameterized
 
 import openmdao.api as om
-from openmdao.test_suite.components.sellar import SellarDis2
+from openmdao.test_suite.components.sellar import SellarDis2, SellarDis1withDerivatives, \
+    SellarDis2withDerivatives
 from openmdao.utils.mpi import MPI, multi_proc_exception_check
 from openmdao.utils.assert_utils import assert_near_equal, assert_warning
 from openmdao.utils.logger_utils import TestLogger
@@ -1401,6 +1402,449 @@ class TestGroup(unittest.TestCase):
         prob.setup()
         prob.run_model()
 
+    def test_auto_order(self):
+        order_list = []
+        prob = om.Problem()
+        model = prob.model
+        model.options['auto_order'] = True
+
+        # added in the reverse of the dataflow order
+        model.add_subsystem('C3', ReportOrderComp(order_list))
+        model.add_subsystem('C2', ReportOrderComp(order_list))
+        model.add_subsystem('C1', ReportOrderComp(order_list))
+        model.connect('C1.y', 'C2.x')
+        model.connect('C2.y', 'C3.x')
+
+        prob.setup()
+        prob.run_model()
+
+        self.assertEqual(order_list, ['C1', 'C2', 'C3'])
+        self.assertEqual(model._auto_order_info, (['C3', 'C2', 'C1'], 2, ['C1', 'C2', 'C3'], 0))
+        self.assertEqual(list(model._var_allprocs_abs2meta['output']),
+                         ['_auto_ivc.v0', 'C1.y', 'C2.y', 'C3.y'])
+
+        # setting up again keeps the new order
+        order_list[:] = []
+        prob.setup()
+        prob.run_model()
+
+        self.assertEqual(order_list, ['C1', 'C2', 'C3'])
+
+    def test_auto_order_off(self):
+        order_list = []
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('C2', ReportOrderComp(order_list))
+        model.add_subsystem('C1', ReportOrderComp(order_list))
+        model.connect('C1.y', 'C2.x')
+
+        prob.setup()
+        prob.run_model()
+
+        self.assertEqual(order_list, ['C2', 'C1'])
+        self.assertIsNone(model._auto_order_info)
+
+    def _build_cycle(self, auto_order):
+        prob = om.Problem()
+        model = prob.model
+        model.options['auto_order'] = auto_order
+
+        # a -> b -> c -> d -> a, added so that 3 of the 4 connections are fed back
+        model.add_subsystem('d', om.ExecComp('y = 0.5 * x + 1.0'))
+        model.add_subsystem('c', om.ExecComp('y = 0.5 * x + 2.0'))
+        model.add_subsystem('b', om.ExecComp('y = 0.5 * x + 3.0'))
+        model.add_subsystem('a', om.ExecComp('y = 0.5 * x + 4.0'))
+        model.connect('a.y', 'b.x')
+        model.connect('b.y', 'c.x')
+        model.connect('c.y', 'd.x')
+        model.connect('d.y', 'a.x')
+
+        model.nonlinear_solver = om.NonlinearBlockGS(maxiter=100, atol=1e-12, rtol=1e-12)
+        model.linear_solver = om.LinearBlockGS(maxiter=100, atol=1e-12, rtol=1e-12)
+
+        prob.setup()
+        prob.set_solver_print(level=0)
+        prob.run_model()
+
+        return prob
+
+    def test_auto_order_cycle(self):
+        prob = self._build_cycle(False)
+        auto_prob = self._build_cycle(True)
+
+        model = auto_prob.model
+        old_order, old_feedback, new_order, new_feedback = model._auto_order_info
+        self.assertEqual(old_order, ['d', 'c', 'b', 'a'])
+        self.assertEqual(old_feedback, 3)
+        self.assertEqual(new_feedback, 1)
+        self.assertEqual([s.name for s in model._subsystems_myproc], new_order)
+
+        for name in ('a.y', 'b.y', 'c.y', 'd.y'):
+            assert_near_equal(auto_prob[name], prob[name], 1e-10)
+
+        self.assertLess(model.nonlinear_solver._iter_count,
+                        prob.model.nonlinear_solver._iter_count)
+
+        totals = prob.compute_totals('d.y', 'a.y')
+        auto_totals = auto_prob.compute_totals('d.y', 'a.y')
+        assert_near_equal(auto_totals['d.y', 'a.y'], totals['d.y', 'a.y'], 1e-10)
+
+    def test_auto_order_optimal(self):
+        order_list = []
+        prob = om.Problem()
+        model = prob.model
+        model.options['auto_order'] = True
+
+        model.add_subsystem('C1', ReportOrderComp(order_list))
+        model.add_subsystem('C2', ReportOrderComp(order_list))
+        model.add_subsystem('C3', ReportOrderComp(order_list))
+        model.connect('C1.y', 'C2.x')
+        model.connect('C2.y', 'C3.x')
+        model.connect('C3.y', 'C1.x')
+
+        prob.setup()
+        prob.run_model()
+
+        # every order of a simple cycle has one feedback connection, so the order is kept
+        self.assertEqual(order_list, ['C1', 'C2', 'C3'])
+        self.assertEqual(model._auto_order_info, (['C1', 'C2', 'C3'], 1, ['C1', 'C2', 'C3'], 1))
+
+    def test_auto_order_subgroup(self):
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('ivc', om.IndepVarComp('x', 3.0))
+        sub = model.add_subsystem('sub', om.Group(auto_order=True))
+        sub.add_subsystem('C2', om.ExecComp('y = 3.0 * x'))
+        sub.add_subsystem('C1', om.ExecComp('y = 2.0 * x'))
+        sub.connect('C1.y', 'C2.x')
+        model.connect('ivc.x', 'sub.C1.x')
+
+        prob.setup()
+        prob.run_model()
+
+        self.assertEqual([s.name for s in sub._subsystems_myproc], ['C1', 'C2'])
+        self.assertIsNone(model._auto_order_info)
+        assert_near_equal(prob['sub.C2.y'], 18.0)
+
+        totals = prob.compute_totals('sub.C2.y', 'ivc.x')
+        assert_near_equal(totals['sub.C2.y', 'ivc.x'], [[6.0]])
+
+    def test_auto_order_check_config(self):
+        prob = om.Problem()
+        model = prob.model
+
+        sub = model.add_subsystem('sub', om.Group(auto_order=True))
+        sub.add_subsystem('C2', om.ExecComp('y = 3.0 * x'))
+        sub.add_subsystem('C1', om.ExecComp('y = 2.0 * x'))
+        sub.connect('C1.y', 'C2.x')
+
+        testlogger = TestLogger()
+        prob.setup(check=['auto_order'], logger=testlogger)
+        prob.final_setup()
+
+        expected = ("The following groups were ordered automatically:\n"
+                    "   Group 'sub' was reordered to ['C1', 'C2'], with 0 feedback connection(s) "
+                    "instead of 1.\n")
+        self.assertEqual(testlogger.get('info')[1], expected)
+
+
+class TestPartitionCycles(unittest.TestCase):
+
+    def _build_sellar(self, partition):
+        prob = om.Problem()
+        model = prob.model
+        model.options['partition_cycles'] = partition
+
+        model.add_subsystem('px', om.IndepVarComp('x', 1.0), promotes=['x'])
+        model.add_subsystem('pz', om.IndepVarComp('z', np.array([5.0, 2.0])), promotes=['z'])
+        model.add_subsystem('obj_cmp', om.ExecComp('obj = x**2 + z[1] + y1 + exp(-y2)',
+                                                   z=np.array([0.0, 0.0]), x=0.0),
+                            promotes=['obj', 'x', 'z', 'y1', 'y2'])
+        model.add_subsystem('d1', SellarDis1withDerivatives(), promotes=['x', 'z', 'y1', 'y2'])
+        model.add_subsystem('d2', SellarDis2withDerivatives(), promotes=['z', 'y1', 'y2'])
+        model.add_subsystem('con1', om.ExecComp('c1 = 3.16 - y1'), promotes=['c1', 'y1'])
+
+        if not partition:
+            model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False)
+            model.linear_solver = om.DirectSolver()
+
+        prob.setup()
+        prob.set_solver_print(level=0)
+        prob.run_model()
+
+        return prob
+
+    def test_sellar(self):
+        prob = self._build_sellar(False)
+        part_prob = self._build_sellar(True)
+
+        model = part_prob.model
+        self.assertEqual(list(model._subsystems_allprocs),
+                         ['px', 'pz', '_cycle0', 'obj_cmp', 'con1'])
+        self.assertIsInstance(model.nonlinear_solver, om.NonlinearRunOnce)
+
+        cycle = model._get_subsystem('_cycle0')
+        self.assertEqual([s.pathname for s in cycle._subsystems_myproc],
+                         ['_cycle0.d1', '_cycle0.d2'])
+        self.assertIsInstance(cycle.nonlinear_solver, om.NewtonSolver)
+        self.assertIsInstance(cycle.linear_solver, om.DirectSolver)
+
+        # promoted names are the same
+        for name in ('y1', 'y2', 'obj', 'c1'):
+            assert_near_equal(part_prob[name], prob[name], 1e-8)
+
+        totals = prob.compute_totals(['obj', 'c1'], ['x', 'z'])
+        part_totals = part_prob.compute_totals(['obj', 'c1'], ['x', 'z'])
+        for key, val in totals.items():
+            assert_near_equal(part_totals[key], val, 1e-8)
+
+        # setting up again gives the same model
+        part_prob.setup()
+        part_prob.run_model()
+
+        self.assertEqual(list(model._subsystems_allprocs),
+                         ['px', 'pz', '_cycle0', 'obj_cmp', 'con1'])
+        assert_near_equal(part_prob['obj'], prob['obj'], 1e-8)
+
+    def _build_two_cycles(self, partition, **options):
+        prob = om.Problem()
+        model = prob.model
+
+        # f <- (d <-> e) <- c <- (a <-> b) <- ivc, added in no particular order
+        model.add_subsystem('f', om.ExecComp('y = 2.0 * x'))
+        model.add_subsystem('e', om.ExecComp('y = 0.5 * x1 + 0.25 * x2'))
+        model.add_subsystem('a', om.ExecComp('y = 0.5 * x1 + 0.5 * x2'))
+        model.add_subsystem('c', om.ExecComp('y = 3.0 * x'))
+        model.add_subsystem('ivc', om.IndepVarComp('x', 2.0))
+        model.add_subsystem('d', om.ExecComp('y = -0.5 * x + 1.0'))
+        model.add_subsystem('b', om.ExecComp('y = 0.25 * x + 1.0'))
+
+        model.connect('ivc.x', 'a.x1')
+        model.connect('a.y', 'b.x')
+        model.connect('b.y', 'a.x2')
+        model.connect('b.y', 'c.x')
+        model.connect('c.y', 'e.x1')
+        model.connect('e.y', 'd.x')
+        model.connect('d.y', 'e.x2')
+        model.connect('e.y', 'f.x')
+
+        if partition:
+            model.options['partition_cycles'] = True
+            model.options.update(options)
+        else:
+            model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False)
+            model.linear_solver = om.DirectSolver()
+
+        prob.setup()
+        prob.set_solver_print(level=0)
+        prob.run_model()
+
+        return prob
+
+    def test_two_cycles(self):
+        prob = self._build_two_cycles(False)
+        part_prob = self._build_two_cycles(True)
+
+        model = part_prob.model
+        self.assertEqual(list(model._subsystems_allprocs),
+                         ['ivc', '_cycle0', 'c', '_cycle1', 'f'])
+        self.assertEqual([s.name for s in model._get_subsystem('_cycle0')._subsystems_myproc],
+                         ['a', 'b'])
+        self.assertEqual([s.name for s in model._get_subsystem('_cycle1')._subsystems_myproc],
+                         ['e', 'd'])
+
+        for name in ('a.y', 'b.y', 'c.y', 'd.y', 'e.y', 'f.y'):
+            assert_near_equal(part_prob[name], prob[name], 1e-8)
+
+        totals = prob.compute_totals('f.y', 'ivc.x')
+        part_totals = part_prob.compute_totals('f.y', 'ivc.x')
+        assert_near_equal(part_totals['f.y', 'ivc.x'], totals['f.y', 'ivc.x'], 1e-8)
+
+    def test_solver_options(self):
+        prob = self._build_two_cycles(False)
+        part_prob = self._build_two_cycles(
+            True,
+            cycle_nonlinear_solver=lambda: om.NonlinearBlockGS(maxiter=100, atol=1e-12,
+                                                               rtol=1e-12),
+            cycle_linear_solver=om.ScipyKrylov)
+
+        for name in ('_cycle0', '_cycle1'):
+            cycle = part_prob.model._get_subsystem(name)
+            self.assertIsInstance(cycle.nonlinear_solver, om.NonlinearBlockGS)
+            self.assertIsInstance(cycle.linear_solver, om.ScipyKrylov)
+
+        # each cycle has its own solver instances
+        self.assertIsNot(part_prob.model._get_subsystem('_cycle0').nonlinear_solver,
+                         part_prob.model._get_subsystem('_cycle1').nonlinear_solver)
+
+        assert_near_equal(part_prob['f.y'], prob['f.y'], 1e-8)
+
+        totals = prob.compute_totals('f.y', 'ivc.x')
+        part_totals = part_prob.compute_totals('f.y', 'ivc.x')
+        assert_near_equal(part_totals['f.y', 'ivc.x'], totals['f.y', 'ivc.x'], 1e-8)
+
+    def test_no_cycles(self):
+        prob = om.Problem()
+        model = prob.model
+        model.options['partition_cycles'] = True
+
+        model.add_subsystem('C2', om.ExecComp('y = 3.0 * x'))
+        model.add_subsystem('C1', om.ExecComp('y = 2.0 * x'))
+        model.connect('C1.y', 'C2.x')
+
+        prob.setup()
+        prob.run_model()
+
+        # the order isn't changed unless there are cycles
+        self.assertEqual(list(model._subsystems_allprocs), ['_auto_ivc', 'C2', 'C1'])
+
+    def test_nested(self):
+        def build(partition):
+            prob = om.Problem()
+            model = prob.model
+            model.options['partition_cycles'] = partition
+
+            # a cycle between sub and c, with another cycle inside of sub
+            sub = model.add_subsystem('sub', om.Group(partition_cycles=partition))
+            sub.add_subsystem('a', om.ExecComp('y = 0.5 * x1 + 0.25 * x2 + 0.25 * x3'))
+            sub.add_subsystem('b', om.ExecComp('y = -0.5 * x + 1.0'))
+            sub.connect('a.y', 'b.x')
+            sub.connect('b.y', 'a.x2')
+
+            model.add_subsystem('ivc', om.IndepVarComp('x', 2.0))
+            model.add_subsystem('c', om.ExecComp('y = 0.5 * x + 1.0'))
+            model.connect('ivc.x', 'sub.a.x1')
+            model.connect('sub.b.y', 'c.x')
+            model.connect('c.y', 'sub.a.x3')
+
+            if not partition:
+                model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False)
+                model.linear_solver = om.DirectSolver()
+
+            prob.setup()
+            prob.set_solver_print(level=0)
+            prob.run_model()
+
+            return prob
+
+        prob = build(False)
+        part_prob = build(True)
+
+        model = part_prob.model
+        self.assertEqual(list(model._subsystems_allprocs), ['ivc', '_cycle0'])
+        self.assertEqual(list(model._get_subsystem('_cycle0.sub')._subsystems_allprocs),
+                         ['_cycle0'])
+        self.assertEqual([s.pathname for s in model.system_iter(recurse=True, typ=om.ExecComp)],
+                         ['_cycle0.sub._cycle0.a', '_cycle0.sub._cycle0.b', '_cycle0.c'])
+
+        for name in ('sub.a.y', 'sub.b.y', 'c.y'):
+            assert_near_equal(part_prob[name], prob[name], 1e-8)
+
+        totals = prob.compute_totals('c.y', 'ivc.x')
+        part_totals = part_prob.compute_totals('c.y', 'ivc.x')
+        assert_near_equal(part_totals['c.y', 'ivc.x'], totals['c.y', 'ivc.x'], 1e-8)
+
+    def test_nested_built_twice(self):
+        counts = {}
+
+        class CountingGroup(om.Group):
+            def setup(self):
+                counts[self.name] = counts.get(self.name, 0) + 1
+                super().setup()
+
+        prob = om.Problem()
+        model = prob.model
+        model.options['partition_cycles'] = True
+
+        sub = model.add_subsystem('sub', CountingGroup(partition_cycles=True))
+        sub.add_subsystem('a', om.ExecComp('y = 0.5 * x1 + 0.5 * x2'))
+        sub.add_subsystem('b', om.ExecComp('y = -0.5 * x + 1.0'))
+        sub.connect('a.y', 'b.x')
+        sub.connect('b.y', 'a.x1')
+
+        model.add_subsystem('c', om.ExecComp('y = 0.5 * x + 1.0'))
+        model.connect('sub.b.y', 'c.x')
+        model.connect('c.y', 'sub.a.x2')
+
+        prob.setup()
+
+        # the cycles of both groups are all found the first time the hierarchy is built, even
+        # though sub is moved into a new group, so setup is only called once more
+        self.assertEqual(counts, {'sub': 2})
+        self.assertEqual([s.pathname for s in model.system_iter(recurse=True, typ=om.ExecComp)],
+                         ['_cycle0.sub._cycle0.a', '_cycle0.sub._cycle0.b', '_cycle0.c'])
+        self.assertEqual(prob._metadata['cycle_partitions'], {})
+
+    def test_created_in_setup(self):
+        from openmdao.test_suite.components.sellar import SellarDis1withDerivatives, \
+            SellarDis2withDerivatives
+
+        counts = {'setup': 0, 'configure': 0}
+
+        class Cyc(om.Group):
+            def initialize(self):
+                self.options['partition_cycles'] = True
+
+            def setup(self):
+                counts['setup'] += 1
+                self.add_subsystem('px', om.IndepVarComp('x', 1.0), promotes=['x'])
+                self.add_subsystem('pz', om.IndepVarComp('z', np.array([5.0, 2.0])),
+                                   promotes=['z'])
+                self.add_subsystem('d1', SellarDis1withDerivatives(),
+                                   promotes=['x', 'z', 'y1', 'y2'])
+                self.add_subsystem('d2', SellarDis2withDerivatives(), promotes=['z', 'y1', 'y2'])
+
+            def configure(self):
+                counts['configure'] += 1
+
+        class Outer(om.Group):
+            def setup(self):
+                self.add_subsystem('cyc', Cyc())
+
+        prob = om.Problem()
+        prob.model.add_subsystem('outer', Outer())
+        prob.setup()
+        prob.run_model()
+
+        # the groups are new instances when the hierarchy is built again
+        self.assertEqual(list(prob.model.outer.cyc._subsystems_allprocs), ['px', 'pz', '_cycle0'])
+        assert_near_equal(prob['outer.cyc.y1'], 25.58830237, 1e-6)
+        assert_near_equal(prob['outer.cyc.y2'], 12.05848815, 1e-6)
+
+        # setup and configure are called again when the hierarchy is built again
+        self.assertEqual(counts, {'setup': 2, 'configure': 2})
+
+    def test_not_found_again(self):
+        class Cyc(om.Group):
+            def initialize(self):
+                self.options['partition_cycles'] = True
+
+            def setup(self):
+                self.add_subsystem('a', om.ExecComp('y = 0.5 * x + 1.0'))
+                self.add_subsystem('b', om.ExecComp('y = -0.5 * x + 1.0'))
+                self.connect('a.y', 'b.x')
+                self.connect('b.y', 'a.x')
+
+        class Outer(om.Group):
+            count = 0
+
+            def setup(self):
+                # a differently named subsystem each time it's set up
+                self.add_subsystem('cyc%d' % Outer.count, Cyc())
+                Outer.count += 1
+
+        prob = om.Problem()
+        prob.model.add_subsystem('outer', Outer())
+
+        with self.assertRaises(RuntimeError) as cm:
+            prob.setup()
+
+        self.assertEqual(str(cm.exception),
+                         "<model> <class Group>: The cycles of the following groups could not be "
+                         "moved into new groups because the groups weren't found when the model "
+                         "was built again: ['outer.cyc0']")
 
 @unittest.skipUnless(MPI, "MPI is required.")
 class TestGroupMPISlice(unittest.TestCase):
@@ -3563,6 +4007,81 @@ class TestFeatureSetOrder(unittest.TestCase):
 
         self.assertEqual(order_list, ['C2', 'C1', 'C3'])
 
+    def test_auto_order(self):
+        import openmdao.api as om
+
+        class ReportOrderComp(om.ExplicitComponent):
+            """Adds name to list."""
+
+            def __init__(self, order_list):
+                super().__init__()
+                self._order_list = order_list
+
+            def setup(self):
+                self.add_input('x', 0.0)
+                self.add_output('y', 0.0)
+
+            def compute(self, inputs, outputs):
+                self._order_list.append(self.pathname)
+                outputs['y'] = 0.5 * inputs['x'] + 1.0
+
+        order_list = []
+
+        prob = om.Problem()
+        model = prob.model
+
+        # the subsystems are added in the reverse of their data flow order
+        model.add_subsystem('C3', ReportOrderComp(order_list))
+        model.add_subsystem('C2', ReportOrderComp(order_list))
+        model.add_subsystem('C1', ReportOrderComp(order_list))
+        model.connect('C1.y', 'C2.x')
+        model.connect('C2.y', 'C3.x')
+
+        # reorder them at setup so that each one runs after the one it depends on
+        model.options['auto_order'] = True
+
+        prob.setup()
+        prob.run_model()
+
+        self.assertEqual(order_list, ['C1', 'C2', 'C3'])
+        assert_near_equal(prob['C3.y'], 1.75)
+
+
+class TestFeaturePartitionCycles(unittest.TestCase):
+
+    def test_partition_cycles(self):
+        import numpy as np
+
+        import openmdao.api as om
+        from openmdao.test_suite.components.sellar import SellarDis1withDerivatives, \
+            SellarDis2withDerivatives
+
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('px', om.IndepVarComp('x', 1.0), promotes=['x'])
+        model.add_subsystem('pz', om.IndepVarComp('z', np.array([5.0, 2.0])), promotes=['z'])
+        model.add_subsystem('obj_cmp', om.ExecComp('obj = x**2 + z[1] + y1 + exp(-y2)',
+                                                   z=np.array([0.0, 0.0]), x=0.0),
+                            promotes=['obj', 'x', 'z', 'y1', 'y2'])
+        model.add_subsystem('d1', SellarDis1withDerivatives(), promotes=['x', 'z', 'y1', 'y2'])
+        model.add_subsystem('d2', SellarDis2withDerivatives(), promotes=['z', 'y1', 'y2'])
+        model.add_subsystem('con1', om.ExecComp('c1 = 3.16 - y1'), promotes=['c1', 'y1'])
+
+        # move d1 and d2, which form a cycle, into a group with a Newton solver at setup
+        model.options['partition_cycles'] = True
+
+        prob.setup()
+        prob.run_model()
+
+        assert_near_equal(prob['y1'], 25.58830237, 1e-6)
+        assert_near_equal(prob['y2'], 12.05848815, 1e-6)
+        assert_near_equal(prob['obj'], 28.58830816, 1e-6)
+
+        self.assertEqual([s.pathname for s in model.system_iter(recurse=True)],
+                         ['px', 'pz', '_cycle0', '_cycle0.d1', '_cycle0.d2',
+                          'obj_cmp', 'con1'])
+
 
 class TestFeatureGetSubsystem(unittest.TestCase):
 
@@ -29,6 +29,7 @@ from openmdao.test_suite.groups.parallel_groups import \
 
 from openmdao.utils.assert_utils import assert_near_equal
 from openmdao.utils.logger_utils import TestLogger
+from openmdao.utils.testing_utils import use_tempdirs
 from openmdao.error_checking.check_config import _default_checks
 
 
@@ -466,6 +467,97 @@ class TestParallelJacBug(unittest.TestCase):
         self.assertLess(np.max(np.abs(J2 - Jsave)), 1e-20)
 
 
+class BarrierComp(om.ExplicitComponent):
+    """Component that can only finish its computations while its siblings run concurrently."""
+
+    def initialize(self):
+        self.options.declare('barrier')
+        self.options.declare('mult', default=1.0)
+
+    def setup(self):
+        self.add_input('x', 1.0)
+        self.add_output('y', 1.0)
+        self.declare_partials('y', 'x')
+
+    def compute(self, inputs, outputs):
+        self.options['barrier'].wait()
+        outputs['y'] = self.options['mult'] * inputs['x']
+
+    def compute_partials(self, inputs, partials):
+        self.options['barrier'].wait()
+        partials['y', 'x'] = self.options['mult']
+
+
+@use_tempdirs
+class TestParallelGroupThreads(unittest.TestCase):
+
+    def test_concurrent(self):
+        import threading
+
+        barrier = threading.Barrier(3, timeout=10.)
+
+        prob = om.Problem()
+        model = prob.model
+        model.add_subsystem('iv', om.IndepVarComp('x', 2.0))
+        par = model.add_subsystem('par', om.ParallelGroup(num_threads=3))
+        for i in range(3):
+            par.add_subsystem('c%d' % i, BarrierComp(barrier=barrier, mult=i + 1.))
+            model.connect('iv.x', 'par.c%d.x' % i)
+
+        for mode in ('fwd', 'rev'):
+            prob.setup(mode=mode)
+            prob.run_model()
+            model.run_apply_nonlinear()
+
+            of = ['par.c%d.y' % i for i in range(3)]
+            J = prob.compute_totals(of, ['iv.x'], return_format='array')
+
+            assert_near_equal(prob.get_val('par.c2.y'), 6.0)
+            assert_near_equal(J, np.array([[1.], [2.], [3.]]))
+
+        self.assertFalse(barrier.broken)
+
+    @parameterized.expand([(FanOutGrouped, ), (FanInGrouped2, ), (Diamond, ), (ConvergeDiverge, )],
+                          name_func=_test_func_name)
+    def test_same_results(self, model_class):
+        results = []
+        for num_threads in (1, 2):
+            prob = om.Problem(model_class())
+            for sub in prob.model.system_iter(recurse=True, typ=om.ParallelGroup):
+                sub.options['num_threads'] = num_threads
+
+            prob.model.nonlinear_solver = om.NonlinearBlockGS(atol=1e-12, rtol=1e-12)
+            prob.setup(check=False)
+            prob.set_solver_print(level=0)
+            prob.run_model()
+
+            of = [n for n, _ in prob.model.list_outputs(out_stream=None)
+                  if not n.startswith(('iv', 'p1', 'p2'))]
+            wrt = [n for n, _ in prob.model.list_outputs(out_stream=None)
+                   if n.startswith(('iv', 'p1', 'p2'))]
+
+            results.append((prob.model._outputs.asarray().copy(),
+                            prob.compute_totals(of, wrt, return_format='array')))
+
+        assert_near_equal(results[1][0], results[0][0], 1e-12)
+        assert_near_equal(results[1][1], results[0][1], 1e-12)
+
+    def test_recording_error(self):
+        prob = om.Problem(FanOutGrouped())
+        prob.model.sub.options['num_threads'] = 2
+        prob.model.sub.c2.add_recorder(om.SqliteRecorder('cases.sql', record_viewer_data=False))
+
+        prob.setup(check=False)
+
+        with self.assertRaises(RuntimeError) as cm:
+            prob.final_setup()
+
+        self.assertEqual(str(cm.exception),
+                         "'sub' <class ParallelGroup>: Can't record cases of 'sub.c2' "
+                         "<class ExecComp> because it runs in a thread when num_threads is more "
+                         "than 1.")
+
+
 if __name__ == "__main__":
     from openmdao.utils.mpi import mpirun_tests
     mpirun_tests()
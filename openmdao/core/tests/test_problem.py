@@ -447,6 +447,34 @@ class TestProblem(unittest.TestCase):
         assert_near_equal(derivs['f_xy']['x'], [[-6.0]], 1e-6)
         assert_near_equal(derivs['f_xy']['y'], [[8.0]], 1e-6)
 
+    @parameterized.expand(itertools.product(['fwd', 'rev'], [False, True]))
+    def test_compute_totals_return_coo(self, mode, driver_scaling):
+        # Make sure 'coo' return_format gives the same values as 'array'.
+        from scipy.sparse import coo_matrix
+
+        prob = om.Problem(SellarDerivatives())
+        model = prob.model
+        model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False)
+        model.linear_solver = om.DirectSolver()
+
+        model.add_design_var('x', lower=0.0, upper=10.0, ref=3.0)
+        model.add_design_var('z', lower=np.array([-10.0, 0.0]), upper=np.array([10.0, 10.0]),
+                             ref=2.0)
+        model.add_objective('obj', ref=5.0)
+        model.add_constraint('con1', upper=0.0, scaler=0.5)
+        model.add_constraint('con2', upper=0.0)
+
+        prob.setup(check=False, mode=mode)
+        prob.set_solver_print(level=0)
+        prob.run_model()
+
+        expected = prob.compute_totals(return_format='array', driver_scaling=driver_scaling)
+        derivs = prob.compute_totals(return_format='coo', driver_scaling=driver_scaling)
+
+        self.assertIsInstance(derivs, coo_matrix)
+        self.assertEqual(derivs.shape, expected.shape)
+        assert_near_equal(derivs.toarray(), expected, 1e-12)
+
     def test_compute_totals_no_args_no_desvar(self):
         p = om.Problem()
 
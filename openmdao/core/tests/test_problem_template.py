@@ -0,0 +1,231 @@
+""" Unit tests for ProblemTemplate and Problem.clone."""
+
+import os
+import pickle
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+import openmdao.api as om
+from openmdao.test_suite.components.paraboloid import Paraboloid
+from openmdao.test_suite.components.sellar import SellarDerivatives
+from openmdao.utils.assert_utils import assert_near_equal, assert_check_partials
+
+
+class UnpicklableComp(om.ExplicitComponent):
+
+    def setup(self):
+        self.add_input('x', 1.0)
+        self.add_output('y', 1.0)
+        self._func = lambda x: 2.0 * x
+
+    def compute(self, inputs, outputs):
+        outputs['y'] = self._func(inputs['x'])
+
+
+def _build_sellar():
+    prob = om.Problem(SellarDerivatives())
+    model = prob.model
+    model.nonlinear_solver = om.NewtonSolver(solve_subsystems=False)
+    model.linear_solver = om.DirectSolver()
+
+    model.add_design_var('x', lower=0.0, upper=10.0)
+    model.add_design_var('z', lower=np.array([-10.0, 0.0]), upper=np.array([10.0, 10.0]),
+                         ref=2.0)
+    model.add_objective('obj')
+    model.add_constraint('con1', upper=0.0)
+    model.add_constraint('con2', upper=0.0)
+
+    prob.driver = om.ScipyOptimizeDriver(optimizer='SLSQP', tol=1e-9, disp=False)
+    prob.set_solver_print(level=0)
+
+    return prob
+
+
+class TestProblemTemplate(unittest.TestCase):
+
+    def setUp(self):
+        self.startdir = os.getcwd()
+        self.tempdir = tempfile.mkdtemp(prefix='TestProblemTemplate-')
+        os.chdir(self.tempdir)
+
+    def tearDown(self):
+        os.chdir(self.startdir)
+        try:
+            shutil.rmtree(self.tempdir)
+        except OSError:
+            pass
+
+    def test_clone_optimization(self):
+        prob = _build_sellar()
+        prob.setup()
+
+        clone = prob.clone()
+        clone.run_driver()
+
+        # running the copy doesn't change the original
+        assert_near_equal(prob['x'], 1.0)
+        assert_near_equal(prob['z'], [5.0, 2.0])
+        self.assertEqual(prob.model.nonlinear_solver._iter_count, 0)
+
+        prob.run_driver()
+
+        assert_near_equal(clone['obj'], 3.18339395, 1e-6)
+        for name in ('x', 'z', 'y1', 'y2', 'obj'):
+            assert_near_equal(clone[name], prob[name], 1e-10)
+
+    def test_independent_copies(self):
+        prob = om.Problem()
+        prob.model.add_subsystem('p', Paraboloid(), promotes=['*'])
+        prob.model.add_design_var('x', lower=-50, upper=50)
+        prob.model.add_design_var('y', lower=-50, upper=50)
+        prob.model.add_objective('f_xy')
+        prob.setup()
+        prob.set_val('x', 3.0)
+
+        template = om.ProblemTemplate(prob)
+        copies = [template.create() for i in range(3)]
+
+        for i, copy in enumerate(copies):
+            # values are those of the Problem when the template was created
+            assert_near_equal(copy['x'], 3.0)
+
+            self.assertIs(copy.model._outputs._system(), copy.model)
+            self.assertIs(copy.model.p._outputs._system(), copy.model.p)
+            self.assertIs(copy.driver._problem(), copy)
+
+            copy.set_val('y', float(i))
+            copy.run_model()
+
+            # views of subsystem vectors still share the root vector data
+            self.assertEqual(copy.model.p._inputs._views['p.y'][0], float(i))
+            self.assertEqual(copy.model._outputs._data[1], float(i))
+
+        for i, copy in enumerate(copies):
+            assert_near_equal(copy['f_xy'], (3.0 - 3.0)**2 + 3.0 * i + (i + 4.0)**2 - 3.0)
+            totals = copy.compute_totals(['f_xy'], ['x', 'y'], return_format='array')
+            assert_near_equal(totals, [[2.0 * (3.0 - 3.0) + i, 3.0 + 2.0 * (i + 4.0)]])
+
+        self.assertEqual(prob['y'], 0.0)
+
+    def test_pickled_template(self):
+        prob = _build_sellar()
+        prob.setup()
+        prob.run_model()
+
+        template = pickle.loads(pickle.dumps(om.ProblemTemplate(prob)))
+
+        copy = template.create()
+        assert_near_equal(copy['obj'], prob['obj'], 1e-10)
+
+        copy.run_driver()
+        assert_near_equal(copy['obj'], 3.18339395, 1e-6)
+
+    def test_exec_comp(self):
+        prob = om.Problem()
+        prob.model.add_subsystem('comp', om.ExecComp(['y1 = 2.0*x**2 + z',
+                                                      'y2 = sin(x) * z'],
+                                                     x=np.ones(3), y1=np.ones(3),
+                                                     y2=np.ones(3)))
+        prob.setup(force_alloc_complex=True)
+        prob.set_val('comp.x', [1.0, 2.0, 3.0])
+        prob.set_val('comp.z', 2.0)
+
+        copy = prob.clone()
+        copy.run_model()
+
+        assert_near_equal(copy['comp.y1'], [4.0, 10.0, 20.0], 1e-10)
+        assert_near_equal(copy['comp.y2'], np.sin([1.0, 2.0, 3.0]) * 2.0, 1e-10)
+
+        data = copy.check_partials(method='cs', out_stream=None)
+        assert_check_partials(data)
+
+    def test_exec_comp_pickled(self):
+        prob = om.Problem()
+        comp = prob.model.add_subsystem('comp', om.ExecComp(['y1 = sin(x) + 1.0',
+                                                             'y2 = sin(x) * 2.0'],
+                                                            x=np.ones(3), y1=np.ones(3),
+                                                            y2=np.ones(3)))
+        prob.setup()
+        prob.set_val('comp.x', [1.0, 2.0, 3.0])
+
+        func = comp._func
+        template = pickle.loads(pickle.dumps(om.ProblemTemplate(prob)))
+
+        # pickling doesn't change the component
+        self.assertIs(comp._func, func)
+        self.assertEqual(set(func.__dict__), set())
+
+        copy = template.create()
+        self.assertIsNot(copy.model.comp._func, func)
+
+        copy.run_model()
+        assert_near_equal(copy['comp.y1'], np.sin([1.0, 2.0, 3.0]) + 1.0, 1e-10)
+        assert_near_equal(copy['comp.y2'], np.sin([1.0, 2.0, 3.0]) * 2.0, 1e-10)
+
+    def test_recorders_not_copied(self):
+        prob = _build_sellar()
+        recorder = om.SqliteRecorder('cases.sql')
+        prob.driver.add_recorder(recorder)
+        prob.setup()
+        prob.final_setup()
+
+        copy = prob.clone()
+        self.assertEqual(len(copy.driver._rec_mgr._recorders), 0)
+        copy.run_driver()
+
+        prob.run_driver()
+        prob.cleanup()
+
+        cr = om.CaseReader('cases.sql')
+        self.assertEqual(len(cr.list_cases('driver', recurse=False, out_stream=None)),
+                         prob.driver.iter_count)
+
+    def test_errors(self):
+        prob = om.Problem()
+        prob.model.add_subsystem('comp', Paraboloid())
+
+        with self.assertRaises(RuntimeError) as cm:
+            om.ProblemTemplate(prob)
+
+        self.assertEqual(str(cm.exception),
+                         "Problem: setup() must be called before creating a ProblemTemplate.")
+
+        prob = om.Problem()
+        prob.model.add_subsystem('comp', UnpicklableComp())
+        prob.setup()
+
+        with self.assertRaises(RuntimeError) as cm:
+            prob.clone()
+
+        self.assertTrue(str(cm.exception).startswith(
+            "Problem: Can't create a ProblemTemplate because the Problem can't be copied:"))
+
+
+class TestProblemTemplateFeature(unittest.TestCase):
+
+    def test_feature_template(self):
+        import openmdao.api as om
+        from openmdao.test_suite.components.paraboloid import Paraboloid
+
+        prob = om.Problem()
+        prob.model.add_subsystem('comp', Paraboloid(), promotes=['*'])
+        prob.setup()
+
+        template = om.ProblemTemplate(prob)
+
+        results = []
+        for x in [0.0, 1.0, 2.0]:
+            copy = template.create()
+            copy.set_val('x', x)
+            copy.set_val('y', -4.0)
+            copy.run_model()
+            results.append(copy.get_val('f_xy')[0])
+
+        assert_near_equal(results, [6.0, -3.0, -10.0], 1e-10)
+
+
+if __name__ == "__main__":
+    unittest.main()
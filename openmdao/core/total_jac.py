@@ -9,7 +9,11 @@ import sys
 import time
 
 import numpy as np
+from scipy.sparse import coo_matrix
 
+from openmdao.approximation_schemes.complex_step import ComplexStep
+from openmdao.approximation_schemes.finite_difference import FiniteDifference, \
+    _generate_fd_coeff, DEFAULT_ORDER
 from openmdao.core.constants import INT_DTYPE
 from openmdao.utils.general_utils import ContainsAll, simple_warning, prom2ivc_src_dict
 
@@ -109,7 +113,8 @@ class _TotalJacInfo(object):
             If True, names in of and wrt are absolute names.
         return_format : str
             Indicates the desired return format of the total jacobian. Can have value of
-            'array', 'dict', or 'flat_dict'.
+            'array', 'dict', 'flat_dict', or 'coo'.  If 'coo', the dense total jacobian is never
+            allocated.
         approx : bool
             If True, the object will compute approx total jacobians.
         debug_print : bool
@@ -280,9 +285,20 @@ class _TotalJacInfo(object):
         self.of_meta, self.of_size = self._get_tuple_map(of, responses, abs2meta_out)
         self.wrt_meta, self.wrt_size = self._get_tuple_map(wrt, design_vars, abs2meta_out)
 
-        # always allocate a 2D dense array and we can assign views to dict keys later if
-        # return format is 'dict' or 'flat_dict'.
-        self.J = J = np.zeros((self.of_size, self.wrt_size))
+        self.streaming = return_format == 'coo'
+        if self.streaming:
+            if approx:
+                raise RuntimeError("The 'coo' return format isn't supported when approximating "
+                                   "total derivatives.")
+            if self.comm.size > 1:
+                raise RuntimeError("The 'coo' return format isn't supported under MPI.")
+            # collect the values computed by each linear solve instead of storing them in a
+            # dense array
+            self.J = J = _TotalJacValues((self.of_size, self.wrt_size))
+        else:
+            # always allocate a 2D dense array and we can assign views to dict keys later if
+            # return format is 'dict' or 'flat_dict'.
+            self.J = J = np.zeros((self.of_size, self.wrt_size))
 
         # create scratch array for jac scatters
         self.jac_scratch = None
@@ -315,7 +331,9 @@ class _TotalJacInfo(object):
                 self._compute_jac_scatters('rev', J.shape[1])
 
         # for dict type return formats, map var names to views of the Jacobian array.
-        if return_format == 'array':
+        if self.streaming:
+            self.J_final = self.J_dict = None
+        elif return_format == 'array':
             self.J_final = J
             if self.has_scaling or approx:
                 # for array return format, create a 'dict' view for scaling or FD, since
@@ -1338,14 +1356,14 @@ class _TotalJacInfo(object):
         for matmat_idxs in inds:
             self.matmat_jac_setter(matmat_idxs, mode)
 
-    def compute_totals(self):
+    def _solve_iter(self):
         """
-        Compute derivatives of desired quantities with respect to desired inputs.
+        Linearize the model, then solve for each column (fwd) or row (rev) of the jacobian.
 
-        Returns
-        -------
-        derivs : object
-            Derivatives in form requested by 'return_format'.
+        Yields
+        ------
+        None
+            Yields after the results of each linear solve have been set into the jacobian.
         """
         debug_print = self.debug_print
         par_deriv = self.par_deriv
@@ -1419,11 +1437,179 @@ class _TotalJacInfo(object):
 
                     jac_setter(inds, mode)
 
+                    yield
+
+    def compute_totals_iter(self):
+        """
+        Compute the total jacobian one linear solve at a time without storing it.
+
+        This requires the 'coo' return format.  When a total coloring is active, only the
+        nonzeros of the coloring are computed.
+
+        Yields
+        ------
+        ndarray of int
+            Row indices of the values computed by a linear solve.
+        ndarray of int
+            Column indices of the values computed by a linear solve.
+        ndarray
+            The nonzero values computed by a linear solve.
+        """
+        if not self.streaming:
+            raise RuntimeError("compute_totals_iter requires the 'coo' return format.")
+
+        if self.has_scaling:
+            of_scale, wrt_scale = self._get_driver_scalers()
+
+        for _ in self._solve_iter():
+            rows, cols, data = self.J.pop()
+            nz = np.nonzero(data)[0]
+            rows, cols, data = rows[nz], cols[nz], data[nz]
+            if self.has_scaling:
+                data *= of_scale[rows]
+                data *= wrt_scale[cols]
+            yield rows, cols, data
+
+    def approx_column_iter(self, method='fd', step=None, form=None, step_calc='abs'):
+        """
+        Approximate the total jacobian one column at a time without storing it.
+
+        Parameters
+        ----------
+        method : str
+            Method, 'fd' for finite difference or 'cs' for complex step.
+        step : float or None
+            Step size for approximation. Default is None, which means 1e-6 for 'fd' and 1e-40
+            for 'cs'.
+        form : str or None
+            Form for finite difference, can be 'forward', 'backward', or 'central'. Default is
+            None, which means 'forward'.
+        step_calc : str
+            Step type for finite difference, can be 'abs' for absolute, or 'rel' for relative.
+
+        Yields
+        ------
+        int
+            Column index.
+        ndarray
+            Approximated values of the column.
+        """
+        model = self.model
+        outputs = model._outputs
+        slices = outputs.get_slice_dict()
+
+        def flat_idxs(name, indices):
+            slc = slices[name]
+            idxs = np.arange(slc.start, slc.stop, dtype=INT_DTYPE)
+            return idxs if indices is None else idxs[indices]
+
+        of_idxs = np.hstack([flat_idxs(name, self.of_meta[name][1]) for name in self.of])
+
+        cs = method == 'cs'
+        if step is None:
+            step = ComplexStep.DEFAULT_OPTIONS['step'] if cs else \
+                FiniteDifference.DEFAULT_OPTIONS['step']
+
+        if cs:
+            deltas, coeffs, current_coeff = np.array([1j]), np.array([1.0]), 0.0
+        else:
+            form = form or FiniteDifference.DEFAULT_OPTIONS['form']
+            fd_form = _generate_fd_coeff(form, DEFAULT_ORDER[form], model)
+            deltas, coeffs, current_coeff = fd_form
+
+        if self.has_scaling:
+            of_scale, wrt_scale = self._get_driver_scalers()
+
+        starting_outs = outputs.asarray(copy=True)
+        starting_ins = model._inputs.asarray(copy=True)
+        starting_resids = model._residuals.asarray(copy=True)
+        current = starting_outs[of_idxs]
+
+        if cs:
+            model._set_complex_step_mode(True)
+
+        try:
+            col = 0
+            for name in self.wrt:
+                h = step
+                if step_calc == 'rel' and not cs:
+                    h *= np.linalg.norm(outputs._abs_get_val(name))
+
+                for idx in flat_idxs(name, self.wrt_meta[name][1]):
+                    result = current * (current_coeff / h)
+                    for delta, coeff in zip(deltas, coeffs):
+                        outputs.iadd(delta * h, idx)
+                        model.run_solve_nonlinear()
+                        vals = outputs.asarray()[of_idxs]
+                        result += (vals.imag if cs else vals) * (coeff / h)
+
+                        outputs.set_val(starting_outs)
+                        model._inputs.set_val(starting_ins)
+                        model._residuals.set_val(starting_resids)
+
+                    if self.has_scaling:
+                        result *= of_scale
+                        result *= wrt_scale[col]
+
+                    yield col, result
+                    col += 1
+        finally:
+            if cs:
+                model._set_complex_step_mode(False)
+                outputs.set_val(starting_outs)
+                model._inputs.set_val(starting_ins)
+                model._residuals.set_val(starting_resids)
+
+    def _get_driver_scalers(self):
+        """
+        Return the driver scaling factors of the rows and columns of the jacobian.
+
+        Returns
+        -------
+        ndarray
+            Scaling factor of each row.
+        ndarray
+            Scaling factor of each column.
+        """
+        of_scale = np.ones(self.of_size)
+        for prom, name in zip(self.prom_of, self.of):
+            scaler = self.prom_responses[prom]['scaler']
+            if scaler is not None:
+                of_scale[self.of_meta[name][0]] = scaler
+
+        wrt_scale = np.ones(self.wrt_size)
+        for prom, name in zip(self.prom_wrt, self.wrt):
+            scaler = self.prom_design_vars[prom]['scaler']
+            if scaler is not None:
+                wrt_scale[self.wrt_meta[name][0]] = 1.0 / scaler
+
+        return of_scale, wrt_scale
+
+    def compute_totals(self):
+        """
+        Compute derivatives of desired quantities with respect to desired inputs.
+
+        Returns
+        -------
+        derivs : object
+            Derivatives in form requested by 'return_format'.
+        """
+        if self.streaming:
+            blocks = list(self.compute_totals_iter())
+            if not blocks:
+                return coo_matrix(self.J.shape)
+            rows, cols, data = zip(*blocks)
+            return coo_matrix((np.concatenate(data), (np.concatenate(rows), np.concatenate(cols))),
+                              shape=self.J.shape)
+
+        for _ in self._solve_iter():
+            pass
+
         # Driver scaling.
         if self.has_scaling:
             self._do_driver_scaling(self.J_dict)
 
-        if debug_print:
+        if self.debug_print:
             # Debug outputs scaled derivatives.
             self._print_derivatives()
 
@@ -1802,3 +1988,77 @@ def _update_rel_systems(all_rel_systems, rel_systems):
         all_rel_systems = _contains_all
     else:
         all_rel_systems.update(rel_systems)
+
+
+class _TotalJacValues(object):
+    """
+    Stand-in for the dense total jacobian that collects the values set into it.
+
+    Attributes
+    ----------
+    shape : tuple
+        Shape of the total jacobian.
+    _rows : list of ndarray
+        Row indices of the values set since the last pop.
+    _cols : list of ndarray
+        Column indices of the values set since the last pop.
+    _data : list of ndarray
+        Values set since the last pop.
+    """
+
+    def __init__(self, shape):
+        """
+        Initialize attributes.
+
+        Parameters
+        ----------
+        shape : tuple
+            Shape of the total jacobian.
+        """
+        self.shape = shape
+        self._rows = []
+        self._cols = []
+        self._data = []
+
+    def __setitem__(self, key, value):
+        """
+        Collect the given values.
+
+        Parameters
+        ----------
+        key : tuple or slice
+            Row and column indices of the values.  A slice clears the values collected so far.
+        value : ndarray or float
+            The values.
+        """
+        if not isinstance(key, tuple):
+            self._rows, self._cols, self._data = [], [], []
+            return
+
+        rows, cols, value = np.broadcast_arrays(*key, value)
+        self._rows.append(rows.ravel())
+        self._cols.append(cols.ravel())
+        self._data.append(value.ravel().copy())
+
+    def pop(self):
+        """
+        Return the values collected since the last pop and forget them.
+
+        Returns
+        -------
+        ndarray of int
+            Row indices.
+        ndarray of int
+            Column indices.
+        ndarray
+            Values.
+        """
+        if self._data:
+            rows = np.concatenate(self._rows).astype(INT_DTYPE, copy=False)
+            cols = np.concatenate(self._cols).astype(INT_DTYPE, copy=False)
+            data = np.concatenate(self._data).astype(float, copy=False)
+        else:
+            rows = cols = np.zeros(0, dtype=INT_DTYPE)
+            data = np.zeros(0)
+        self._rows, self._cols, self._data = [], [], []
+        return rows, cols, data
@@ -2,16 +2,24 @@
 Design-of-Experiments Driver.
 """
 
+import os
+import glob
 import traceback
 import inspect
+from itertools import islice
 
-from openmdao.core.driver import Driver, RecordingDebugging
+import numpy as np
+
+from openmdao.core.driver import Driver, RecordingDebugging, _get_iteration_data
 from openmdao.core.analysis_error import AnalysisError
 from openmdao.drivers.doe_generators import DOEGenerator, ListGenerator
 
 from openmdao.utils.mpi import MPI
+from openmdao.utils.concurrent import concurrent_eval_lb
 
 from openmdao.recorders.sqlite_recorder import SqliteRecorder
+from openmdao.recorders.case_reader import CaseReader
+from openmdao.recorders.recording_iteration_stack import Recording
 
 
 class DOEDriver(Driver):
@@ -28,6 +36,17 @@ class DOEDriver(Driver):
         The MPI communicator for the Problem.
     _color : int or None
         In MPI, the cached color is used to determine which cases to run on this proc.
+    _lb_comm : MPI.Comm or None
+        When load balancing under MPI, the communicator between rank 0, which hands out the
+        cases, and the root proc of each model.
+    _completed_cases : set or None
+        Keys made from the design variable values of the cases that were run successfully
+        before a restart.
+    _batch_data : dict or None
+        While recording the cases of a batch, the data to be recorded for the current case.
+    _batch_vars : dict or None
+        When batch_size is greater than 1, the absolute names of the batched inputs and outputs,
+        keyed by 'input' and 'output', whose rows are recorded separately for each case.
     """
 
     def __init__(self, generator=None, **kwargs):
@@ -72,6 +91,10 @@ class DOEDriver(Driver):
         self._recorders = []
         self._problem_comm = None
         self._color = None
+        self._lb_comm = None
+        self._completed_cases = None
+        self._batch_data = None
+        self._batch_vars = None
 
     def _declare_options(self):
         """
@@ -83,6 +106,103 @@ class DOEDriver(Driver):
                              desc='Set to True to execute cases in parallel.')
         self.options.declare('procs_per_model', types=int, default=1, lower=1,
                              desc='Number of processors to give each model under MPI.')
+        self.options.declare('load_balance', types=bool, default=False,
+                             desc='If True and run_parallel is True, rank 0 hands out the cases '
+                                  'one at a time to the other procs as each of their models '
+                                  'finishes its previous case, instead of every model being '
+                                  'assigned a fixed share of the cases. Rank 0 does not run any '
+                                  'cases itself.')
+        self.options.declare('restart_file', types=str, default=None, allow_none=True,
+                             desc='Name of the case recording file of an earlier run of this DOE. '
+                                  'Cases whose design variable values match those of a successful '
+                                  'case in that file, or in the per-processor files of a parallel '
+                                  'run, are skipped. The file does not need to exist.')
+        self.options.declare('batch_size', types=int, default=1, lower=1,
+                             desc='Number of cases run by each execution of a vectorized model. '
+                                  'The leading dimension of each design variable must be equal '
+                                  'to batch_size, with row i holding the value for case i of the '
+                                  'batch. The leading dimension of each response must also be '
+                                  'batch_size. Cases are recorded individually, with the design '
+                                  'variables, the responses and the inputs connected to them '
+                                  'reduced to the row for that case.')
+
+    def _setup_driver(self, problem):
+        """
+        Prepare the driver for execution.
+
+        This is the final thing to run during setup.
+
+        Parameters
+        ----------
+        problem : <Problem>
+            Pointer to the containing problem.
+        """
+        super()._setup_driver(problem)
+
+        self._batch_vars = None
+
+        batch_size = self.options['batch_size']
+        if batch_size == 1:
+            return
+
+        if self.options['load_balance'] or self.options['restart_file'] is not None:
+            raise RuntimeError("%s: The 'load_balance' and 'restart_file' options can't be used "
+                               "when batch_size is greater than 1." % self.msginfo)
+
+        model = problem.model
+        abs2meta = model._var_allprocs_abs2meta['output']
+        batch_outputs = set()
+        for name, meta in self._designvars.items():
+            src = meta['ivc_source']
+            shape = abs2meta[src]['global_shape'] if src in abs2meta else None
+            if (name in self._designvars_discrete or meta['indices'] is not None or
+                    not shape or shape[0] != batch_size):
+                raise RuntimeError("%s: Design variable '%s' must be a continuous variable "
+                                   "without indices and with a leading dimension of batch_size "
+                                   "(%d)." % (self.msginfo, name, batch_size))
+            batch_outputs.add(src)
+
+        for name, meta in self._responses.items():
+            src = meta['ivc_source']
+            shape = abs2meta[src]['global_shape'] if src in abs2meta else None
+            if not shape or shape[0] != batch_size:
+                raise RuntimeError("%s: Response '%s' must be a continuous variable with a "
+                                   "leading dimension of batch_size (%d)." %
+                                   (self.msginfo, meta['name'], batch_size))
+            batch_outputs.add(src)
+
+        # inputs that take the whole of a batched output are batched too
+        in_meta = model._var_allprocs_abs2meta['input']
+        batch_inputs = set()
+        for tgt, src in model._conn_global_abs_in2out.items():
+            if src in batch_outputs and in_meta[tgt]['global_shape'] == \
+                    abs2meta[src]['global_shape']:
+                batch_inputs.add(tgt)
+
+        self._batch_vars = {'input': batch_inputs, 'output': batch_outputs}
+
+    def _get_case_designvars(self):
+        """
+        Return the metadata of the design variables of a single case of a batch.
+
+        Bounds that are arrays are taken from the row for the first case.
+
+        Returns
+        -------
+        dict
+            Design variable metadata keyed by name, with sizes for a single case.
+        """
+        batch_size = self.options['batch_size']
+        designvars = {}
+        for name, meta in self._designvars.items():
+            meta = meta.copy()
+            for key in ('size', 'global_size'):
+                meta[key] //= batch_size
+            for key in ('lower', 'upper'):
+                if isinstance(meta[key], np.ndarray) and meta[key].size > 1:
+                    meta[key] = meta[key].reshape((batch_size, -1))[0]
+            designvars[name] = meta
+        return designvars
 
     def _setup_comm(self, comm):
         """
@@ -104,6 +224,27 @@ class DOEDriver(Driver):
             procs_per_model = self.options['procs_per_model']
 
             full_size = comm.size
+
+            if self._load_balanced():
+                # rank 0 only hands out cases, so it gets a model of its own that is never run
+                size = full_size - 1
+                if size < 1 or size % procs_per_model != 0:
+                    raise RuntimeError("When load balancing, the number of processors minus one "
+                                       "must be a positive multiple of the number of processors "
+                                       "per model.\n Provide a number of processors that is one "
+                                       "more than a multiple of %d, or specify a number of "
+                                       "processors per model that divides into %d." %
+                                       (procs_per_model, size))
+                if comm.rank == 0:
+                    color = self._color = 0
+                else:
+                    color = self._color = (comm.rank - 1) // procs_per_model + 1
+                model_comm = comm.Split(color)
+
+                is_root = comm.rank == 0 or model_comm.rank == 0
+                self._lb_comm = comm.Split(0 if is_root else MPI.UNDEFINED)
+                return model_comm
+
             size = full_size // procs_per_model
             if full_size != size * procs_per_model:
                 raise RuntimeError("The total number of processors is not evenly divisible by the "
@@ -148,6 +289,17 @@ class DOEDriver(Driver):
         """
         return self._name
 
+    def _load_balanced(self):
+        """
+        Return True if cases are handed out dynamically from rank 0 under MPI.
+
+        Returns
+        -------
+        bool
+            True if cases are load balanced.
+        """
+        return bool(MPI) and self.options['run_parallel'] and self.options['load_balance']
+
     def run(self):
         """
         Generate cases and run the model for each set of generated input values.
@@ -162,12 +314,41 @@ class DOEDriver(Driver):
         # set driver name with current generator
         self._set_name()
 
+        restart_file = self.options['restart_file']
+        if restart_file is not None:
+            # when load balancing, cases are only filtered on rank 0
+            if not self._load_balanced() or self._problem_comm.rank == 0:
+                self._completed_cases = self._load_completed_cases()
+
+            # number new cases after those already recorded on this proc, so that case names
+            # stay unique when the recording file is appended to
+            if MPI:
+                restart_file = '%s_%d' % (restart_file, MPI.COMM_WORLD.rank)
+            if os.path.isfile(restart_file):
+                self.iter_count = len(CaseReader(restart_file).list_cases('driver',
+                                                                          recurse=False,
+                                                                          out_stream=None))
+
+        if self._load_balanced():
+            self._run_load_balanced()
+            return False
+
         if MPI and self.options['run_parallel']:
             case_gen = self._parallel_generator
         else:
             case_gen = self.options['generator']
 
-        for case in case_gen(self._designvars, self._problem().model):
+        batch_size = self.options['batch_size']
+        if batch_size > 1:
+            cases = case_gen(self._get_case_designvars(), self._problem().model)
+            while True:
+                batch = list(islice(cases, batch_size))
+                if not batch:
+                    break
+                self._run_batch(batch)
+            return False
+
+        for case in self._remaining_cases(case_gen(self._designvars, self._problem().model)):
             self._run_case(case)
             self.iter_count += 1
 
@@ -184,15 +365,7 @@ class DOEDriver(Driver):
         """
         metadata = {}
 
-        for dv_name, dv_val in case:
-            try:
-                msg = None
-                self.set_design_var(dv_name, dv_val)
-            except ValueError as err:
-                msg = "Error assigning %s = %s: " % (dv_name, dv_val) + str(err)
-            finally:
-                if msg:
-                    raise(ValueError(msg))
+        self._set_case(case)
 
         with RecordingDebugging(self._get_name(), self.iter_count, self) as rec:
             try:
@@ -210,6 +383,254 @@ class DOEDriver(Driver):
             # save reference to metadata for use in record_iteration
             self._metadata = metadata
 
+    def _run_batch(self, cases):
+        """
+        Run a batch of cases with a single execution of the model, then record each case.
+
+        Parameters
+        ----------
+        cases : list of list
+            list of name, value tuples for the design variables for each case.  There must be
+            no more than batch_size cases.  If there are fewer, the remaining rows of the design
+            variables keep their values from the previous batch.
+        """
+        metadata = {}
+        model = self._problem().model
+        batch_size = self.options['batch_size']
+
+        # start from the current values, so design variables missing from a case are unchanged
+        values = {name: self._get_voi_val(name, meta, self._remote_dvs).reshape((batch_size, -1))
+                  for name, meta in self._designvars.items()}
+
+        for i, case in enumerate(cases):
+            for dv_name, dv_val in case:
+                try:
+                    values[dv_name][i] = np.ravel(dv_val)
+                except ValueError as err:
+                    raise ValueError("Error assigning %s = %s: " % (dv_name, dv_val) + str(err))
+
+        for name, val in values.items():
+            self.set_design_var(name, val.ravel())
+
+        self._pre_run_model_debug_print()
+        try:
+            model.run_solve_nonlinear()
+            metadata['success'] = 1
+            metadata['msg'] = ''
+        except AnalysisError:
+            metadata['success'] = 0
+            metadata['msg'] = traceback.format_exc()
+        except Exception:
+            metadata['success'] = 0
+            metadata['msg'] = traceback.format_exc()
+            print(metadata['msg'])
+        self._post_run_model_debug_print()
+
+        # gather the data once for the whole batch, then record each case from its rows
+        data = None
+        if self._rec_mgr._recorders:
+            data = _get_iteration_data(self, self._problem())
+
+        for i in range(len(cases)):
+            if data is not None:
+                self._batch_data = _get_batch_row(data, i, self._batch_vars)
+            with Recording(self._get_name(), self.iter_count, self):
+                self._metadata = metadata.copy()
+            self.iter_count += 1
+
+        self._batch_data = None
+
+    def record_iteration(self):
+        """
+        Record an iteration of the current Driver.
+        """
+        if self._batch_data is None:
+            super().record_iteration()
+        else:
+            self._rec_mgr.record_iteration(self, self._batch_data,
+                                           self._get_recorder_metadata(self._get_name()))
+
+    def _set_case(self, case):
+        """
+        Set the design variables to the values in the given case.
+
+        Parameters
+        ----------
+        case : list
+            list of name, value tuples for the design variables.
+        """
+        for dv_name, dv_val in case:
+            try:
+                msg = None
+                self.set_design_var(dv_name, dv_val)
+            except ValueError as err:
+                msg = "Error assigning %s = %s: " % (dv_name, dv_val) + str(err)
+            finally:
+                if msg:
+                    raise(ValueError(msg))
+
+    def _get_case_key(self, values=None):
+        """
+        Return a hashable key made from unscaled design variable values.
+
+        Parameters
+        ----------
+        values : dict or None
+            Design variable values keyed by name.  If None, use the current values.
+
+        Returns
+        -------
+        tuple
+            The key.
+        """
+        if values is None:
+            values = {n: self._get_voi_val(n, meta, self._remote_dvs, driver_scaling=False)
+                      for n, meta in self._designvars.items()}
+
+        # the repr of a float round trips exactly, so values read back from a recording file
+        # give the same key as the values that were recorded
+        return tuple((n, repr(np.asarray(values[n]).tolist())) for n in sorted(values))
+
+    def _load_completed_cases(self):
+        """
+        Read the keys of the successful cases recorded by an earlier run from the restart file(s).
+
+        Returns
+        -------
+        set
+            Keys made from the design variable values of the successful cases.
+        """
+        fname = self.options['restart_file']
+
+        # under MPI, cases from a parallel run are recorded in a file per proc
+        fnames = sorted(glob.glob(fname + '_[0-9]*'))
+        if os.path.isfile(fname):
+            fnames.append(fname)
+
+        completed = set()
+        for fname in fnames:
+            cr = CaseReader(fname)
+            for case_name in cr.list_cases('driver', recurse=False, out_stream=None):
+                case = cr.get_case(case_name)
+                if case.success:
+                    completed.add(self._get_case_key(case.get_design_vars(scaled=False)))
+
+        return completed
+
+    def _remaining_cases(self, cases):
+        """
+        Yield only the cases that weren't run successfully before the restart.
+
+        Parameters
+        ----------
+        cases : iter of list
+            Iterator over lists of name, value tuples for the design variables.
+
+        Yields
+        ------
+        list
+            list of name, value tuples for the design variables.
+        """
+        for case in cases:
+            if self._completed_cases and \
+                    self._get_case_key(self._get_case_values(case)) in self._completed_cases:
+                continue
+            yield case
+
+    def _get_case_values(self, case):
+        """
+        Return the unscaled design variable values that the given case would set in the model.
+
+        The values are computed the same way as in set_design_var, so they are equal to the
+        values that are recorded when the case is run, but the model isn't changed.
+
+        Parameters
+        ----------
+        case : list
+            list of name, value tuples for the design variables.
+
+        Returns
+        -------
+        dict
+            Flat, unscaled design variable values keyed by name.
+        """
+        values = {}
+        for name, value in case:
+            meta = self._designvars[name]
+
+            if name in self._designvars_discrete:
+                if isinstance(value, float):
+                    value = int(value)
+                elif isinstance(value, np.ndarray):
+                    model = self._problem().model
+                    if isinstance(model._discrete_outputs[meta['ivc_source']], int):
+                        value = int(value)
+                    else:
+                        value = value.astype(int)
+                values[name] = value
+                continue
+
+            val = np.empty(meta['global_size'])
+            val[:] = np.asarray(value).ravel()
+
+            if self._has_scaling:
+                scaler = meta['total_scaler']
+                if scaler is not None:
+                    val *= 1.0 / scaler
+
+                adder = meta['total_adder']
+                if adder is not None:
+                    val -= adder
+
+            values[name] = val
+
+        return values
+
+    def _run_load_balanced(self):
+        """
+        Run the cases handed out by rank 0 as each model finishes its previous case.
+        """
+        model_comm = self._problem().model.comm
+
+        if self._problem_comm.rank == 0:
+            generator = self.options['generator']
+            model = self._problem().model
+            cases = (((case,), None) for case in
+                     self._remaining_cases(generator(self._designvars, model)))
+            results = concurrent_eval_lb(None, cases, self._lb_comm)
+
+            errs = [err for _, err in results if err is not None]
+            if errs:
+                raise RuntimeError("%d of the DOE cases could not be run. The first error was:"
+                                   "\n%s" % (len(errs), errs[0]))
+
+        elif model_comm.rank == 0:
+            concurrent_eval_lb(self._run_lb_case, (), self._lb_comm)
+            # tell the other procs of this model that there are no more cases
+            model_comm.bcast(None, root=0)
+
+        else:
+            # the other procs of a model run each case that its root proc is handed
+            while True:
+                case = model_comm.bcast(None, root=0)
+                if case is None:
+                    break
+                self._run_case(case)
+                self.iter_count += 1
+
+    def _run_lb_case(self, case):
+        """
+        Run a case handed out by rank 0 on all procs of this model.
+
+        Parameters
+        ----------
+        case : list
+            list of name, value tuples for the design variables.
+        """
+        self._problem().model.comm.bcast(case, root=0)
+        self._run_case(case)
+        self.iter_count += 1
+
     def _parallel_generator(self, design_vars, model=None):
         """
         Generate case for this processor when running under MPI.
@@ -263,7 +684,11 @@ class DOEDriver(Driver):
                 # if SqliteRecorder, write cases only on procs up to the number
                 # of parallel DOEs (i.e. on the root procs for the cases)
                 if isinstance(recorder, SqliteRecorder):
-                    if procs_per_model == 1:
+                    if self._load_balanced():
+                        # rank 0 runs no cases, so it only writes the metadata
+                        recorder._record_on_proc = (self._problem_comm.rank > 0 and
+                                                    self._problem().model.comm.rank == 0)
+                    elif procs_per_model == 1:
                         recorder._record_on_proc = True
                     else:
                         size = self._problem_comm.size // procs_per_model
@@ -290,3 +715,34 @@ class DOEDriver(Driver):
         """
         self._metadata['name'] = case_name
         return self._metadata
+
+
+def _get_batch_row(data, row, batch_vars):
+    """
+    Return the data to be recorded for a single case of a batch.
+
+    Parameters
+    ----------
+    data : dict
+        The data recorded for the whole batch.
+    row : int
+        Index of the case in the batch.
+    batch_vars : dict
+        Absolute names of the batched inputs and outputs, keyed by 'input' and 'output'.
+
+    Returns
+    -------
+    dict
+        Copy of data where the value of each batched variable is replaced by the given row.
+    """
+    rowdata = data.copy()
+    for kind in ('input', 'output', 'residual'):
+        batched = batch_vars['input' if kind == 'input' else 'output']
+        vals = {}
+        for name, val in data[kind].items():
+            if name in batched:
+                # keep 1D arrays 1D so each case has the same shape as a scalar variable
+                val = val[row:row + 1] if val.ndim == 1 else val[row]
+            vals[name] = val
+        rowdata[kind] = vals
+    return rowdata
@@ -7,6 +7,7 @@ import numpy as np
 import os.path
 import csv
 import re
+import zipfile
 
 import pyDOE2
 
@@ -172,28 +173,10 @@ class CSVGenerator(DOEGenerator):
         list
             list of name, value tuples for the design variables.
         """
-        name_map = {}
-
         with open(self._filename, 'r') as f:
             # map header names to absolute names if necessary
             names = re.sub(' ', '', f.readline()).strip().split(',')
-            for name in names:
-                if name in design_vars:
-                    name_map[name] = name
-                elif model:
-                    abs_name = prom_name2abs_name(model, name, 'output')
-                    if abs_name in design_vars:
-                        name_map[name] = abs_name
-
-            # any names not found in name_map are invalid design vars
-            invalid_desvars = [name for name in names if name not in name_map]
-            if invalid_desvars:
-                if len(invalid_desvars) > 1:
-                    msg = "Invalid DOE case file, %s are not valid design variables."
-                    raise RuntimeError(msg % str(invalid_desvars))
-                else:
-                    msg = "Invalid DOE case file, '%s' is not a valid design variable."
-                    raise RuntimeError(msg % str(invalid_desvars[0]))
+            name_map = _get_name_map(names, design_vars, model)
 
         # read cases from file, parse values into numpy arrays
         with open(self._filename, 'r') as f:
@@ -205,6 +188,142 @@ class CSVGenerator(DOEGenerator):
                 yield case
 
 
+class NumpyFileGenerator(DOEGenerator):
+    """
+    DOE case generator that streams cases from a binary numpy file.
+
+    Two layouts are supported.  A .npy file holding a structured array, with one field per
+    design variable and one entry per case, is memory mapped so that only the pages holding the
+    cases being run are read, and each value is a view into the mapped file.  A .npz file holding
+    one array per design variable, with the cases along the first axis, is read a chunk of cases
+    at a time, so memory use does not grow with the number of cases.
+
+    Attributes
+    ----------
+    _filename : str
+        The name of the file from which to read cases.
+    _chunk_size : int
+        The number of cases to read at a time from a .npz file.
+    """
+
+    def __init__(self, filename, chunk_size=1000):
+        """
+        Initialize the NumpyFileGenerator.
+
+        Parameters
+        ----------
+        filename : str
+            The name of the .npy or .npz file from which to read cases.
+        chunk_size : int
+            The number of cases to read at a time from a .npz file.
+        """
+        super().__init__()
+
+        if not isinstance(filename, str):
+            raise RuntimeError("'%s' is not a valid file name." % str(filename))
+
+        if not os.path.isfile(filename):
+            raise RuntimeError("File not found: %s" % filename)
+
+        self._filename = filename
+        self._chunk_size = chunk_size
+
+    def __call__(self, design_vars, model=None):
+        """
+        Generate case.
+
+        Parameters
+        ----------
+        design_vars : OrderedDict
+            Dictionary of design variables for which to generate values.
+
+        model : Group
+            The model containing the design variables.
+
+        Yields
+        ------
+        list
+            list of name, value tuples for the design variables.
+        """
+        if zipfile.is_zipfile(self._filename):
+            yield from self._npz_cases(design_vars, model)
+            return
+
+        data = np.load(self._filename, mmap_mode='r')
+        if data.dtype.names is None:
+            raise RuntimeError("Invalid DOE case file, %s does not contain a structured array."
+                               % self._filename)
+
+        name_map = _get_name_map(data.dtype.names, design_vars, model)
+
+        # a plain ndarray view of the memmap avoids the overhead of memmap slicing
+        data = data.reshape(-1).view(np.ndarray)
+        for start in range(0, data.size, self._chunk_size):
+            chunk = data[start:start + self._chunk_size]
+            fields = [(name_map[name], chunk[name]) for name in data.dtype.names]
+            for i in range(chunk.size):
+                yield [(name, vals[i:i + 1] if vals.ndim == 1 else vals[i])
+                       for name, vals in fields]
+
+    def _npz_cases(self, design_vars, model):
+        """
+        Generate the cases in a .npz file, reading a chunk of cases at a time.
+
+        Parameters
+        ----------
+        design_vars : OrderedDict
+            Dictionary of design variables for which to generate values.
+
+        model : Group
+            The model containing the design variables.
+
+        Yields
+        ------
+        list
+            list of name, value tuples for the design variables.
+        """
+        with zipfile.ZipFile(self._filename) as zf:
+            names = [n[:-4] for n in zf.namelist() if n.endswith('.npy')]
+            name_map = _get_name_map(names, design_vars, model)
+
+            files = []
+            fields = []
+            ncases = set()
+            try:
+                for name in names:
+                    f = zf.open(name + '.npy')
+                    files.append(f)
+                    version = np.lib.format.read_magic(f)
+                    if version == (1, 0):
+                        shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+                    else:
+                        shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+                    if fortran_order or dtype.hasobject or not shape:
+                        raise RuntimeError("Invalid DOE case file, array '%s' in %s must be a "
+                                           "C ordered numeric array with one entry per case."
+                                           % (name, self._filename))
+                    ncases.add(shape[0])
+                    shape = shape[1:] if len(shape) > 1 else (1,)
+                    nbytes = dtype.itemsize * int(np.prod(shape))
+                    fields.append((name_map[name], f, dtype, shape, nbytes))
+
+                if len(ncases) > 1:
+                    raise RuntimeError("Invalid DOE case file, the arrays in %s don't all have "
+                                       "the same number of cases." % self._filename)
+
+                ncases = ncases.pop() if ncases else 0
+                for start in range(0, ncases, self._chunk_size):
+                    n = min(self._chunk_size, ncases - start)
+                    chunk = [(name, np.frombuffer(f.read(n * nbytes),
+                                                  dtype).reshape((n,) + shape))
+                             for name, f, dtype, shape, nbytes in fields]
+                    for i in range(n):
+                        yield [(name, vals[i]) for name, vals in chunk]
+            finally:
+                for f in files:
+                    f.close()
+
+
 class UniformGenerator(DOEGenerator):
     """
     DOE case generator implementing the Uniform method.
@@ -583,3 +702,43 @@ class LatinHypercubeGenerator(DOEGenerator):
                 col += size
 
             yield retval
+
+
+def _get_name_map(names, design_vars, model):
+    """
+    Map the design variable names found in a case file to the names of the design variables.
+
+    Parameters
+    ----------
+    names : list of str
+        Design variable names from the case file, either absolute or promoted.
+    design_vars : OrderedDict
+        Dictionary of design variables for which to generate values.
+    model : Group or None
+        The model containing the design variables.
+
+    Returns
+    -------
+    dict
+        Mapping of each name in the case file to the name of its design variable.
+    """
+    name_map = {}
+    for name in names:
+        if name in design_vars:
+            name_map[name] = name
+        elif model:
+            abs_name = prom_name2abs_name(model, name, 'output')
+            if abs_name in design_vars:
+                name_map[name] = abs_name
+
+    # any names not found in name_map are invalid design vars
+    invalid_desvars = [name for name in names if name not in name_map]
+    if invalid_desvars:
+        if len(invalid_desvars) > 1:
+            msg = "Invalid DOE case file, %s are not valid design variables."
+            raise RuntimeError(msg % str(invalid_desvars))
+        else:
+            msg = "Invalid DOE case file, '%s' is not a valid design variable."
+            raise RuntimeError(msg % str(invalid_desvars[0]))
+
+    return name_map
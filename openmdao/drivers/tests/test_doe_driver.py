@@ -452,6 +452,141 @@ class TestDOEDriver(unittest.TestCase):
                              "Error assigning p1.x = [ 0.  0.  0.  0.]: "
                              "could not broadcast input array from shape (4) into shape (1)")
 
+    def test_numpy_file(self):
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('comp', Paraboloid(), promotes=['x', 'y', 'f_xy'])
+        model.set_input_defaults('x', 0.0)
+        model.set_input_defaults('y', 0.0)
+        model.add_design_var('x', lower=0.0, upper=1.0)
+        model.add_design_var('y', lower=0.0, upper=1.0)
+        model.add_objective('f_xy')
+
+        prob.setup()
+
+        # save the DOE cases as a structured array with a field per design variable
+        case_gen = om.FullFactorialGenerator(levels=3)
+        cases = list(case_gen(model.get_design_vars(recurse=True)))
+
+        data = np.zeros(len(cases), dtype=[('x', float), ('y', float)])
+        for i, case in enumerate(cases):
+            for name, val in case:
+                data[name][i] = val[0]
+        np.save('cases.npy', data)
+
+        prob.driver = om.DOEDriver(om.NumpyFileGenerator('cases.npy', chunk_size=4))
+        prob.driver.add_recorder(om.SqliteRecorder("cases.sql"))
+
+        prob.run_driver()
+        prob.cleanup()
+
+        expected = self.expected_fullfact3
+
+        cr = om.CaseReader("cases.sql")
+        cases = cr.list_cases('driver', out_stream=None)
+
+        self.assertEqual(len(cases), 9)
+
+        for case, expected_case in zip(cases, expected):
+            outputs = cr.get_case(case).outputs
+            for name in ('x', 'y', 'f_xy'):
+                self.assertEqual(outputs[name], expected_case[name])
+
+    def test_numpy_file_npz_array(self):
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('p1', om.IndepVarComp('x', [0., 1.]))
+        model.add_subsystem('p2', om.IndepVarComp('y', [0., 1.]))
+        model.add_subsystem('comp1', Paraboloid())
+        model.add_subsystem('comp2', Paraboloid())
+
+        model.connect('p1.x', 'comp1.x', src_indices=[0])
+        model.connect('p2.y', 'comp1.y', src_indices=[0])
+
+        model.connect('p1.x', 'comp2.x', src_indices=[1])
+        model.connect('p2.y', 'comp2.y', src_indices=[1])
+
+        model.add_design_var('p1.x', lower=0.0, upper=1.0)
+        model.add_design_var('p2.y', lower=0.0, upper=1.0)
+
+        prob.setup()
+
+        # save the DOE cases with an array of values per design variable
+        case_gen = om.FullFactorialGenerator(levels=2)
+        cases = list(case_gen(model.get_design_vars(recurse=True)))
+
+        np.savez_compressed('cases.npz', **{
+            name: np.array([dict(case)[name] for case in cases]) for name in ('p1.x', 'p2.y')
+        })
+
+        prob.driver = om.DOEDriver(om.NumpyFileGenerator('cases.npz', chunk_size=5))
+        prob.driver.add_recorder(om.SqliteRecorder("cases.sql"))
+
+        prob.run_driver()
+        prob.cleanup()
+
+        cr = om.CaseReader("cases.sql")
+        recorded = cr.list_cases('driver', out_stream=None)
+
+        self.assertEqual(len(recorded), 16)
+
+        for case, expected_case in zip(recorded, cases):
+            outputs = cr.get_case(case).outputs
+            for name, val in expected_case:
+                assert_near_equal(outputs[name], val)
+
+    def test_numpy_file_errors(self):
+        # test invalid file name
+        with self.assertRaises(RuntimeError) as err:
+            om.NumpyFileGenerator(1.23)
+        self.assertEqual(str(err.exception),
+                         "'1.23' is not a valid file name.")
+
+        # test file not found
+        with self.assertRaises(RuntimeError) as err:
+            om.NumpyFileGenerator('nocases.npy')
+        self.assertEqual(str(err.exception),
+                         "File not found: nocases.npy")
+
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('comp', Paraboloid(), promotes=['x', 'y', 'f_xy'])
+        model.add_design_var('x', lower=0.0, upper=1.0)
+        model.add_design_var('y', lower=0.0, upper=1.0)
+        model.add_objective('f_xy')
+
+        prob.setup()
+
+        # test file that isn't a structured array
+        np.save('cases.npy', np.zeros((3, 2)))
+
+        prob.driver = om.DOEDriver(om.NumpyFileGenerator('cases.npy'))
+        with self.assertRaises(RuntimeError) as err:
+            prob.run_driver()
+        self.assertEqual(str(err.exception), "Invalid DOE case file, cases.npy does not contain "
+                         "a structured array.")
+
+        # test file with an invalid design var
+        np.save('cases.npy', np.zeros(3, dtype=[('x', float), ('foobar', float)]))
+
+        prob.driver = om.DOEDriver(om.NumpyFileGenerator('cases.npy'))
+        with self.assertRaises(RuntimeError) as err:
+            prob.run_driver()
+        self.assertEqual(str(err.exception), "Invalid DOE case file, "
+                         "'foobar' is not a valid design variable.")
+
+        # test file with arrays of different lengths
+        np.savez('cases.npz', x=np.zeros(3), y=np.zeros(4))
+
+        prob.driver = om.DOEDriver(om.NumpyFileGenerator('cases.npz'))
+        with self.assertRaises(RuntimeError) as err:
+            prob.run_driver()
+        self.assertEqual(str(err.exception), "Invalid DOE case file, the arrays in cases.npz "
+                         "don't all have the same number of cases.")
+
     def test_uniform(self):
         prob = om.Problem()
         model = prob.model
@@ -934,6 +1069,199 @@ class TestDOEDriver(unittest.TestCase):
         assert_near_equal(outputs['y'], 20.0, 1e-7)
         assert_near_equal(outputs['z'], 30.0, 1e-7)
 
+    def test_restart(self):
+        class FailingParaboloid(Paraboloid):
+            fail = True
+
+            def compute(self, inputs, outputs):
+                if self.fail and inputs['x'] > 0.9:
+                    raise om.AnalysisError('x too large')
+                super().compute(inputs, outputs)
+                self.num_computes += 1
+
+        def run_doe():
+            prob = om.Problem()
+            model = prob.model
+
+            comp = model.add_subsystem('comp', FailingParaboloid(), promotes=['*'])
+            comp.num_computes = 0
+
+            model.add_design_var('x', lower=0.0, upper=1.0, scaler=3.0, adder=.1)
+            model.add_design_var('y', lower=0.0, upper=1.0)
+            model.add_objective('f_xy')
+
+            prob.driver = om.DOEDriver(om.FullFactorialGenerator(levels=3),
+                                       restart_file="cases.sql")
+            prob.driver.add_recorder(om.SqliteRecorder("cases.sql", append=True))
+
+            prob.setup()
+            prob.set_val('x', 0.25)
+            prob.set_val('y', 0.75)
+            prob.run_driver()
+            prob.cleanup()
+
+            return comp.num_computes, prob
+
+        # the cases with x=1 fail
+        self.assertEqual(run_doe()[0], 6)
+
+        # only the failed cases are run again
+        FailingParaboloid.fail = False
+        self.assertEqual(run_doe()[0], 3)
+
+        # all cases have succeeded
+        num_computes, prob = run_doe()
+        self.assertEqual(num_computes, 0)
+
+        # skipping cases doesn't change the model
+        self.assertEqual(prob.get_val('x'), 0.25)
+        self.assertEqual(prob.get_val('y'), 0.75)
+
+        cr = om.CaseReader("cases.sql")
+        cases = cr.list_cases('driver', out_stream=None)
+
+        # new cases are appended with new names
+        self.assertEqual(cases, ['rank0:DOEDriver_FullFactorial|%d' % i for i in range(12)])
+
+        successful = []
+        for case in cases:
+            case = cr.get_case(case)
+            if case.success:
+                successful.append((case.outputs['x'][0], case.outputs['y'][0],
+                                   case.outputs['f_xy'][0]))
+
+        expected = [(case['x'][0], case['y'][0], case['f_xy'][0])
+                    for case in self.expected_fullfact3]
+        self.assertEqual(sorted(successful), sorted(expected))
+
+    def test_batch(self):
+        prob = om.Problem()
+        model = prob.model
+
+        # vectorized paraboloid that evaluates 4 cases at once
+        model.add_subsystem('comp', om.ExecComp('f_xy = (x-3.0)**2 + x*y + (y+4.0)**2 - 3.0',
+                                                shape=(4,)), promotes=['*'])
+        model.add_design_var('x', lower=0.0, upper=1.0)
+        model.add_design_var('y', lower=0.0, upper=1.0)
+        model.add_objective('f_xy', index=0)
+
+        prob.driver = om.DOEDriver(om.FullFactorialGenerator(levels=3), batch_size=4)
+        prob.driver.add_recorder(om.SqliteRecorder("cases.sql"))
+
+        prob.setup()
+        prob.run_driver()
+        prob.cleanup()
+
+        # 9 cases are run in 3 executions of the model
+        self.assertEqual(model.comp.iter_count, 3)
+        self.assertEqual(prob.driver.iter_count, 9)
+
+        expected = self.expected_fullfact3
+
+        cr = om.CaseReader("cases.sql")
+        cases = cr.list_cases('driver', out_stream=None)
+
+        self.assertEqual(len(cases), 9)
+
+        for case, expected_case in zip(cases, expected):
+            case = cr.get_case(case)
+            self.assertTrue(case.success)
+            for name in ('x', 'y', 'f_xy'):
+                self.assertEqual(case.outputs[name], expected_case[name])
+
+    def test_batch_recorded_rows(self):
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('comp', om.ExecComp(['f_xy = (x-3.0)**2 + x*y + (y+4.0)**2 - 3.0',
+                                                 'g = 2.0 * c'],
+                                                x=np.ones(4), y=np.ones(4), f_xy=np.ones(4),
+                                                c={'value': np.arange(4.0)}, g=np.ones(4)),
+                            promotes=['*'])
+        model.add_design_var('x', lower=0.0, upper=1.0)
+        model.add_design_var('y', lower=0.0, upper=1.0)
+        model.add_objective('f_xy', index=0)
+
+        prob.driver = om.DOEDriver(om.FullFactorialGenerator(levels=2), batch_size=4)
+        prob.driver.recording_options['record_inputs'] = True
+        prob.driver.recording_options['includes'] = ['*']
+        prob.driver.add_recorder(om.SqliteRecorder("cases.sql"))
+
+        prob.setup()
+        prob.run_driver()
+        prob.cleanup()
+
+        cr = om.CaseReader("cases.sql")
+        cases = cr.list_cases('driver', out_stream=None)
+        self.assertEqual(len(cases), 4)
+
+        for i, case in enumerate(cases):
+            case = cr.get_case(case)
+
+            # the design variables, the responses and the inputs connected to them hold the
+            # row for the case
+            for name in ('x', 'y', 'f_xy'):
+                self.assertEqual(case.outputs[name].shape, (1,))
+            self.assertEqual(case.inputs['comp.x'].shape, (1,))
+            assert_near_equal(case.inputs['comp.x'], case.outputs['x'], 1e-12)
+
+            # other variables aren't batched, even though their leading dimension is batch_size
+            assert_near_equal(case.inputs['comp.c'], np.arange(4.0), 1e-12)
+            assert_near_equal(case.outputs['g'], 2.0 * np.arange(4.0), 1e-12)
+
+    def test_batch_errors(self):
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('comp', om.ExecComp('f_xy = (x-3.0)**2 + x*y + (y+4.0)**2 - 3.0',
+                                                shape=(3,)), promotes=['*'])
+        model.add_design_var('x', lower=0.0, upper=1.0)
+        model.add_design_var('y', lower=0.0, upper=1.0)
+        model.add_objective('f_xy', index=0)
+
+        prob.driver = om.DOEDriver(om.FullFactorialGenerator(levels=3), batch_size=4)
+
+        with self.assertRaises(RuntimeError) as err:
+            prob.setup()
+            prob.final_setup()
+
+        self.assertEqual(str(err.exception),
+                         "DOEDriver: Design variable 'x' must be a continuous variable without "
+                         "indices and with a leading dimension of batch_size (4).")
+
+        # responses are batched too
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('comp', om.ExecComp('f_xy = (x-3.0)**2 + x*y + (y+4.0)**2 - 3.0',
+                                                shape=(3,)), promotes=['*'])
+        model.add_subsystem('sum', om.ExecComp('total = sum(f_xy)', f_xy=np.ones(3)),
+                            promotes=['*'])
+        model.add_design_var('x', lower=0.0, upper=1.0)
+        model.add_design_var('y', lower=0.0, upper=1.0)
+        model.add_constraint('total', upper=10.0)
+
+        prob.driver = om.DOEDriver(om.FullFactorialGenerator(levels=3), batch_size=3)
+
+        with self.assertRaises(RuntimeError) as err:
+            prob.setup()
+            prob.final_setup()
+
+        self.assertEqual(str(err.exception),
+                         "DOEDriver: Response 'total' must be a continuous variable with a "
+                         "leading dimension of batch_size (3).")
+
+        prob.driver = om.DOEDriver(om.FullFactorialGenerator(levels=3), batch_size=3,
+                                   restart_file='cases.sql')
+
+        with self.assertRaises(RuntimeError) as err:
+            prob.setup()
+            prob.final_setup()
+
+        self.assertEqual(str(err.exception),
+                         "DOEDriver: The 'load_balance' and 'restart_file' options can't be used "
+                         "when batch_size is greater than 1.")
+
     def test_discrete_desvar_list(self):
         prob = om.Problem()
         model = prob.model
@@ -1572,6 +1900,69 @@ class TestParallelDOE(unittest.TestCase):
         self.assertEqual(sum(num_cases), num_models*len(expected))
 
 
+@unittest.skipUnless(MPI and PETScVector, "MPI and PETSc are required.")
+@use_tempdirs
+class TestParallelDOELoadBalance(unittest.TestCase):
+
+    N_PROCS = 3
+
+    def test_full_factorial(self):
+        prob = om.Problem()
+        model = prob.model
+
+        model.add_subsystem('comp', Paraboloid(), promotes=['x', 'y', 'f_xy'])
+
+        model.add_design_var('x', lower=0.0, upper=1.0)
+        model.add_design_var('y', lower=0.0, upper=1.0)
+        model.add_objective('f_xy')
+
+        prob.driver = om.DOEDriver(om.FullFactorialGenerator(levels=3), run_parallel=True,
+                                   load_balance=True)
+        prob.driver.add_recorder(om.SqliteRecorder("cases.sql"))
+
+        prob.setup()
+        prob.run_driver()
+        prob.cleanup()
+
+        rank = prob.comm.rank
+
+        # rank 0 only hands out cases
+        if rank == 0:
+            self.assertEqual(prob.driver.iter_count, 0)
+            values = []
+        else:
+            cr = om.CaseReader("cases.sql_%d" % rank)
+            cases = cr.list_cases('driver', out_stream=None)
+            self.assertEqual(len(cases), prob.driver.iter_count)
+
+            values = []
+            for case in cases:
+                outputs = cr.get_case(case).outputs
+                values.append((outputs['x'][0], outputs['y'][0], outputs['f_xy'][0]))
+
+        # every case was run exactly once
+        values = sorted(v for rvals in prob.comm.allgather(values) for v in rvals)
+        expected = sorted([(0., 0., 22.00), (.5, 0., 19.25), (1., 0., 17.00),
+                           (0., .5, 26.25), (.5, .5, 23.75), (1., .5, 21.75),
+                           (0., 1., 31.00), (.5, 1., 28.75), (1., 1., 27.00)])
+        self.assertEqual(values, expected)
+
+    def test_indivisible_error(self):
+        prob = om.Problem()
+
+        prob.driver = om.DOEDriver(om.FullFactorialGenerator(levels=3), run_parallel=True,
+                                   load_balance=True, procs_per_model=3)
+
+        with self.assertRaises(RuntimeError) as context:
+            prob.setup()
+
+        self.assertEqual(str(context.exception),
+                         "When load balancing, the number of processors minus one must be a "
+                         "positive multiple of the number of processors per model.\n Provide a "
+                         "number of processors that is one more than a multiple of 3, or specify "
+                         "a number of processors per model that divides into 2.")
+
+
 @use_tempdirs
 class TestDOEDriverFeature(unittest.TestCase):
 
@@ -116,6 +116,34 @@ def _check_cycles_prob(prob, logger):
         logger.info(''.join(infos[:1] + sorted(infos[1:])))
 
 
+def _check_auto_order_prob(prob, logger):
+    """
+    Report the order chosen for the subsystems of each Group that has auto_order set.
+
+    Parameters
+    ----------
+    prob : <Problem>
+        The Problem being checked.
+    logger : object
+        The object that manages logging output.
+    """
+    infos = []
+    for group in prob.model.system_iter(include_self=True, recurse=True, typ=Group):
+        if group._auto_order_info is not None:
+            old_order, old_feedback, new_order, new_feedback = group._auto_order_info
+            if new_order == old_order:
+                infos.append("   Group '%s' keeps the order %s, with %d feedback "
+                             "connection(s).\n" % (group.pathname, new_order, new_feedback))
+            else:
+                infos.append("   Group '%s' was reordered to %s, with %d feedback connection(s) "
+                             "instead of %d.\n" % (group.pathname, new_order, new_feedback,
+                                                   old_feedback))
+
+    if infos:
+        logger.info(''.join(["The following groups were ordered automatically:\n"] +
+                            sorted(infos)))
+
+
 def _check_ubcs_prob(prob, logger):
     """
     Report any out of order Systems.
@@ -573,6 +601,7 @@ def _check_explicitly_connected_promoted_inputs(problem, logger):
 # Each function must be of the form  f(problem, logger).
 _default_checks = {
     'out_of_order': _check_ubcs_prob,
+    'auto_order': _check_auto_order_prob,
     'system': _check_system_configs,
     'solvers': _check_solvers,
     'dup_inputs': _check_dup_comp_inputs,
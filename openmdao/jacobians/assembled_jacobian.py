@@ -63,7 +63,7 @@ class AssembledJacobian(Jacobian):
         self._matrix_class = matrix_class
         self._out_ranges = self._get_ranges(system, 'output')
         self._in_ranges = self._get_ranges(system, 'input')
-        self._subjac_iters = defaultdict(lambda: None)
+        self._subjac_iters = {}
 
     def _get_ranges(self, system, vtype):
         """
@@ -257,7 +257,7 @@ class AssembledJacobian(Jacobian):
 
         global _empty_dict
 
-        subjac_iters = self._subjac_iters[system.pathname]
+        subjac_iters = self._subjac_iters.get(system.pathname)
         if subjac_iters is None:
             int_mtx = self._int_mtx
             ext_mtx = self._ext_mtx[system.pathname]
@@ -273,10 +273,10 @@ class Jacobian(object):
         # subjac.  Otherwise all subjacs that didn't have sparsity declared by the
         # user will appear completely dense, which will lead to a total jacobian that
         # is more dense than it should be, causing any total coloring that we compute
-        # to be overly conservative.
+        # to be overly conservative.  Colored approx partials already store only the
+        # nonzeros given by their sparsity.
         subjac_info = self._subjacs_info[key]
-        if 'sparsity' in subjac_info:
-            assert subjac_info['rows'] is None
+        if 'sparsity' in subjac_info and subjac_info['rows'] is None:
             rows, cols, shape = subjac_info['sparsity']
             r = np.zeros(shape)
             val = rand(len(rows))
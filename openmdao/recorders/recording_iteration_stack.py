@@ -1,4 +1,5 @@
 """Management of iteration stack for recording."""
+import threading
 import weakref
 
 from openmdao.utils.mpi import MPI
@@ -13,21 +14,101 @@ class _RecIteration(object):
     Some tests needed to reset the stack and this avoids issues
     with data left over from other tests.
 
+    Each thread has its own stack, so systems that run concurrently in threads don't see each
+    other's iteration coordinates.
+
     Attributes
     ----------
-    stack : list
-        A list that holds the stack of iteration coordinates.
     prefix : str or None
         Prefix to prepend to iteration coordinates.
+    _local : threading.local
+        Holds the stack and the count of non-recording functions on it for each thread.
     """
 
     def __init__(self):
         """
         Initialize.
         """
-        self.stack = []
         self.prefix = None
-        self._norec_refcount = 0
+        self._local = threading.local()
+
+    def __getstate__(self):
+        """
+        Return state as a dict, keeping only the stack of the current thread.
+
+        Returns
+        -------
+        dict
+            State to get.
+        """
+        return {'prefix': self.prefix, 'thread_state': self.get_thread_state()}
+
+    def __setstate__(self, state):
+        """
+        Restore the state.
+
+        Parameters
+        ----------
+        state : dict
+            State to restore.
+        """
+        self.prefix = state['prefix']
+        self._local = threading.local()
+        self.set_thread_state(state['thread_state'])
+
+    @property
+    def stack(self):
+        """
+        Get the stack of iteration coordinates of the current thread.
+
+        Returns
+        -------
+        list
+            A list that holds the stack of iteration coordinates.
+        """
+        try:
+            return self._local.stack
+        except AttributeError:
+            self._local.stack = []
+            self._local.norec_refcount = 0
+            return self._local.stack
+
+    @property
+    def _norec_refcount(self):
+        """
+        Get the number of non-recording functions on the stack of the current thread.
+
+        Returns
+        -------
+        int
+            The number of non-recording functions.
+        """
+        return self._local.norec_refcount if self.stack else 0
+
+    def get_thread_state(self):
+        """
+        Get a copy of the stack of the current thread, to start another thread with.
+
+        Returns
+        -------
+        tuple
+            The stack and the number of non-recording functions on it.
+        """
+        return list(self.stack), self._norec_refcount
+
+    def set_thread_state(self, state):
+        """
+        Set the stack of the current thread.
+
+        Parameters
+        ----------
+        state : tuple
+            The stack and the number of non-recording functions on it, as returned by
+            get_thread_state.
+        """
+        stack, norec_refcount = state
+        self._local.stack = list(stack)
+        self._local.norec_refcount = norec_refcount
 
     def print_recording_iteration_stack(self):
         """
@@ -82,7 +163,7 @@ class _RecIteration(object):
         """
         self.stack.append(iter_coord)
         if iter_coord[0] in _norec_funcs:
-            self._norec_refcount += 1
+            self._local.norec_refcount += 1
 
     def pop(self):
         """
@@ -95,7 +176,7 @@ class _RecIteration(object):
         """
         iter_coord = self.stack.pop()
         if iter_coord[0] in _norec_funcs:
-            self._norec_refcount -= 1
+            self._local.norec_refcount -= 1
         return iter_coord
 
 
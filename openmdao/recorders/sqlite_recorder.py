@@ -129,6 +129,8 @@ class SqliteRecorder(CaseRecorder):
         Flag indicating whether or not the database has been initialized.
     _record_on_proc : bool
         Flag indicating whether to record on this processor when running in parallel.
+    _append : bool
+        If True, append to the recorder file if it already exists.
     """
 
     def __init__(self, filepath, append=False, pickle_version=2, record_viewer_data=True):
@@ -140,16 +142,15 @@ class SqliteRecorder(CaseRecorder):
         filepath : str
             Path to the recorder file.
         append : bool, optional
-            Optional. If True, append to an existing case recorder file.
+            Optional. If True, append to an existing case recorder file. The file must have
+            been written by a run of the same model.
         pickle_version : int, optional
             The pickle protocol version to use when pickling metadata.
         record_viewer_data : bool, optional
             If True, record data needed for visualization.
         """
-        if append:
-            raise NotImplementedError("Append feature not implemented for SqliteRecorder")
-
         self.connection = None
+        self._append = append
         self._record_viewer_data = record_viewer_data
 
         self._abs2prom = {'input': {}, 'output': {}}
@@ -182,7 +183,10 @@ class SqliteRecorder(CaseRecorder):
         else:
             filepath = self._filepath
 
-        if filepath:
+        if filepath and self._append and os.path.isfile(filepath):
+            self.connection = sqlite3.connect(filepath)
+
+        elif filepath:
             try:
                 os.remove(filepath)
             except OSError:
@@ -277,6 +281,15 @@ class SqliteRecorder(CaseRecorder):
         if not self._database_initialized:
             self._initialize_database()
 
+        if self._append and self.connection:
+            # continue numbering from the last case in the existing file
+            with self.connection as c:
+                for table in ('driver_iterations', 'system_iterations', 'solver_iterations',
+                              'problem_cases'):
+                    counter = c.execute("SELECT MAX(counter) FROM %s" % table).fetchone()[0]
+                    if counter is not None:
+                        self._counter = max(self._counter, counter)
+
         driver = None
 
         # grab the system
@@ -621,7 +634,9 @@ class SqliteRecorder(CaseRecorder):
                     c.execute("INSERT INTO driver_metadata(id, model_viewer_data) VALUES(?,?)",
                               (key, json_data))
             except sqlite3.IntegrityError:
-                print("Model viewer data has already has already been recorded for %s." % key)
+                if not self._append:
+                    print("Model viewer data has already has already been recorded for %s." %
+                          key)
 
     def record_metadata_system(self, recording_requester, run_counter=None):
         """
@@ -695,8 +710,10 @@ class SqliteRecorder(CaseRecorder):
 
             solver_options = pickle.dumps(recording_requester.options, self._pickle_version)
 
+            # an appended file will already contain the metadata for this solver
+            insert = "INSERT OR IGNORE" if self._append else "INSERT"
             with self.connection as c:
-                c.execute("INSERT INTO solver_metadata(id, solver_options, solver_class) "
+                c.execute(insert + " INTO solver_metadata(id, solver_options, solver_class) "
                           "VALUES(?,?,?)", (id, sqlite3.Binary(solver_options), solver_class))
 
     def record_derivatives_driver(self, recording_requester, data, metadata):
@@ -323,9 +323,17 @@ class TestSqliteRecorder(unittest.TestCase):
             "Run Number: 0",
             "    Subsystem: root",
             "        assembled_jac_type : csc",
+            "",
+            "        auto_order : False",
+            "",
+            "        partition_cycles : False",
             "Run Number: 1",
             "    Subsystem: root",
-            "        assembled_jac_type : dense"
+            "        assembled_jac_type : dense",
+            "",
+            "        auto_order : False",
+            "",
+            "        partition_cycles : False"
         ]
 
         for i, line in enumerate(expected):
@@ -381,9 +389,17 @@ class TestSqliteRecorder(unittest.TestCase):
             "Run Number: 0",
             "    Subsystem: root",
             "        assembled_jac_type : csc",
+            "",
+            "        auto_order : False",
+            "",
+            "        partition_cycles : False",
             "Run Number: 1",
             "    Subsystem: root",
-            "        assembled_jac_type : dense"
+            "        assembled_jac_type : dense",
+            "",
+            "        auto_order : False",
+            "",
+            "        partition_cycles : False"
         ]
 
         for i, line in enumerate(expected):
@@ -1764,6 +1780,28 @@ class TestSqliteRecorder(unittest.TestCase):
         expected_data = ((coordinate, (t0, t1), expected_outputs, None, None),)
         assertDriverIterDataRecorded(self, expected_data, self.eps)
 
+    def test_recorder_file_already_exists_append(self):
+        for x in (1.0, 2.0):
+            prob = SellarProblem()
+            prob.driver.add_recorder(om.SqliteRecorder(self.filename, append=True))
+
+            prob.setup()
+            prob.set_val('x', x)
+            prob.run_driver()
+            prob.cleanup()
+
+        # the cases from both runs are in the file, and the case counter keeps increasing
+        con = sqlite3.connect(self.filename)
+        rows = con.execute("SELECT counter, iteration_coordinate FROM driver_iterations "
+                           "ORDER BY id").fetchall()
+        con.close()
+        self.assertEqual(rows, [(1, 'rank0:Driver|0'), (2, 'rank0:Driver|0')])
+
+        cr = om.CaseReader(self.filename)
+        case = cr.get_case(-1)
+        self.assertEqual(case.counter, 2)
+        assert_near_equal(case.outputs['x'], 2.0)
+
     def test_recorder_cleanup(self):
         def assert_closed(self, recorder):
             try:
@@ -2542,7 +2580,9 @@ class TestFeatureSqliteRecorder(unittest.TestCase):
         self.assertEqual(metadata['name'], 'DOEDriver')
         self.assertEqual(metadata['type'], 'doe')
         self.assertEqual(metadata['options'], {'debug_print': [], 'generator': 'UniformGenerator',
-                                               'run_parallel': False, 'procs_per_model': 1})
+                                               'run_parallel': False, 'procs_per_model': 1,
+                                               'load_balance': False, 'restart_file': None,
+                                               'batch_size': 1})
 
         # Optimization
         driver = prob.driver = om.ScipyOptimizeDriver()
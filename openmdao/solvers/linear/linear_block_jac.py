@@ -1,5 +1,6 @@
 """Define the LinearBlockJac class."""
 from openmdao.solvers.solver import BlockLinearSolver
+from openmdao.utils.concurrent import thread_map
 
 
 class LinearBlockJac(BlockLinearSolver):
@@ -9,6 +10,52 @@ class LinearBlockJac(BlockLinearSolver):
 
     SOLVER = 'LN: LNBJ'
 
+    def _declare_options(self):
+        """
+        Declare options before kwargs are processed in the init method.
+        """
+        super()._declare_options()
+
+        self.options.declare('num_threads', types=int, default=1, lower=1,
+                             desc='Number of threads used to run the subsystems that are local '
+                                  'to this process concurrently. This only speeds things up '
+                                  'when the subsystems release the GIL, for example in compiled '
+                                  'code.')
+
+    def _setup_solvers(self, system, depth):
+        """
+        Assign system instance, set depth, and optionally perform setup.
+
+        Parameters
+        ----------
+        system : <System>
+            pointer to the owning system.
+        depth : int
+            depth of the current system (already incremented).
+        """
+        super()._setup_solvers(system, depth)
+
+        if self.options['num_threads'] > 1:
+            system._check_concurrent_recording(self, 'in a thread when num_threads is more '
+                                                     'than 1')
+
+    def _run_subsystems(self, subs, func):
+        """
+        Call a function on each subsystem, in threads if num_threads is more than 1.
+
+        Parameters
+        ----------
+        subs : list of System
+            The subsystems.
+        func : function
+            The function, which takes the subsystem as its only argument.
+        """
+        if self.options['num_threads'] > 1 and len(subs) > 1:
+            thread_map(self, self.options['num_threads'], func, subs, self._recording_iter)
+        else:
+            for subsys in subs:
+                func(subsys)
+
     def _single_iteration(self):
         """
         Perform the operations in the iteration loop.
@@ -20,28 +67,29 @@ class LinearBlockJac(BlockLinearSolver):
         subs = [s for s in system._subsystems_myproc
                 if self._rel_systems is None or s.pathname in self._rel_systems]
 
+        def apply_linear(subsys):
+            scope_out, scope_in = system._get_scope(subsys)
+            subsys._apply_linear(None, vec_names, self._rel_systems, mode,
+                                 scope_out, scope_in)
+
+        def solve_linear(subsys):
+            subsys._solve_linear(vec_names, mode, self._rel_systems)
+
         if mode == 'fwd':
             for vec_name in vec_names:
                 system._transfer(vec_name, mode)
 
-            for subsys in subs:
-                scope_out, scope_in = system._get_scope(subsys)
-                subsys._apply_linear(None, vec_names, self._rel_systems, mode,
-                                     scope_out, scope_in)
+            self._run_subsystems(subs, apply_linear)
 
             for vec_name in vec_names:
                 b_vec = system._vectors['residual'][vec_name]
                 b_vec *= -1.0
                 b_vec._data += self._rhs_vecs[vec_name]
 
-            for subsys in subs:
-                subsys._solve_linear(vec_names, mode, self._rel_systems)
+            self._run_subsystems(subs, solve_linear)
 
         else:  # rev
-            for subsys in subs:
-                scope_out, scope_in = system._get_scope(subsys)
-                subsys._apply_linear(None, vec_names, self._rel_systems, mode,
-                                     scope_out, scope_in)
+            self._run_subsystems(subs, apply_linear)
 
             for vec_name in vec_names:
                 system._transfer(vec_name, mode)
@@ -50,5 +98,4 @@ class LinearBlockJac(BlockLinearSolver):
                 b_vec *= -1.0
                 b_vec._data += self._rhs_vecs[vec_name]
 
-            for subsys in subs:
-                subsys._solve_linear(vec_names, mode, self._rel_systems)
+            self._run_subsystems(subs, solve_linear)
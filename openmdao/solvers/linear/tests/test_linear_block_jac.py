@@ -1,6 +1,7 @@
 """Test the LinearBlockJac class."""
 
 import unittest
+from functools import partial
 
 import numpy as np
 
@@ -32,6 +33,30 @@ class TestLinearBlockJacSolver(LinearSolverTests.LinearSolverTestCase):
                              "Linear solver 'LN: LNBJ' doesn't support assembled jacobians.")
 
 
+class TestLinearBlockJacThreads(LinearSolverTests.LinearSolverTestCase):
+
+    linear_solver_class = partial(om.LinearBlockJac, num_threads=3)
+
+    def test_recording_error(self):
+        prob = om.Problem()
+        model = prob.model
+        model.add_subsystem('d1', SellarDis1withDerivatives(), promotes=['x', 'z', 'y1', 'y2'])
+        model.add_subsystem('d2', SellarDis2withDerivatives(), promotes=['z', 'y1', 'y2'])
+        model.nonlinear_solver = om.NonlinearBlockGS()
+        model.linear_solver = self.linear_solver_class()
+        model.d2.add_recorder(om.SqliteRecorder('cases.sql', record_viewer_data=False))
+
+        prob.setup()
+
+        with self.assertRaises(RuntimeError) as cm:
+            prob.final_setup()
+
+        self.assertEqual(str(cm.exception),
+                         "LinearBlockJac in <model> <class Group>: Can't record cases of 'd2' "
+                         "<class SellarDis2withDerivatives> because it runs in a thread when "
+                         "num_threads is more than 1.")
+
+
 class TestBJacSolverFeature(unittest.TestCase):
 
     def test_specify_solver(self):
@@ -1,7 +1,9 @@
 """Define the NonlinearBlockGS class."""
+from collections import deque
 
 import numpy as np
 
+from openmdao.core.constants import INT_DTYPE
 from openmdao.solvers.solver import NonlinearSolver
 from openmdao.utils.mpi import MPI
 
@@ -12,6 +14,21 @@ class NonlinearBlockGS(NonlinearSolver):
 
     Attributes
     ----------
+    _anderson_idxs : ndarray
+        Indices in the local output vector of the outputs that are fed back to earlier
+        subsystems. Anderson acceleration only works on these.
+    _anderson_dg : deque of ndarray
+        Recent changes in the fed back outputs computed by the iterations. Only used if the
+        anderson acceleration option is turned on.
+    _anderson_df : deque of ndarray
+        Recent changes in the fed back output updates. Only used if the anderson acceleration
+        option is turned on.
+    _anderson_g_n_1 : ndarray or None
+        Fed back outputs computed by the previous iteration.
+    _anderson_f_n_1 : ndarray or None
+        Fed back output update of the previous iteration.
+    _anderson_norm_n_1 : float
+        Norm of the fed back output update of the previous iteration.
     _delta_outputs_n_1 : ndarray
         Cached change in the full output vector for the previous iteration. Only used if the aitken
         acceleration option is turned on.
@@ -36,6 +53,13 @@ class NonlinearBlockGS(NonlinearSolver):
         self._theta_n_1 = 1.0
         self._delta_outputs_n_1 = None
 
+        self._anderson_idxs = None
+        self._anderson_dg = None
+        self._anderson_df = None
+        self._anderson_g_n_1 = None
+        self._anderson_f_n_1 = None
+        self._anderson_norm_n_1 = 0.0
+
     def _setup_solvers(self, system, depth):
         """
         Assign system instance, set depth, and optionally perform setup.
@@ -55,6 +79,36 @@ class NonlinearBlockGS(NonlinearSolver):
             raise RuntimeError('{}: Nonlinear Gauss-Seidel cannot be used on a '
                                'parallel group.'.format(self.msginfo))
 
+        if self.options['use_anderson']:
+            if self.options['use_aitken']:
+                raise ValueError(f"{self.msginfo}: use_aitken and use_anderson can't both be "
+                                 "True.")
+            self._setup_anderson()
+
+    def _setup_anderson(self):
+        """
+        Find the outputs that Anderson acceleration works on.
+
+        These are the outputs that are connected to inputs of earlier subsystems. All of the other
+        outputs are recomputed from them by each iteration, so they don't need to be accelerated.
+        """
+        system = self._system()
+        order = {name: i for i, name in enumerate(system._subsystems_allprocs)}
+        nprefix = len(system.pathname) + 1 if system.pathname else 0
+        slices = system._outputs.get_slice_dict()
+
+        feedback = set()
+        for abs_in, abs_out in system._conn_global_abs_in2out.items():
+            if abs_out in slices:
+                out_subsys = abs_out[nprefix:].split('.', 1)[0]
+                in_subsys = abs_in[nprefix:].split('.', 1)[0]
+                if order[out_subsys] > order[in_subsys]:
+                    feedback.add(abs_out)
+
+        idxs = [np.arange(slices[name].start, slices[name].stop, dtype=INT_DTYPE)
+                for name in slices if name in feedback]
+        self._anderson_idxs = np.concatenate(idxs) if idxs else np.zeros(0, dtype=INT_DTYPE)
+
     def _declare_options(self):
         """
         Declare options before kwargs are processed in the init method.
@@ -69,6 +123,18 @@ class NonlinearBlockGS(NonlinearSolver):
                              desc='upper limit for Aitken relaxation factor')
         self.options.declare('aitken_initial_factor', default=1.0,
                              desc='initial value for Aitken relaxation factor')
+        self.options.declare('use_anderson', types=bool, default=False,
+                             desc='set to True to use Anderson acceleration on the outputs that '
+                             'are fed back to earlier subsystems')
+        self.options.declare('anderson_depth', types=int, default=5, lower=1,
+                             desc='number of previous iterations used by Anderson acceleration')
+        self.options.declare('anderson_max_cond', default=1e6, lower=1.0,
+                             desc='Anderson acceleration drops its oldest iterations while the '
+                             'condition number of its least squares problem is larger than this')
+        self.options.declare('anderson_safeguard', default=2.0, lower=1.0,
+                             desc='Anderson acceleration restarts when the norm of the update '
+                             'of the fed back outputs grows by more than this factor in one '
+                             'iteration')
         self.options.declare('cs_reconverge', types=bool, default=True,
                              desc='When True, when this driver solves under a complex step, nudge '
                              'the Solution vector by a small amount so that it reconverges.')
@@ -97,6 +163,11 @@ class NonlinearBlockGS(NonlinearSolver):
             self._delta_outputs_n_1 = system._outputs.asarray(copy=True)
             self._theta_n_1 = 1.
 
+        if self.options['use_anderson']:
+            self._anderson_dg = deque(maxlen=self.options['anderson_depth'])
+            self._anderson_df = deque(maxlen=self.options['anderson_depth'])
+            self._anderson_g_n_1 = self._anderson_f_n_1 = None
+
         # When under a complex step from higher in the hierarchy, sometimes the step is too small
         # to trigger reconvergence, so nudge the outputs slightly so that we always get at least
         # one iteration.
@@ -116,6 +187,11 @@ class NonlinearBlockGS(NonlinearSolver):
         outputs = system._outputs
         residuals = system._residuals
         use_aitken = self.options['use_aitken']
+        use_anderson = self.options['use_anderson'] and self._anderson_idxs.size > 0
+
+        if use_anderson:
+            # fed back outputs going into the iteration
+            anderson_x_n = outputs._data[self._anderson_idxs]
 
         if use_aitken:
 
@@ -200,11 +276,87 @@ class NonlinearBlockGS(NonlinearSolver):
             # save update to use in next iteration
             delta_outputs_n_1[:] = delta_outputs_n
 
+        if use_anderson:
+            self._anderson_update(anderson_x_n)
+
         if not self.options['use_apply_nonlinear']:
             # Residual is the change in the outputs vector.
             with system._unscaled_context(outputs=[outputs], residuals=[residuals]):
                 residuals.set_val(outputs._data - outputs_n)
 
+    def _anderson_update(self, x_n):
+        """
+        Replace the fed back outputs computed by the iteration with the Anderson extrapolation.
+
+        Parameters
+        ----------
+        x_n : ndarray
+            Fed back outputs going into the iteration.
+        """
+        system = self._system()
+        data = system._outputs._data
+        idxs = self._anderson_idxs
+        dg = self._anderson_dg
+        df = self._anderson_df
+
+        g_n = data[idxs]
+        f_n = g_n - x_n
+        norm = np.sqrt(self._anderson_reduce(f_n.dot(f_n)).real)
+
+        if self._anderson_g_n_1 is not None:
+            if norm > self.options['anderson_safeguard'] * self._anderson_norm_n_1:
+                # the previous extrapolation made things worse, so start over from this iteration
+                dg.clear()
+                df.clear()
+            else:
+                dg.append(g_n - self._anderson_g_n_1)
+                df.append(f_n - self._anderson_f_n_1)
+
+        self._anderson_g_n_1 = g_n
+        self._anderson_f_n_1 = f_n
+        self._anderson_norm_n_1 = norm
+
+        if not df:
+            return
+
+        # minimize the norm of the combined update, f_n - df^T gamma
+        df_mat = np.array(df)
+        gram = self._anderson_reduce(df_mat.dot(df_mat.T))
+        rhs = self._anderson_reduce(df_mat.dot(f_n))
+
+        # drop the oldest changes while the history is nearly linearly dependent.  The condition
+        # number of the normal equations is the square of that of the least squares problem.
+        max_cond = self.options['anderson_max_cond'] ** 2
+        while np.linalg.cond(gram) > max_cond:
+            dg.popleft()
+            df.popleft()
+            if not df:
+                return
+            gram = gram[1:, 1:]
+            rhs = rhs[1:]
+
+        gamma = np.linalg.solve(gram, rhs)
+        data[idxs] = g_n - np.array(dg).T.dot(gamma)
+
+    def _anderson_reduce(self, val):
+        """
+        Sum a local dot product over the processes of the system.
+
+        Parameters
+        ----------
+        val : float or ndarray
+            The local dot product.
+
+        Returns
+        -------
+        float or ndarray
+            The dot product.
+        """
+        comm = self._system().comm
+        if comm.size > 1:
+            return comm.allreduce(val)
+        return val
+
     def _run_apply(self):
         """
         Run the apply_nonlinear method on the system.
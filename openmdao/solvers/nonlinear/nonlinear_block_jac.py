@@ -1,6 +1,9 @@
 """Define the NonlinearBlockJac class."""
+from operator import methodcaller
+
 from openmdao.recorders.recording_iteration_stack import Recording
 from openmdao.solvers.solver import NonlinearSolver
+from openmdao.utils.concurrent import thread_map
 from openmdao.utils.mpi import multi_proc_fail_check
 
 
@@ -11,6 +14,35 @@ class NonlinearBlockJac(NonlinearSolver):
 
     SOLVER = 'NL: NLBJ'
 
+    def _declare_options(self):
+        """
+        Declare options before kwargs are processed in the init method.
+        """
+        super()._declare_options()
+
+        self.options.declare('num_threads', types=int, default=1, lower=1,
+                             desc='Number of threads used to run the subsystems that are local '
+                                  'to this process concurrently. This only speeds things up '
+                                  'when the subsystems release the GIL, for example in compiled '
+                                  'code or while waiting on an external code.')
+
+    def _setup_solvers(self, system, depth):
+        """
+        Assign system instance, set depth, and optionally perform setup.
+
+        Parameters
+        ----------
+        system : <System>
+            pointer to the owning system.
+        depth : int
+            depth of the current system (already incremented).
+        """
+        super()._setup_solvers(system, depth)
+
+        if self.options['num_threads'] > 1:
+            system._check_concurrent_recording(self, 'in a thread when num_threads is more '
+                                                     'than 1')
+
     def _single_iteration(self):
         """
         Perform the operations in the iteration loop.
@@ -24,17 +56,45 @@ class NonlinearBlockJac(NonlinearSolver):
             # If this is a parallel group, check for analysis errors and reraise.
             if len(system._subsystems_myproc) != len(system._subsystems_allprocs):
                 with multi_proc_fail_check(system.comm):
-                    for subsys in system._subsystems_myproc:
-                        subsys._solve_nonlinear()
+                    self._run_subsystems('_solve_nonlinear')
             else:
-                for subsys in system._subsystems_myproc:
-                    subsys._solve_nonlinear()
+                self._run_subsystems('_solve_nonlinear')
 
             rec.abs = 0.0
             rec.rel = 0.0
 
         self._solver_info.pop()
 
+    def _runs_concurrently(self):
+        """
+        Return True if the local subsystems are run in threads.
+
+        Returns
+        -------
+        bool
+            True if the local subsystems are run concurrently.
+        """
+        return len(self._system()._subsystems_myproc) > 1 and self.options['num_threads'] > 1
+
+    def _run_subsystems(self, method):
+        """
+        Call a method of each local subsystem, concurrently if that is enabled.
+
+        Parameters
+        ----------
+        method : str
+            Name of the method, which is '_solve_nonlinear' or '_apply_nonlinear'.
+        """
+        system = self._system()
+        subsystems = system._subsystems_myproc
+
+        if not self._runs_concurrently():
+            for subsys in subsystems:
+                getattr(subsys, method)()
+        else:
+            thread_map(self, self.options['num_threads'], methodcaller(method), subsystems,
+                       self._recording_iter)
+
     def _mpi_print_header(self):
         """
         Print header text before solving.
@@ -60,6 +120,24 @@ class NonlinearBlockJac(NonlinearSolver):
         # If this is a parallel group, check for analysis errors and reraise.
         if len(system._subsystems_myproc) != len(system._subsystems_allprocs):
             with multi_proc_fail_check(system.comm):
-                super()._run_apply()
+                self._apply_subsystems()
         else:
+            self._apply_subsystems()
+
+    def _apply_subsystems(self):
+        """
+        Compute the residuals of the system, running its local subsystems concurrently if enabled.
+        """
+        if not self._runs_concurrently():
             super()._run_apply()
+            return
+
+        system = self._system()
+
+        self._recording_iter.push(('_run_apply', 0))
+        try:
+            system._transfer('nonlinear', 'fwd')
+            self._run_subsystems('_apply_nonlinear')
+            system.iter_count_apply += 1
+        finally:
+            self._recording_iter.pop()
@@ -25,12 +25,12 @@ class NonlinearRunOnce(NonlinearSolver):
 
         with Recording('NLRunOnce', 0, self) as rec:
             # If this is a parallel group, transfer all at once then run each subsystem.
-            if len(system._subsystems_myproc) != len(system._subsystems_allprocs):
+            if len(system._subsystems_myproc) != len(system._subsystems_allprocs) or \
+                    system._runs_subsystems_concurrently():
                 system._transfer('nonlinear', 'fwd')
 
                 with multi_proc_fail_check(system.comm):
-                    for subsys in system._subsystems_myproc:
-                        subsys._solve_nonlinear()
+                    system._run_subsystems(lambda subsys: subsys._solve_nonlinear())
 
             # If this is not a parallel group, transfer for each subsystem just prior to running it.
             else:
@@ -19,6 +19,21 @@ except:
     PETScVector = None
 
 
+class CoupledComp(om.ExplicitComponent):
+    """Discipline of a strongly coupled cycle."""
+
+    def initialize(self):
+        self.options.declare('mat')
+
+    def setup(self):
+        n = self.options['mat'].shape[0]
+        self.add_input('x', np.zeros(n))
+        self.add_output('y', np.zeros(n))
+
+    def compute(self, inputs, outputs):
+        outputs['y'] = self.options['mat'].dot(inputs['x']) + 0.1 * np.sin(inputs['x']) + 1.0
+
+
 class TestNLBGaussSeidel(unittest.TestCase):
 
     def test_reraise_error(self):
@@ -456,6 +471,95 @@ class TestNLBGaussSeidel(unittest.TestCase):
         J = prob.compute_totals(of=['y1'], wrt=['x'])
         assert_near_equal(J['y1', 'x'][0][0], 0.98061448, 1e-6)
 
+    def test_NLBGS_Anderson(self):
+
+        prob = om.Problem(model=SellarDerivatives())
+        model = prob.model
+        model.nonlinear_solver = om.NonlinearBlockGS()
+
+        prob.setup()
+        model.nonlinear_solver.options['use_anderson'] = True
+        prob.run_model()
+
+        assert_near_equal(prob.get_val('y1'), 25.58830273, .00001)
+        assert_near_equal(prob.get_val('y2'), 12.05848819, .00001)
+        self.assertEqual(model.nonlinear_solver._iter_count, 6)
+
+        # only y2 is fed back to an earlier subsystem
+        slices = model._outputs.get_slice_dict()
+        np.testing.assert_array_equal(model.nonlinear_solver._anderson_idxs,
+                                      np.arange(slices['d2.y2'].start, slices['d2.y2'].stop))
+
+    def test_NLBGS_Anderson_iterations(self):
+
+        def run(**options):
+            prob = om.Problem()
+            model = prob.model
+
+            rng = np.random.RandomState(0)
+            mat = rng.random_sample((10, 10))
+            mat *= 0.97 / np.max(np.abs(np.linalg.eigvals(mat)))
+
+            model.add_subsystem('aero', CoupledComp(mat=mat))
+            model.add_subsystem('struct', CoupledComp(mat=0.8 * np.eye(10)))
+            model.connect('aero.y', 'struct.x')
+            model.connect('struct.y', 'aero.x')
+
+            model.nonlinear_solver = om.NonlinearBlockGS(maxiter=200, atol=1e-10, rtol=1e-12,
+                                                         **options)
+
+            prob.setup()
+            prob.set_solver_print(level=0)
+            prob.run_model()
+
+            return prob
+
+        iter_counts = []
+        for options in ({}, {'use_aitken': True}, {'use_anderson': True}):
+            prob = run(**options)
+            iter_counts.append(prob.model.nonlinear_solver._iter_count)
+
+            assert_near_equal(prob.get_val('aero.y')[:3], [11.07723883, 10.32103344, 10.90090875],
+                              1e-8)
+
+        # plain, Aitken and Anderson
+        self.assertEqual(iter_counts, [91, 60, 22])
+
+    def test_NLBGS_Anderson_aitken_error(self):
+
+        solver = om.NonlinearBlockGS(use_aitken=True, use_anderson=True)
+        prob = om.Problem(model=SellarDerivatives(nonlinear_solver=solver))
+
+        prob.setup()
+
+        with self.assertRaises(ValueError) as cm:
+            prob.final_setup()
+
+        self.assertEqual(str(cm.exception),
+                         "NonlinearBlockGS in <model> <class SellarDerivatives>: use_aitken and "
+                         "use_anderson can't both be True.")
+
+    def test_NLBGS_Anderson_cs(self):
+
+        prob = om.Problem(model=SellarDerivatives())
+
+        model = prob.model
+        model.approx_totals(method='cs', step=1e-10)
+
+        prob.setup()
+        prob.set_solver_print(level=0)
+        model.nonlinear_solver.options['use_anderson'] = True
+        model.nonlinear_solver.options['atol'] = 1e-15
+        model.nonlinear_solver.options['rtol'] = 1e-15
+
+        prob.run_model()
+
+        assert_near_equal(prob.get_val('y1'), 25.58830273, .00001)
+        assert_near_equal(prob.get_val('y2'), 12.05848819, .00001)
+
+        J = prob.compute_totals(of=['y1'], wrt=['x'])
+        assert_near_equal(J['y1', 'x'][0][0], 0.98061448, 1e-6)
+
     def test_NLBGS_cs(self):
 
         prob = om.Problem(model=SellarDerivatives())
@@ -591,6 +695,46 @@ class ProcTestCase1(unittest.TestCase):
         # Test that Aitken accelerated the convergence, normally takes 7.
         self.assertTrue(model.nonlinear_solver._iter_count == 6)
 
+    def test_anderson(self):
+
+        prob = om.Problem()
+        model = prob.model
+        model.add_subsystem('px', om.IndepVarComp('x', 1.0), promotes=['x'])
+        model.add_subsystem('pz', om.IndepVarComp('z', np.array([5.0, 2.0])), promotes=['z'])
+
+        p1 = model.add_subsystem('p1', om.ParallelGroup(), promotes=['*'])
+        p1.add_subsystem('d1a', SellarDis1withDerivatives(), promotes=['x', 'z'])
+        p1.add_subsystem('d1b', SellarDis1withDerivatives(), promotes=['x', 'z'])
+
+        p2 = model.add_subsystem('p2', om.ParallelGroup(), promotes=['*'])
+        p2.add_subsystem('d2a', SellarDis2withDerivatives(), promotes=['z'])
+        p2.add_subsystem('d2b', SellarDis2withDerivatives(), promotes=['z'])
+
+        model.connect('d1a.y1', 'd2a.y1')
+        model.connect('d1b.y1', 'd2b.y1')
+        model.connect('d2a.y2', 'd1a.y2')
+        model.connect('d2b.y2', 'd1b.y2')
+
+        model.nonlinear_solver = om.NonlinearBlockGS()
+
+        prob.setup()
+        prob.set_solver_print(level=2)
+        model.nonlinear_solver.options['use_anderson'] = True
+
+        # Set one branch of Sellar close to the solution.
+        prob.set_val('d2b.y2', 12.05848815)
+        prob.set_val('d1b.y1', 25.58830237)
+
+        prob.run_model()
+
+        assert_near_equal(prob.get_val('d1a.y1', get_remote=True), 25.58830273, .00001)
+        assert_near_equal(prob.get_val('d1b.y1', get_remote=True), 25.58830273, .00001)
+        assert_near_equal(prob.get_val('d2a.y2', get_remote=True), 12.05848819, .00001)
+        assert_near_equal(prob.get_val('d2b.y2', get_remote=True), 12.05848819, .00001)
+
+        # Test that Anderson accelerated the convergence, normally takes 7.
+        self.assertEqual(model.nonlinear_solver._iter_count, 6)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,13 +1,16 @@
 """Test the Nonlinear Block Jacobi solver. """
 
+import threading
 import unittest
 
 import numpy as np
 
 import openmdao.api as om
 from openmdao.test_suite.components.ae_tests import AEComp, AEDriver
-from openmdao.test_suite.components.sellar import SellarDis1withDerivatives, SellarDis2withDerivatives
+from openmdao.test_suite.components.sellar import SellarDis1withDerivatives, SellarDis2withDerivatives, \
+     SellarDerivatives
 from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.testing_utils import use_tempdirs
 from openmdao.utils.mpi import MPI
 
 try:
@@ -153,6 +156,79 @@ class TestNLBlockJacobi(unittest.TestCase):
         assert_near_equal(prob['y2'], 12.05848819, .00001)
 
 
+class BarrierComp(om.ExplicitComponent):
+    """Component that can only finish its computations while its siblings run concurrently."""
+
+    def initialize(self):
+        self.options.declare('barrier')
+
+    def setup(self):
+        self.add_input('x', 1.0)
+        self.add_output('y', 1.0)
+
+    def compute(self, inputs, outputs):
+        self.options['barrier'].wait()
+        outputs['y'] = 0.5 * inputs['x'] + 1.0
+
+
+@use_tempdirs
+class TestNLBlockJacobiConcurrent(unittest.TestCase):
+
+    def run_sellar(self, **options):
+        prob = om.Problem(SellarDerivatives(nonlinear_solver=om.NonlinearBlockJac(**options),
+                                            nl_maxiter=50, nl_atol=1e-12,
+                                            linear_solver=om.DirectSolver()))
+        prob.model.add_design_var('x')
+        prob.model.add_objective('obj')
+        prob.setup(force_alloc_complex=True)
+        prob.set_solver_print(level=0)
+        prob.run_model()
+
+        return prob
+
+    def test_same_results(self):
+        expected = self.run_sellar()
+
+        prob = self.run_sellar(num_threads=3)
+
+        for name in ('y1', 'y2', 'obj', 'con1', 'con2'):
+            assert_near_equal(prob[name], expected[name], 1e-15)
+
+        self.assertEqual(prob.model.nonlinear_solver._iter_count,
+                         expected.model.nonlinear_solver._iter_count)
+
+    def test_threads_concurrent(self):
+        prob = om.Problem()
+        model = prob.model
+
+        barrier = threading.Barrier(2, timeout=10)
+        model.add_subsystem('c1', BarrierComp(barrier=barrier))
+        model.add_subsystem('c2', BarrierComp(barrier=barrier))
+        model.connect('c1.y', 'c2.x')
+        model.connect('c2.y', 'c1.x')
+        model.nonlinear_solver = om.NonlinearBlockJac(num_threads=2, maxiter=100, atol=1e-12)
+
+        prob.setup()
+        prob.set_solver_print(level=0)
+        prob.run_model()
+
+        assert_near_equal(prob['c1.y'], 2.0, 1e-8)
+        assert_near_equal(prob['c2.y'], 2.0, 1e-8)
+
+    def test_recording_error(self):
+        prob = om.Problem(SellarDerivatives(nonlinear_solver=om.NonlinearBlockJac(num_threads=2)))
+        prob.setup()
+        prob.model.d1.add_recorder(om.SqliteRecorder('cases.sql', record_viewer_data=False))
+
+        with self.assertRaises(RuntimeError) as cm:
+            prob.final_setup()
+
+        self.assertEqual(str(cm.exception),
+                         "NonlinearBlockJac in <model> <class SellarDerivatives>: Can't record "
+                         "cases of 'd1' <class SellarDis1withDerivatives> because it runs in a "
+                         "thread when num_threads is more than 1.")
+
+
 @unittest.skipUnless(MPI and PETScVector, "MPI and PETSc are required.")
 class TestNonlinearBlockJacobiMPI(unittest.TestCase):
 
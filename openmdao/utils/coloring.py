@@ -7,6 +7,7 @@ import time
 import warnings
 import json
 import pickle
+import hashlib
 import inspect
 import traceback
 from collections import OrderedDict, defaultdict
@@ -81,6 +82,21 @@ _DEF_COMP_SPARSITY_ARGS = {
 # for that instance.
 _CLASS_COLORINGS = {}
 
+# seed of the random numbers used to determine sparsity, so that it's the same on every run
+_SPARSITY_SEED = 41
+
+
+def _sparsity_rng():
+    """
+    Return a new random number generator for the perturbations used to determine sparsity.
+
+    Returns
+    -------
+    numpy.random.RandomState
+        Random number generator seeded with _SPARSITY_SEED.
+    """
+    return np.random.RandomState(_SPARSITY_SEED)
+
 
 # numpy versions before 1.12 don't use the 'axis' arg passed to count_nonzero and always
 # return an int instead of an array of ints, so create our own function for those versions.
@@ -1359,7 +1375,7 @@ def _compute_total_coloring_context(top):
     top : System
         Top of the system hierarchy where coloring will be done.
     """
-    np.random.seed(41)  # set seed for consistency
+    np.random.seed(_SPARSITY_SEED)  # set seed for consistency
 
     for system in top.system_iter(recurse=True, include_self=True):
         if system.matrix_free:
@@ -1618,6 +1634,137 @@ def _get_response_info(driver, names=None, use_abs_names=True):
     return abs_names, sizes
 
 
+def _update_hash(h, obj):
+    """
+    Update the given hash object with the contents of obj.
+
+    Parameters
+    ----------
+    h : hashlib hash object
+        The hash being updated.
+    obj : object
+        An ndarray, or any object with a repr that doesn't vary between runs.
+    """
+    if isinstance(obj, np.ndarray):
+        h.update(str(obj.dtype).encode())
+        h.update(repr(obj.shape).encode())
+        h.update(np.ascontiguousarray(obj).tobytes())
+    else:
+        h.update(repr(obj).encode())
+
+
+def _get_structure_hash(system, extra=()):
+    """
+    Return a hash of the structure of the given system.
+
+    The hash covers the names and sizes of all variables, all connections, the class of each
+    component and the sparsity of each declared partial derivative, along with any extra
+    objects that affect the coloring being cached.
+
+    Parameters
+    ----------
+    system : System
+        The System whose structure is being hashed.
+    extra : iter
+        Additional objects (ndarrays or objects with a stable repr) to include in the hash.
+
+    Returns
+    -------
+    str
+        The hex digest of the hash.
+    """
+    from openmdao.core.component import Component
+
+    h = hashlib.sha1()
+
+    for io in ('input', 'output'):
+        for name, meta in system._var_allprocs_abs2meta[io].items():
+            _update_hash(h, (name, meta['global_size']))
+
+    _update_hash(h, sorted(system._conn_global_abs_in2out.items()))
+
+    for comp in system.system_iter(include_self=True, recurse=True, typ=Component):
+        _update_hash(h, (comp.pathname, type(comp).__module__, type(comp).__name__))
+        for key in sorted(comp._subjacs_info):
+            meta = comp._subjacs_info[key]
+            _update_hash(h, (key, meta.get('shape'), meta.get('method')))
+            for name in ('rows', 'cols'):
+                if meta.get(name) is not None:
+                    _update_hash(h, np.asarray(meta[name]))
+
+    for obj in extra:
+        _update_hash(h, obj)
+
+    digest = h.hexdigest()
+
+    # subsystems may be distributed, so combine the hashes from all procs
+    if system.comm.size > 1:
+        digest = hashlib.sha1(''.join(system.comm.allgather(digest)).encode()).hexdigest()
+
+    return digest
+
+
+def _get_total_structure_hash(driver, num_full_jacs, tol, orders):
+    """
+    Return a hash of everything that determines the dynamic total coloring of a driver.
+
+    Parameters
+    ----------
+    driver : Driver
+        The driver whose total coloring is being cached.
+    num_full_jacs : int
+        Number of times to repeat total jacobian computation.
+    tol : float
+        Tolerance used to determine if an array entry is nonzero.
+    orders : int
+        Number of orders above and below the tolerance to check during the tolerance sweep.
+
+    Returns
+    -------
+    str
+        The hex digest of the hash.
+    """
+    problem = driver._problem()
+    extra = [_get_response_info(driver), _get_desvar_info(driver), problem._orig_mode,
+             num_full_jacs, tol, orders]
+
+    for meta_dict in (driver._designvars, driver._responses):
+        for name in sorted(meta_dict):
+            meta = meta_dict[name]
+            extra.append((name, meta.get('linear'), meta.get('parallel_deriv_color')))
+            if meta['indices'] is not None:
+                extra.append(np.asarray(meta['indices']))
+
+    return _get_structure_hash(problem.model, extra)
+
+
+def _load_cached_coloring(fname, structure_hash):
+    """
+    Load a coloring from the given file if it was computed for a model with the given structure.
+
+    Parameters
+    ----------
+    fname : str
+        Name of the coloring file.
+    structure_hash : str
+        Hash of the structure of the current model.
+
+    Returns
+    -------
+    Coloring or None
+        The cached coloring, or None if the file doesn't exist or holds a stale coloring.
+    """
+    if os.path.isfile(fname):
+        try:
+            coloring = Coloring.load(fname)
+        except Exception:
+            # an unreadable file is treated the same as a stale one
+            return
+
+        if coloring._meta.get('structure_hash') == structure_hash:
+            return coloring
+
+
 def get_tot_jac_sparsity(problem, mode='fwd',
                          num_full_jacs=_DEF_COMP_SPARSITY_ARGS['num_full_jacs'],
                          tol=_DEF_COMP_SPARSITY_ARGS['tol'],
@@ -1861,9 +2008,28 @@ def dynamic_total_coloring(driver, run_model=True, fname=None):
     tol = driver._coloring_info.get('tol', _DEF_COMP_SPARSITY_ARGS['tol'])
     orders = driver._coloring_info.get('orders', _DEF_COMP_SPARSITY_ARGS['orders'])
 
-    coloring = compute_total_coloring(problem, num_full_jacs=num_full_jacs, tol=tol, orders=orders,
-                                      setup=False, run_model=run_model, fname=fname,
-                                      use_abs_names=True)
+    # approx total colorings are cached by the model itself
+    use_cache = (problem.options['coloring_cache'] and fname is not None and
+                 not problem.model._approx_schemes)
+
+    coloring = None
+    if use_cache:
+        structure_hash = _get_total_structure_hash(driver, num_full_jacs, tol, orders)
+        coloring = _load_cached_coloring(fname, structure_hash)
+        if coloring is not None:
+            print("using cached total coloring from file %s" % fname)
+
+    if coloring is None:
+        coloring = compute_total_coloring(problem, num_full_jacs=num_full_jacs, tol=tol,
+                                          orders=orders, setup=False, run_model=run_model,
+                                          fname=None if use_cache else fname,
+                                          use_abs_names=True)
+        if use_cache and coloring is not None:
+            coloring._meta['structure_hash'] = structure_hash
+            model = problem.model
+            if ((model._full_comm is not None and model._full_comm.rank == 0) or
+                    (model._full_comm is None and model.comm.rank == 0)):
+                coloring.save(fname)
 
     if coloring is not None:
         if driver._coloring_info['show_sparsity']:
@@ -1,14 +1,68 @@
 """
-Utilities for submitting function evaluations under MPI.
+Utilities for submitting function evaluations under MPI or in threads.
 """
 import os
 import traceback
+import weakref
+from concurrent.futures import ThreadPoolExecutor, wait
 from itertools import chain, islice
 
 from openmdao.utils.mpi import debug
 
 trace = os.environ.get('OPENMDAO_TRACE')
 
+# thread pools, keyed by the object that uses them
+_thread_pools = weakref.WeakKeyDictionary()
+
+
+def thread_map(owner, num_threads, func, items, rec_iter=None):
+    """
+    Call a function on each item concurrently, using a pool of threads.
+
+    Each owner has its own pool, which is kept for later calls, so an owner that runs in a
+    thread of another owner's pool never waits on threads of the same pool.
+
+    Parameters
+    ----------
+    owner : object
+        The object that owns the thread pool.
+    num_threads : int
+        Number of threads in the pool.
+    func : function
+        The function to call on each item.
+    items : list
+        The items.
+    rec_iter : _RecIteration or None
+        If not None, each call starts with a copy of the recording iteration stack of the
+        calling thread.
+
+    Returns
+    -------
+    list
+        Return of the function for each item.  If any of the calls raised an exception, the
+        exception of the first item is raised once all of the calls have finished.
+    """
+    size, pool = _thread_pools.get(owner, (0, None))
+    if size != num_threads:
+        if pool is not None:
+            pool.shutdown(wait=False)
+        pool = ThreadPoolExecutor(max_workers=num_threads)
+        _thread_pools[owner] = (num_threads, pool)
+
+    if rec_iter is not None:
+        state = rec_iter.get_thread_state()
+
+        def call(item):
+            rec_iter.set_thread_state(state)
+            return func(item)
+    else:
+        call = func
+
+    futures = [pool.submit(call, item) for item in items]
+    wait(futures)
+
+    return [future.result() for future in futures]
+
 
 def concurrent_eval_lb(func, cases, comm, broadcast=False):
     """
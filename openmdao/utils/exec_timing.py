@@ -0,0 +1,206 @@
+"""
+Low overhead timing of the execution of systems and solvers.
+"""
+
+import sys
+from contextlib import contextmanager
+
+from openmdao.utils.mpi import MPI
+from openmdao.utils.timing import _MethodTimer
+
+
+# execution methods of systems
+_system_exec_methods = [
+    '_solve_nonlinear',
+    '_apply_nonlinear',
+    '_linearize',
+    '_apply_linear',
+    '_solve_linear',
+]
+
+# execution methods of solvers
+_solver_exec_methods = [
+    'solve',
+    '_linearize',
+]
+
+_csv_columns = ['rank', 'pathname', 'class', 'method', 'calls', 'total', 'self']
+
+
+class ExecTimer(_MethodTimer):
+    """
+    Accumulates the time spent executing each system and solver instance.
+
+    Timings for a solver are stored under the pathname of the system that owns it.
+
+    Attributes
+    ----------
+    _system_class : class
+        The System class, used to distinguish systems from solvers.
+    """
+
+    def __init__(self):
+        """
+        Initialize attributes.
+        """
+        super().__init__()
+
+        from openmdao.core.system import System
+        self._system_class = System
+
+    def _get_key(self, obj, name):
+        """
+        Return the key that timings of the given call are accumulated under.
+
+        Parameters
+        ----------
+        obj : System or Solver
+            The object whose method was called.
+        name : str
+            Name of the method.
+
+        Returns
+        -------
+        tuple
+            The key, (pathname, classname, method name).
+        """
+        system = obj if isinstance(obj, self._system_class) else obj._system()
+        return (system.pathname, type(obj).__name__, name)
+
+    def start(self):
+        """
+        Start timing by wrapping the execution methods of all currently defined classes.
+        """
+        if self._orig:
+            return
+
+        from openmdao.solvers.solver import Solver
+
+        self._wrap_methods(self._system_class, _system_exec_methods)
+        self._wrap_methods(Solver, _solver_exec_methods)
+
+    def get_data(self):
+        """
+        Return the timing data collected in this process.
+
+        Returns
+        -------
+        list of dict
+            A dict with rank, pathname, class, method, calls, total and self entries for each
+            timed method of each instance, sorted by decreasing self time.
+        """
+        rank = MPI.COMM_WORLD.rank if MPI else 0
+        data = [{'rank': rank, 'pathname': path, 'class': cname, 'method': name,
+                 'calls': ncalls, 'total': total, 'self': selftime}
+                for (path, cname, name), (ncalls, total, selftime) in self.timings.items()]
+        data.sort(key=lambda d: d['self'], reverse=True)
+        return data
+
+    def _gather_data(self, comm):
+        """
+        Return the timing data from all ranks of the given communicator.
+
+        Parameters
+        ----------
+        comm : MPI.Comm or None
+            The communicator.  If None, MPI.COMM_WORLD is used when running under MPI.
+
+        Returns
+        -------
+        list of dict or None
+            Timing data from all ranks sorted by decreasing self time, or None on ranks
+            other than 0.
+        """
+        data = self.get_data()
+        if comm is None and MPI:
+            comm = MPI.COMM_WORLD
+        if comm is None or comm.size == 1:
+            return data
+
+        alldata = comm.gather(data, root=0)
+        if comm.rank != 0:
+            return None
+
+        data = [d for rdata in alldata for d in rdata]
+        data.sort(key=lambda d: d['self'], reverse=True)
+        return data
+
+    def report(self, out_stream=sys.stdout, sort='self', comm=None):
+        """
+        Write a report of the time spent in each system and solver, merged across ranks.
+
+        Under MPI, this must be called on all ranks of comm, but only rank 0 writes the report.
+
+        Parameters
+        ----------
+        out_stream : file-like
+            Where the report will be written.
+        sort : str
+            Column used to sort the entries.  Must be one of 'self', 'total', or 'calls'.
+        comm : MPI.Comm or None
+            Communicator to gather timings over.  Defaults to MPI.COMM_WORLD under MPI.
+        """
+        data = self._gather_data(comm)
+        if data is None:
+            return
+        data = sorted(data, key=lambda d: d[sort], reverse=True)
+
+        pwid = max([len('Pathname')] + [len(d['pathname']) for d in data])
+        cwid = max([len('Class')] + [len(d['class']) for d in data])
+
+        print("\nExecution time by system and solver:\n", file=out_stream)
+        template = "{:>5} {:<%d} {:<%d} {:<17} {:>9} {:>12} {:>12}" % (pwid, cwid)
+        print(template.format('Rank', 'Pathname', 'Class', 'Method', 'Calls', 'Self (s)',
+                              'Total (s)'), file=out_stream)
+        print(template.format('-' * 5, '-' * pwid, '-' * cwid, '-' * 17, '-' * 9, '-' * 12,
+                              '-' * 12), file=out_stream)
+        template = "{:>5} {:<%d} {:<%d} {:<17} {:>9} {:>12.4f} {:>12.4f}" % (pwid, cwid)
+        for d in data:
+            print(template.format(d['rank'], d['pathname'], d['class'], d['method'],
+                                  d['calls'], d['self'], d['total']), file=out_stream)
+
+    def save_csv(self, fname, comm=None):
+        """
+        Save the timing data from all ranks to a csv file.
+
+        Under MPI, this must be called on all ranks of comm, but only rank 0 writes the file.
+
+        Parameters
+        ----------
+        fname : str
+            Name of the csv file.
+        comm : MPI.Comm or None
+            Communicator to gather timings over.  Defaults to MPI.COMM_WORLD under MPI.
+        """
+        data = self._gather_data(comm)
+        if data is None:
+            return
+
+        with open(fname, 'w') as f:
+            print(','.join(_csv_columns), file=f)
+            for d in data:
+                print(','.join([str(d[c]) for c in _csv_columns]), file=f)
+
+
+@contextmanager
+def exec_timing(timer=None):
+    """
+    Time the execution of all systems and solvers within this context.
+
+    Parameters
+    ----------
+    timer : ExecTimer or None
+        If not None, accumulate timings into this timer.
+
+    Yields
+    ------
+    ExecTimer
+        The timer containing the timing data.
+    """
+    if timer is None:
+        timer = ExecTimer()
+    timer.start()
+    try:
+        yield timer
+    finally:
+        timer.stop()
@@ -6,9 +6,10 @@ Note: This is a work in progress.
 
 
 import re
+import copy
 
 from pyparsing import CaselessLiteral, Combine, OneOrMore, Optional, \
-    TokenConverter, Word, nums, oneOf, printables, ParserElement, alphanums
+    TokenConverter, Word, nums, oneOf, printables, ParserElement, alphanums, ParseException
 
 import numpy as np
 
@@ -37,6 +38,43 @@ def _getformat(val):
         return "%.16g"
 
 
+def _format_field(val):
+    """
+    Get the text that replaces a field of a template.
+
+    Parameters
+    ----------
+    val : float, int, bool or str
+        The value of the field.
+
+    Returns
+    -------
+    str
+        The text of the field.
+    """
+    if isinstance(val, float):
+        return _getformat(val) % val
+    return str(val)
+
+
+def _format_floats(vals):
+    """
+    Get the text that replaces fields of a template for an array of floats.
+
+    Parameters
+    ----------
+    vals : ndarray
+        The float values of the fields.
+
+    Returns
+    -------
+    list of str
+        The text of each field.
+    """
+    integral = (vals == np.trunc(vals)).tolist()
+    return [("%.1f" if i else "%.16g") % v for i, v in zip(integral, vals.tolist())]
+
+
 class _SubHelper(object):
     """
     Replaces file text at the correct word location in a line.
@@ -57,6 +95,9 @@ class _SubHelper(object):
         initial location where replacement is to occur.
     _end_location : int
         final location where replacement is to occur.
+    _replaced : list of tuple
+        span in the line, array index and new text of each field replaced since the last call
+        to set or set_array.
     """
 
     def __init__(self):
@@ -69,6 +110,7 @@ class _SubHelper(object):
         self._counter = 0
         self._start_location = 0
         self._end_location = 0
+        self._replaced = []
 
     def set(self, newtext, location):
         """
@@ -84,6 +126,7 @@ class _SubHelper(object):
         self._newtext = newtext
         self._replace_location = location
         self._current_location = 0
+        self._replaced = []
 
     def set_array(self, newtext, start_location, end_location):
         """
@@ -102,6 +145,7 @@ class _SubHelper(object):
         self._start_location = start_location
         self._end_location = end_location
         self._current_location = 0
+        self._replaced = []
 
     def replace(self, text):
         """
@@ -122,10 +166,9 @@ class _SubHelper(object):
         self._current_location += 1
 
         if self._current_location == self._replace_location:
-            if isinstance(self._newtext, float):
-                return _getformat(self._newtext) % self._newtext
-            else:
-                return str(self._newtext)
+            newval = _format_field(self._newtext)
+            self._replaced.append((text.span(), None, newval))
+            return newval
         else:
             return text.group()
 
@@ -151,11 +194,8 @@ class _SubHelper(object):
         if self._current_location >= self._start_location and \
            self._current_location <= self._end_location and \
            self._counter < end:
-            if isinstance(self._newtext[self._counter], float):
-                val = self._newtext[self._counter]
-                newval = _getformat(val) % val
-            else:
-                newval = str(self._newtext[self._counter])
+            newval = _format_field(self._newtext[self._counter])
+            self._replaced.append((text.span(), self._counter, newval))
             self._counter += 1
             return newval
         else:
@@ -288,6 +328,17 @@ class InputFileGenerator(object):
         the current row of the file
     _anchored : bool
         indicator that position is relative to a landmark location.
+    _shapes : list
+        shape of the value of each transfer since the template was set, or None for a
+        transfer_var.
+    _slots : list of tuple
+        transfer index, flat array index (or None) and kind ('fmt' or 'str') of each field
+        replaced since the template was set.
+    _slot_text : list of str
+        current text of each replaced field.
+    _pieces : dict
+        the contents of each line that has been changed, as a list of constant strings and
+        indices into _slots.
     """
 
     def __init__(self):
@@ -304,6 +355,11 @@ class InputFileGenerator(object):
         self._current_row = 0
         self._anchored = False
 
+        self._shapes = []
+        self._slots = []
+        self._slot_text = []
+        self._pieces = {}
+
     def set_template_file(self, filename):
         """
         Set the name of the template file to be used.
@@ -321,6 +377,11 @@ class InputFileGenerator(object):
         self._data = templatefile.readlines()
         templatefile.close()
 
+        self._shapes = []
+        self._slots = []
+        self._slot_text = []
+        self._pieces = {}
+
     def set_generated_file(self, filename):
         """
         Set the name of the file that will be generated.
@@ -445,6 +506,8 @@ class InputFileGenerator(object):
         sub.set(value, field)
         newline = re.sub(self._reg, sub.replace, line)
 
+        self._shapes.append(None)
+        self._record_fields(j, sub._replaced)
         self._data[j] = newline
 
     def transfer_array(self, value, row_start, field_start, field_end,
@@ -477,6 +540,7 @@ class InputFileGenerator(object):
             row_end = row_start
 
         sub = _SubHelper()
+        self._shapes.append((len(value),))
 
         for row in range(row_start, row_end + 1):
             j = self._current_row + row
@@ -491,6 +555,7 @@ class InputFileGenerator(object):
             field_start = 0
 
             newline = re.sub(self._reg, sub.replace_array, line)
+            self._record_fields(j, sub._replaced)
             self._data[j] = newline
 
         # Sometimes an array is too large for the example in the template
@@ -498,6 +563,7 @@ class InputFileGenerator(object):
         if sub._counter < len(value):
             for val in value[sub._counter:]:
                 newline = newline.rstrip() + sep + str(val)
+            self._record_overflow(j, value, sub._counter, sep)
             self._data[j] = newline
 
         # Sometimes an array is too small for the template
@@ -531,6 +597,7 @@ class InputFileGenerator(object):
             We need this to figure out if the template is too small or large.
         """
         sub = _SubHelper()
+        self._shapes.append(value.shape)
 
         i = 0
 
@@ -541,6 +608,7 @@ class InputFileGenerator(object):
             sub.set_array(value[i, :], field_start, field_end)
 
             newline = re.sub(self._reg, sub.replace_array, line)
+            self._record_fields(j, sub._replaced, offset=i * value.shape[1])
             self._data[j] = newline
 
             sub._current_location = 0
@@ -559,7 +627,9 @@ class InputFileGenerator(object):
         row : integer
             Row number to clear, relative to current anchor.
         """
-        self._data[self._current_row + row] = "\n"
+        j = self._current_row + row
+        self._data[j] = "\n"
+        self._pieces[j] = ["\n"]
 
     def generate(self, return_data=False):
         """
@@ -587,6 +657,258 @@ class InputFileGenerator(object):
         else:
             return None
 
+    def compile(self):
+        """
+        Compile the transfers made since the template was set into a reusable template.
+
+        The anchors and fields used by the transfers are located only once, so generating a
+        file from the compiled template is much faster than making the same transfers again.
+        Values given to the compiled template must have the same shapes as the values given
+        to the transfers here.
+
+        Returns
+        -------
+        CompiledTemplate
+            The compiled template.
+        """
+        consts = []
+        slots = []
+        text = []
+        for j, line in enumerate(self._data):
+            for piece in self._pieces.get(j, (line,)):
+                if isinstance(piece, str):
+                    text.append(piece)
+                else:
+                    consts.append(''.join(text))
+                    slots.append(self._slots[piece])
+                    text = []
+        consts.append(''.join(text))
+
+        return CompiledTemplate(consts, slots, self._shapes, self._output_filename)
+
+    def _split_pieces(self, pieces, start, end, slot):
+        """
+        Replace the text between two positions of a line by a field.
+
+        Parameters
+        ----------
+        pieces : list
+            The contents of the line, as constant strings and indices into _slots.
+        start : int
+            Position of the first character that is replaced.
+        end : int
+            Position after the last character that is replaced.
+        slot : int
+            Index of the field in _slots.
+
+        Returns
+        -------
+        list
+            The new contents of the line.
+        """
+        new_pieces = []
+        inserted = False
+        pos = 0
+        for piece in pieces:
+            const = isinstance(piece, str)
+            size = len(piece) if const else len(self._slot_text[piece])
+            if pos + size <= start or pos >= end:
+                new_pieces.append(piece)
+            elif const or (pos >= start and pos + size <= end):
+                if const and pos < start:
+                    new_pieces.append(piece[:start - pos])
+                if not inserted:
+                    new_pieces.append(slot)
+                    inserted = True
+                if const and pos + size > end:
+                    new_pieces.append(piece[end - pos:])
+            else:
+                raise RuntimeError("Can't compile template file %s because a value that was "
+                                   "transferred to it contains a delimiter." %
+                                   self._template_filename)
+            pos += size
+
+        return new_pieces
+
+    def _record_fields(self, j, replaced, offset=0):
+        """
+        Record the fields of a line that were replaced by the latest transfer.
+
+        Parameters
+        ----------
+        j : int
+            Index of the line.
+        replaced : list of tuple
+            Span in the line before the replacement, array index and new text of each field.
+        offset : int
+            Offset of the array indices in the flattened array.
+        """
+        if not replaced:
+            return
+
+        transfer = len(self._shapes) - 1
+        pieces = self._pieces.get(j, [self._data[j]])
+
+        # go from the end of the line so the spans of the remaining fields don't move
+        for (start, end), idx, text in reversed(replaced):
+            slot = len(self._slots)
+            self._slots.append((transfer, None if idx is None else idx + offset, 'fmt'))
+            self._slot_text.append(text)
+            pieces = self._split_pieces(pieces, start, end, slot)
+
+        self._pieces[j] = pieces
+
+    def _record_overflow(self, j, value, start, sep):
+        """
+        Record the values of an array that were added after the end of a line.
+
+        Parameters
+        ----------
+        j : int
+            Index of the line.
+        value : list or ndarray
+            The array.
+        start : int
+            Index of the first value added after the end of the line.
+        sep : str
+            Separator between the added values.
+        """
+        transfer = len(self._shapes) - 1
+        pieces = self._pieces.get(j, [self._data[j]])
+
+        # strip trailing whitespace, the same as the line itself
+        while pieces and isinstance(pieces[-1], str):
+            pieces[-1] = pieces[-1].rstrip()
+            if pieces[-1]:
+                break
+            pieces.pop()
+
+        for idx in range(start, len(value)):
+            slot = len(self._slots)
+            self._slots.append((transfer, idx, 'str'))
+            self._slot_text.append(str(value[idx]))
+            pieces.extend((sep, slot))
+
+        self._pieces[j] = pieces
+
+
+class CompiledTemplate(object):
+    """
+    A template compiled by an InputFileGenerator, used to generate input files quickly.
+
+    Attributes
+    ----------
+    _output_filename : str or None
+        the name of the output file.
+    _parts : ndarray
+        object array holding the constant text of the file, with a gap for each field.
+    _shapes : list
+        shape of the value of each transfer, or None for a scalar.
+    _fields : list of tuple
+        for each transfer, the positions in _parts and the flat array indices of its
+        formatted fields, followed by the same for its fields that were added after the
+        end of a line.
+    """
+
+    def __init__(self, consts, slots, shapes, output_filename):
+        """
+        Initialize attributes.
+
+        Parameters
+        ----------
+        consts : list of str
+            Constant text before, between and after the fields.
+        slots : list of tuple
+            Transfer index, flat array index (or None) and kind of each field.
+        shapes : list
+            Shape of the value of each transfer, or None for a scalar.
+        output_filename : str or None
+            Name of the file that will be generated.
+        """
+        self._output_filename = output_filename
+        self._shapes = list(shapes)
+
+        self._parts = np.empty(2 * len(consts) - 1, dtype=object)
+        self._parts[0::2] = consts
+
+        fields = [([], [], [], []) for _ in shapes]
+        for i, (transfer, idx, kind) in enumerate(slots):
+            pos, idxs = fields[transfer][:2] if kind == 'fmt' else fields[transfer][2:]
+            pos.append(2 * i + 1)
+            idxs.append(idx)
+
+        self._fields = [tuple(np.array(lst, dtype=int) if shape is not None else lst
+                              for lst in field) for field, shape in zip(fields, shapes)]
+
+    def set_generated_file(self, filename):
+        """
+        Set the name of the file that will be generated.
+
+        Parameters
+        ----------
+        filename : string
+            Name of the input file to be generated.
+        """
+        self._output_filename = filename
+
+    def generate(self, values, return_data=False):
+        """
+        Generate the input file using the given values.
+
+        Parameters
+        ----------
+        values : list
+            The value of each transfer that was compiled, in the order they were made.
+        return_data : bool
+            if True, generated file data will be returned as a string
+
+        Returns
+        -------
+        string
+            the generated file data if return_data is True or output filename
+            has not been provided, else None
+        """
+        if len(values) != len(self._shapes):
+            raise ValueError("Expected %d values but got %d." %
+                             (len(self._shapes), len(values)))
+
+        parts = self._parts.copy()
+
+        for i, (value, shape, field) in enumerate(zip(values, self._shapes, self._fields)):
+            pos, idxs, str_pos, str_idxs = field
+            if shape is None:
+                if pos:
+                    parts[pos] = _format_field(value)
+                continue
+
+            if np.shape(value) != shape:
+                raise ValueError("Expected value %d to have shape %s but it has shape %s." %
+                                 (i, shape, np.shape(value)))
+
+            if isinstance(value, np.ndarray):
+                value = value.ravel()
+                if value.dtype == np.float64:
+                    parts[pos] = _format_floats(value[idxs])
+                else:
+                    parts[pos] = [_format_field(v) for v in value[idxs]]
+            else:
+                parts[pos] = [_format_field(value[k]) for k in idxs]
+
+            parts[str_pos] = [str(value[k]) for k in str_idxs]
+
+        data = ''.join(parts)
+
+        if self._output_filename:
+            with open(self._output_filename, 'w') as f:
+                f.write(data)
+        else:
+            return_data = True
+
+        if return_data:
+            return data
+        else:
+            return None
+
 
 class FileParser(object):
     """
@@ -608,6 +930,17 @@ class FileParser(object):
         the current row of the file.
     _anchored : bool
         indicator that position is relative to a landmark location.
+    _anchor : tuple or None
+        text and row of the current anchor.
+    _transfers : list of tuple
+        method, arguments, current row, the text that must be found on given rows and the
+        delimiters, for each transfer since the file was set.
+    _white_chars : str
+        the characters skipped between fields when a line is parsed.
+    _textchars : str
+        the characters that make up string fields.
+    line_parse_token : <ParserElement>
+        the pyparsing grammar of a line.
     """
 
     def __init__(self, end_of_line_comment_char=None, full_line_comment_char=None):
@@ -632,6 +965,8 @@ class FileParser(object):
 
         self._current_row = 0
         self._anchored = False
+        self._anchor = None
+        self._transfers = []
 
         self.set_delimiters(self._delimiter)
 
@@ -659,6 +994,11 @@ class FileParser(object):
 
         inputfile.close()
 
+        self._current_row = 0
+        self._anchored = False
+        self._anchor = None
+        self._transfers = []
+
     def set_delimiters(self, delimiter):
         r"""
         Set the delimiters that are used to identify field boundaries.
@@ -719,6 +1059,7 @@ class FileParser(object):
                     if instance == occurrence:
                         self._current_row += count
                         self._anchored = True
+                        self._anchor = (anchor, self._current_row)
                         return
 
                 count += 1
@@ -740,6 +1081,7 @@ class FileParser(object):
                     if instance == occurrence:
                         self._current_row = count
                         self._anchored = True
+                        self._anchor = (anchor, self._current_row)
                         return
 
                 count -= 1
@@ -755,6 +1097,7 @@ class FileParser(object):
         """
         self._current_row = 0
         self._anchored = False
+        self._anchor = None
 
     def transfer_line(self, row):
         """
@@ -771,6 +1114,7 @@ class FileParser(object):
         string
             line at the location requested
         """
+        self._record('transfer_line', (row,))
         return self._data[self._current_row + row].rstrip()
 
     def transfer_var(self, row, field, fieldend=None):
@@ -795,6 +1139,7 @@ class FileParser(object):
         string
             data from the requested location in the file
         """
+        self._record('transfer_var', (row, field, fieldend))
         j = self._current_row + row
 
         line = self._data[j]
@@ -868,8 +1213,30 @@ class FileParser(object):
                         break
                 row -= 1
 
-        j = self._current_row + row + rowoffset
-        line = self._data[j]
+        self._record('_transfer_keyfield', (row + rowoffset, key, field),
+                     checks=((key, self._current_row + row),))
+
+        return self._transfer_keyfield(row + rowoffset, key, field)
+
+    def _transfer_keyfield(self, row, key, field):
+        """
+        Get a field from a line after replacing a key by a single field.
+
+        Parameters
+        ----------
+        row : integer
+            Number of lines offset from anchor line.
+        key : string
+            the key.
+        field : integer
+            Which field to transfer. Field 0 is the key.
+
+        Returns
+        -------
+        string
+            data from the requested location in the file
+        """
+        line = self._data[self._current_row + row]
 
         fields = self._parse_line().parseString(line.replace(key, "KeyField"))
 
@@ -903,6 +1270,7 @@ class FileParser(object):
         string
             data from the requested location in the file
         """
+        self._record('transfer_array', (rowstart, fieldstart, rowend, fieldend))
         j1 = self._current_row + rowstart
 
         if rowend is None:
@@ -982,6 +1350,8 @@ class FileParser(object):
             msg = "rowend must be greater than rowstart"
             raise ValueError(msg)
 
+        self._record('transfer_2Darray', (rowstart, fieldstart, rowend, fieldend))
+
         j1 = self._current_row + rowstart
         j2 = self._current_row + rowend + 1
         lines = list(self._data[j1:j2])
@@ -1028,6 +1398,40 @@ class FileParser(object):
 
         return data
 
+    def compile(self):
+        """
+        Compile the transfers made since the file was set into a reusable parser.
+
+        The compiled parser reads the same fields from files with the same layout as the
+        current file, without searching for the anchors or keys again.  Lines are also parsed
+        faster than they are here.
+
+        Returns
+        -------
+        CompiledParser
+            The compiled parser.
+        """
+        return CompiledParser(self)
+
+    def _record(self, method, args, checks=()):
+        """
+        Record a transfer so that it can be compiled.
+
+        Parameters
+        ----------
+        method : str
+            Name of the method that makes the transfer.
+        args : tuple
+            Arguments of the method.
+        checks : tuple
+            Text that must be found on given rows of a file for the transfer to be valid, in
+            addition to the current anchor.
+        """
+        if self._anchor is not None:
+            checks = (self._anchor,) + tuple(checks)
+        self._transfers.append((method, args, self._current_row, checks,
+                                (self._delimiter, self._white_chars, self._textchars)))
+
     def _parse_line(self):
         """
         Parse a single data line that may contain string or numerical data.
@@ -1086,3 +1490,146 @@ class FileParser(object):
         string_text = Word(textchars)
 
         self.line_parse_token = (OneOrMore((nan | num_float | mixed_exp | num_int | string_text)))
+
+        self._white_chars = ParserElement.DEFAULT_WHITE_CHARS
+        self._textchars = textchars
+
+
+class _LineTokenizer(object):
+    """
+    Parse a line into fields the same way as the pyparsing grammar of a FileParser, but faster.
+
+    Attributes
+    ----------
+    _regex : <Pattern>
+        regular expression that matches the next field of a line.
+    """
+
+    def __init__(self, white_chars, textchars):
+        """
+        Initialize attributes.
+
+        Parameters
+        ----------
+        white_chars : str
+            the characters skipped between fields.
+        textchars : str
+            the characters that make up string fields.
+        """
+        white = '[%s]*' % re.escape(white_chars) if white_chars else ''
+        self._regex = re.compile(
+            white + '(?:'
+            r'(?P<inf>Inf|\-Inf)|'
+            r'(?P<nan>NaN%|NaNQ|NaNS|NaN|nan|qNaN|sNaN|1\.\#SNAN|1\.\#QNAN|\-1\.\#IND)|'
+            r'(?P<float>[+-]?(?:[0-9]+\.[0-9]*|\.[0-9]+)(?:[EeDd][+-]?[0-9]+)?|'
+            r'[0-9]+[EeDd][+-]?[0-9]+)|'
+            r'(?P<int>[+-]?[0-9]+)|'
+            '(?P<str>[' + re.escape(textchars) + ']+))')
+
+    def parseString(self, line):
+        """
+        Parse a line.
+
+        Parameters
+        ----------
+        line : str
+            The line.
+
+        Returns
+        -------
+        list
+            The fields of the line, converted to int or float when they are numbers.
+        """
+        line = line.expandtabs()
+        match = self._regex.match
+        fields = []
+        pos = 0
+        while True:
+            m = match(line, pos)
+            if m is None:
+                break
+            pos = m.end()
+            kind = m.lastgroup
+            token = m.group(kind)
+            if kind == 'float':
+                fields.append(float(token.upper().replace('D', 'E')))
+            elif kind == 'int':
+                fields.append(int(token))
+            elif kind == 'inf':
+                fields.append(float('inf'))
+            elif kind == 'nan':
+                fields.append(float('nan'))
+            else:
+                fields.append(token)
+
+        if not fields:
+            raise ParseException(line, 0, "Expected a field")
+
+        return fields
+
+
+class CompiledParser(object):
+    """
+    A parser compiled by a FileParser, used to read the same fields from many files.
+
+    Attributes
+    ----------
+    _parser : FileParser
+        parser that reads the files.
+    _transfers : list of tuple
+        method, arguments, current row, the text that must be found on given rows and the
+        delimiters, for each transfer.
+    _tokenizers : dict
+        line tokenizer for each set of delimiters.
+    """
+
+    def __init__(self, parser):
+        """
+        Initialize attributes.
+
+        Parameters
+        ----------
+        parser : FileParser
+            The parser whose transfers are compiled.
+        """
+        self._transfers = list(parser._transfers)
+        self._parser = copy.copy(parser)
+        self._parser._transfers = []
+
+        self._tokenizers = {}
+        for transfer in self._transfers:
+            delims = transfer[-1]
+            if delims not in self._tokenizers:
+                self._tokenizers[delims] = _LineTokenizer(*delims[1:])
+
+    def parse(self, filename):
+        """
+        Read the fields of a file.
+
+        Parameters
+        ----------
+        filename : str
+            Name of the file.
+
+        Returns
+        -------
+        list
+            The data read by each transfer that was compiled, in the order they were made.
+        """
+        parser = self._parser
+        parser.set_file(filename)
+        data = parser._data
+
+        values = []
+        for method, args, row, checks, delims in self._transfers:
+            for text, j in checks:
+                if j >= len(data) or text not in data[j]:
+                    raise RuntimeError("Could not find pattern %s on line %d of output file %s, "
+                                       "so it doesn't have the layout the parser was compiled "
+                                       "for." % (text, j + 1, filename))
+            parser._current_row = row
+            parser._delimiter = delims[0]
+            parser.line_parse_token = self._tokenizers[delims]
+            values.append(getattr(parser, method)(*args))
+
+        return values
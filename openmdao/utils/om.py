@@ -41,6 +41,7 @@ from openmdao.utils.coloring import _total_coloring_setup_parser, _total_colorin
     _partial_coloring_setup_parser, _partial_coloring_cmd, \
     _view_coloring_setup_parser, _view_coloring_exec
 from openmdao.utils.scaffold import _scaffold_setup_parser, _scaffold_exec
+from openmdao.utils.setup_timing import _timing_setup_parser, _timing_cmd
 from openmdao.utils.file_utils import _load_and_exec, _to_filename
 from openmdao.utils.entry_points import _list_installed_setup_parser, _list_installed_cmd, \
     split_ep, _compute_entry_points_setup_parser, _compute_entry_points_exec, \
@@ -70,6 +71,8 @@ def _n2_setup_parser(parser):
     parser.add_argument('--use_declare_partial_info', action='store_true',
                         dest='use_declare_partial_info',
                         help="ignored, now always true.")
+    parser.add_argument('--no_values', action='store_true', dest='no_values',
+                        help="don't include variable values in the diagram.")
 
 
 def _n2_cmd(options, user_args):
@@ -96,7 +99,8 @@ def _n2_cmd(options, user_args):
 
         def _viewmod(prob):
             n2(prob, outfile=options.outfile, show_browser=not options.no_browser,
-                title=options.title, embeddable=options.embeddable)
+                title=options.title, embeddable=options.embeddable,
+                values=not options.no_values)
             exit()  # could make this command line selectable later
 
         hooks._register_hook('setup', 'Problem', pre=_noraise)
@@ -107,7 +111,8 @@ def _n2_cmd(options, user_args):
     else:
         # assume the file is a recording, run standalone
         n2(filename, outfile=options.outfile, title=options.title,
-            show_browser=not options.no_browser, embeddable=options.embeddable)
+            show_browser=not options.no_browser, embeddable=options.embeddable,
+            values=not options.no_values)
 
 
 def _view_connections_setup_parser(parser):
@@ -465,6 +470,8 @@ _command_map = {
                  'Generate a simple scaffold for a component.'),
     'summary': (_config_summary_setup_parser, _config_summary_cmd,
                 'Print a short top-level summary of the problem.'),
+    'timing': (_timing_setup_parser, _timing_cmd,
+               'Report time spent in each setup phase, by system class.'),
     'total_coloring': (_total_coloring_setup_parser, _total_coloring_cmd,
                        'Compute a coloring for the total jacobian.'),
     'trace': (_itrace_setup_parser, _itrace_exec, 'Dump trace output.'),
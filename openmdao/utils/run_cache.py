@@ -0,0 +1,166 @@
+"""
+Define the RunCache class, an on-disk cache of the files written by runs of an external code.
+"""
+import os
+import shutil
+import hashlib
+import tempfile
+
+import numpy as np
+
+
+class RunCache(object):
+    """
+    On-disk cache of the files written by runs of an external code.
+
+    Each run is stored in its own directory, named by a hash of everything the run depends on,
+    so a cache directory can be shared by several components.  When the total size of the
+    cached files grows beyond the maximum size, the least recently used runs are removed.
+
+    Attributes
+    ----------
+    _cache_dir : str
+        Absolute path of the directory where the runs are cached.
+    _max_size : int
+        Maximum total size in bytes of the cached files.
+    """
+
+    def __init__(self, cache_dir, max_size):
+        """
+        Initialize attributes.
+
+        Parameters
+        ----------
+        cache_dir : str
+            Directory where the runs are cached.  It's created if it doesn't exist.
+        max_size : int
+            Maximum total size in bytes of the cached files.
+        """
+        self._cache_dir = os.path.abspath(cache_dir)
+        self._max_size = max_size
+        os.makedirs(self._cache_dir, exist_ok=True)
+
+    def get_key(self, command, env_vars, input_files, output_files, values):
+        """
+        Return the key of a run.
+
+        Parameters
+        ----------
+        command : list or str
+            The command that is run.
+        env_vars : dict
+            Environment variables of the command.
+        input_files : list of str
+            Files read by the run.  Their contents are part of the key.
+        output_files : list of str
+            Files written by the run.
+        values : ndarray
+            Values of the variables of the component.
+
+        Returns
+        -------
+        str
+            The key.
+        """
+        sha = hashlib.sha256()
+        sha.update(repr((command, sorted(env_vars.items()), output_files)).encode())
+
+        for fname in input_files:
+            sha.update(fname.encode())
+            if os.path.isfile(fname):
+                with open(fname, 'rb') as f:
+                    for chunk in iter(lambda: f.read(1 << 20), b''):
+                        sha.update(chunk)
+            else:
+                sha.update(b'\0missing')
+
+        sha.update(np.ascontiguousarray(values).tobytes())
+
+        return sha.hexdigest()
+
+    def restore(self, key, output_files):
+        """
+        Copy the files written by a cached run to where the run wrote them.
+
+        Parameters
+        ----------
+        key : str
+            Key of the run.
+        output_files : list of str
+            Files written by the run, in the same order as when the run was stored.
+
+        Returns
+        -------
+        int or None
+            Return code of the run, or None if it isn't in the cache.
+        """
+        entry = os.path.join(self._cache_dir, key)
+        try:
+            with open(os.path.join(entry, 'return_code'), 'r') as f:
+                return_code = int(f.read())
+
+            for i, fname in enumerate(output_files):
+                shutil.copyfile(os.path.join(entry, str(i)), fname)
+
+            # the modification time of an entry is the time it was last used
+            os.utime(entry)
+        except (OSError, ValueError):
+            # the entry is missing, or was evicted while it was being read
+            return None
+
+        return return_code
+
+    def store(self, key, output_files, return_code):
+        """
+        Add the files written by a run to the cache.
+
+        Parameters
+        ----------
+        key : str
+            Key of the run.
+        output_files : list of str
+            Files written by the run.
+        return_code : int
+            Return code of the run.
+        """
+        entry = os.path.join(self._cache_dir, key)
+        if os.path.isdir(entry):
+            return
+
+        # write to a temporary directory first so that other processes never see a partial run
+        tmp = tempfile.mkdtemp(prefix='.tmp-', dir=self._cache_dir)
+        try:
+            for i, fname in enumerate(output_files):
+                shutil.copyfile(fname, os.path.join(tmp, str(i)))
+            with open(os.path.join(tmp, 'return_code'), 'w') as f:
+                f.write(str(return_code))
+            os.rename(tmp, entry)
+        except OSError:
+            # a file is missing, or another process stored the same run first
+            shutil.rmtree(tmp, ignore_errors=True)
+            return
+
+        self._evict()
+
+    def _evict(self):
+        """
+        Remove the least recently used runs until the cache is no larger than its maximum size.
+        """
+        entries = []
+        total = 0
+        for name in os.listdir(self._cache_dir):
+            entry = os.path.join(self._cache_dir, name)
+            if name.startswith('.tmp-') or not os.path.isdir(entry):
+                continue
+            try:
+                size = sum(os.path.getsize(os.path.join(entry, f)) for f in os.listdir(entry))
+                entries.append((os.path.getmtime(entry), size, entry))
+            except OSError:
+                continue
+            total += size
+
+        for _, size, entry in sorted(entries):
+            if total <= self._max_size:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
@@ -0,0 +1,263 @@
+"""
+Low overhead timing of the setup phases of a Problem.
+"""
+
+import sys
+import json
+import atexit
+from io import StringIO
+from contextlib import contextmanager
+
+from openmdao.utils.mpi import MPI
+from openmdao.utils.timing import _MethodTimer
+from openmdao.utils.exec_timing import ExecTimer
+import openmdao.utils.hooks as hooks
+from openmdao.utils.file_utils import _load_and_exec
+
+
+# setup methods of systems, in roughly the order they are called
+_system_setup_methods = [
+    '_setup_procs',
+    'setup',
+    '_configure',
+    'configure',
+    '_setup_var_data',
+    '_setup_vec_names',
+    '_setup_global_connections',
+    '_setup_dynamic_shapes',
+    '_setup_auto_ivcs',
+    '_setup_relevance',
+    '_setup_var_sizes',
+    '_setup_global_shapes',
+    '_setup_connections',
+    '_setup_driver_units',
+    '_setup_partials',
+    'setup_partials',
+    '_setup_vectors',
+    '_setup_transfers',
+    '_setup_solvers',
+    '_setup_jacobians',
+    '_setup_recording',
+    'set_initial_values',
+    '_compute_approx_coloring',
+]
+
+_problem_setup_methods = [
+    'setup',
+    'final_setup',
+    '_setup_recording',
+    '_set_initial_conditions',
+]
+
+_driver_setup_methods = [
+    '_setup_driver',
+    '_setup_recording',
+]
+
+# module level functions that are timed along with the setup methods
+_coloring_funcs = [
+    'dynamic_total_coloring',
+    '_get_bool_total_jac',
+]
+
+
+class SetupTimer(_MethodTimer):
+    """
+    Accumulates the time spent in each setup method, grouped by class.
+    """
+
+    def start(self):
+        """
+        Start timing by wrapping all setup methods of all currently defined classes.
+        """
+        if self._orig:
+            return
+
+        from openmdao.core.system import System
+        from openmdao.core.problem import Problem
+        from openmdao.core.driver import Driver
+        import openmdao.utils.coloring as coloring_mod
+
+        self._wrap_methods(System, _system_setup_methods)
+        self._wrap_methods(Problem, _problem_setup_methods)
+        self._wrap_methods(Driver, _driver_setup_methods)
+
+        for name in _coloring_funcs:
+            self._replace(coloring_mod, name,
+                          self._wrap(coloring_mod.__dict__[name], name, label='coloring'))
+
+    def get_data(self):
+        """
+        Return the collected timing data.
+
+        Returns
+        -------
+        dict
+            Dict containing a 'phases' dict of outermost time per method name and a
+            'classes' list of dicts with class, method, calls, total and self entries,
+            sorted by decreasing self time.
+        """
+        classes = [{'class': cname, 'method': name, 'calls': ncalls, 'total': total,
+                    'self': selftime}
+                   for (cname, name), (ncalls, total, selftime) in self.timings.items()]
+        classes.sort(key=lambda d: d['self'], reverse=True)
+
+        return {
+            'phases': dict(sorted(self.phases.items(), key=lambda t: t[1], reverse=True)),
+            'classes': classes,
+        }
+
+    def report(self, out_stream=sys.stdout, sort='self'):
+        """
+        Write a report of time spent in each setup phase and by each class.
+
+        Parameters
+        ----------
+        out_stream : file-like
+            Where the report will be written.
+        sort : str
+            Column used to sort the per class entries.  Must be one of 'self', 'total',
+            or 'calls'.
+        """
+        data = self.get_data()
+        classes = sorted(data['classes'], key=lambda d: d[sort], reverse=True)
+
+        print("\nSetup phases (outermost calls):\n", file=out_stream)
+        print("{:<30} {:>12}".format('Method', 'Time (s)'), file=out_stream)
+        print("{:<30} {:>12}".format('-' * 30, '-' * 12), file=out_stream)
+        for name, elapsed in data['phases'].items():
+            print("{:<30} {:>12.4f}".format(name, elapsed), file=out_stream)
+
+        cwid = max([len('Class')] + [len(d['class']) for d in classes])
+
+        print("\nSetup methods by class:\n", file=out_stream)
+        template = "{:<%d} {:<30} {:>9} {:>12} {:>12}" % cwid
+        print(template.format('Class', 'Method', 'Calls', 'Self (s)', 'Total (s)'),
+              file=out_stream)
+        print(template.format('-' * cwid, '-' * 30, '-' * 9, '-' * 12, '-' * 12),
+              file=out_stream)
+        template = "{:<%d} {:<30} {:>9} {:>12.4f} {:>12.4f}" % cwid
+        for d in classes:
+            print(template.format(d['class'], d['method'], d['calls'], d['self'], d['total']),
+                  file=out_stream)
+
+    def save_json(self, fname):
+        """
+        Save the collected timing data to a json file.
+
+        Parameters
+        ----------
+        fname : str
+            Name of the json file.
+        """
+        with open(fname, 'w') as f:
+            json.dump(self.get_data(), f, indent=2)
+
+
+@contextmanager
+def setup_timing(timer=None):
+    """
+    Time all setup methods called within this context.
+
+    Parameters
+    ----------
+    timer : SetupTimer or None
+        If not None, accumulate timings into this timer.
+
+    Yields
+    ------
+    SetupTimer
+        The timer containing the timing data.
+    """
+    if timer is None:
+        timer = SetupTimer()
+    timer.start()
+    try:
+        yield timer
+    finally:
+        timer.stop()
+
+
+def _timing_setup_parser(parser):
+    """
+    Set up the openmdao subparser for the 'openmdao timing' command.
+
+    Parameters
+    ----------
+    parser : argparse subparser
+        The parser we're adding options to.
+    """
+    parser.add_argument('file', nargs=1, help='Python file containing the model.')
+    parser.add_argument('-o', default=None, action='store', dest='outfile',
+                        help='Name of output file.  By default, output goes to stdout.')
+    parser.add_argument('-j', '--json', default=None, action='store', dest='json_file',
+                        help='Name of json file to save timing data to.')
+    parser.add_argument('-s', '--sort', default='self', action='store', dest='sort',
+                        choices=['self', 'total', 'calls'],
+                        help='Column used to sort the entries for each class.')
+    parser.add_argument('--setup_only', action='store_true', dest='setup_only',
+                        help="Exit after final_setup instead of running the rest of the script.")
+    parser.add_argument('-e', '--exec', action='store_true', dest='exec_timing',
+                        help="Also report the time spent executing each system and solver.")
+    parser.add_argument('--csv', default=None, action='store', dest='csv_file',
+                        help='Name of csv file to save execution timing data from all ranks to.')
+
+
+def _timing_cmd(options, user_args):
+    """
+    Run the `openmdao timing` command.
+
+    Parameters
+    ----------
+    options : argparse Namespace
+        Command line options.
+    user_args : list of str
+        Args to be passed to the user script.
+    """
+    timer = SetupTimer()
+    exec_timer = ExecTimer() if options.exec_timing or options.csv_file else None
+
+    def _finish():
+        timer.stop()
+        if exec_timer is not None:
+            exec_timer.stop()
+            # execution timings are gathered from all ranks, so this is called on every rank
+            if options.csv_file is not None:
+                exec_timer.save_csv(options.csv_file)
+            exec_stream = StringIO()
+            exec_timer.report(exec_stream, sort=options.sort)
+
+        if MPI and MPI.COMM_WORLD.rank != 0:
+            return
+
+        if options.outfile is None:
+            out_stream = sys.stdout
+        else:
+            out_stream = open(options.outfile, 'w')
+        try:
+            timer.report(out_stream, sort=options.sort)
+            if exec_timer is not None:
+                out_stream.write(exec_stream.getvalue())
+        finally:
+            if out_stream is not sys.stdout:
+                out_stream.close()
+
+        if options.json_file is not None:
+            timer.save_json(options.json_file)
+
+    def _exit(prob):
+        _finish()
+        sys.exit(0)
+
+    if options.setup_only:
+        hooks._register_hook('final_setup', 'Problem', post=_exit)
+    else:
+        atexit.register(_finish)
+
+    # Classes defined in the script are not wrapped, but time spent in their setup methods
+    # is still included in the self time of the base class methods that call them.
+    timer.start()
+    if exec_timer is not None:
+        exec_timer.start()
+
+    _load_and_exec(options.file[0], user_args)
@@ -1,9 +1,14 @@
 """Some basic shell utilities, used for ExternalCodeComp mostly."""
 import os
+import json
+import queue
+import shlex
 import signal
 import subprocess
 import sys
+import threading
 import time
+import traceback
 
 PIPE = subprocess.PIPE
 STDOUT = subprocess.STDOUT
@@ -199,7 +204,7 @@ class ShellProc(subprocess.Popen):
         ----------
         poll_delay : float (seconds)
             Time to delay between polling for command completion.
-            A value of zero uses an internal default.
+            A value of zero waits for completion without polling.
         timeout : float (seconds)
             Maximum time to wait for command completion.
             A value of zero implies an infinite maximum wait.
@@ -214,19 +219,23 @@ class ShellProc(subprocess.Popen):
         return_code = None
         try:
             if poll_delay <= 0:
-                poll_delay = max(0.1, timeout / 100.)
-                poll_delay = min(10., poll_delay)
-            npolls = int(timeout / poll_delay) + 1
-
-            time.sleep(poll_delay)
-            return_code = self.poll()
-            while return_code is None:
-                npolls -= 1
-                if (timeout > 0) and (npolls < 0):
+                # block until the process exits rather than polling for it
+                try:
+                    return_code = subprocess.Popen.wait(self, timeout if timeout > 0 else None)
+                except subprocess.TimeoutExpired:
                     self.terminate()
-                    break
+            else:
+                npolls = int(timeout / poll_delay) + 1
+
                 time.sleep(poll_delay)
                 return_code = self.poll()
+                while return_code is None:
+                    npolls -= 1
+                    if (timeout > 0) and (npolls < 0):
+                        self.terminate()
+                        break
+                    time.sleep(poll_delay)
+                    return_code = self.poll()
         finally:
             self.close_files()
 
@@ -274,6 +283,200 @@ class ShellProc(subprocess.Popen):
         return error_msg
 
 
+class WorkerProc(ShellProc):
+    """
+    A long-running child process that does a run of an external code each time it's asked to.
+
+    Each request is written to the stdin of the process, and the process writes its reply to its
+    stdout.  Each message is a line containing the length of its body in bytes, followed by the
+    body, which is a JSON object.  A request has a 'command' entry, the command that would have
+    been run, and a 'cwd' entry, the directory to do the run in.  A reply has a 'return_code'
+    entry and an optional 'error' entry.  The :func:`serve_requests` function implements the
+    worker side of this protocol for programs written in Python.
+
+    Attributes
+    ----------
+    _owner : int
+        Id of the process that started the worker.
+    _replies : Queue
+        Replies read from the worker.  None is put in it when the worker exits.
+    """
+
+    def __init__(self, args, stderr=None, env=None):
+        """
+        Start the worker.
+
+        Parameters
+        ----------
+        args : str or list
+            If a string, then this is the command line to execute and the
+            :class:`subprocess.Popen` ``shell`` argument is set True.
+            Otherwise, this is a list of arguments; the first is the command
+            to execute.
+        stderr : str, file, or int
+            Specify handling of stderr stream. If a string, a file
+            of that name is opened. Otherwise, see the :mod:`subprocess`
+            documentation.
+        env : dict
+            Environment variables for the command.
+        """
+        super().__init__(args, PIPE, PIPE, stderr, env)
+        self._owner = os.getpid()
+        self._replies = queue.Queue()
+
+        # replies are read by a thread so that waiting for one can time out on every platform
+        reader = threading.Thread(target=self._read_replies, daemon=True)
+        reader.start()
+
+    def _read_replies(self):
+        """
+        Read replies from the worker until it exits.
+        """
+        try:
+            while True:
+                reply = _read_message(self.stdout)
+                self._replies.put(reply)
+                if reply is None:
+                    break
+        except Exception:
+            self._replies.put(None)
+
+    def request(self, command, timeout=0.):
+        """
+        Ask the worker to do a run in the current directory, and wait for it to finish.
+
+        Parameters
+        ----------
+        command : str or list
+            The command that would have been run.
+        timeout : float (seconds)
+            Maximum time to wait for the run to finish.
+            A value of zero implies an infinite maximum wait.
+
+        Returns
+        -------
+        int
+            Return Code
+        str
+            Error Message
+        """
+        try:
+            _write_message(self.stdin, {'command': command, 'cwd': os.getcwd()})
+            reply = self._replies.get(timeout=timeout if timeout > 0 else None)
+        except queue.Empty:
+            self.terminate()
+            return (None, 'Timed out')
+        except OSError:
+            reply = None
+
+        if reply is None:
+            return_code = subprocess.Popen.wait(self)
+            return (return_code if return_code else -1,
+                    'Worker process exited%s' % self.error_message(return_code))
+
+        return (reply['return_code'], reply.get('error', ''))
+
+    def stop(self, timeout=10.):
+        """
+        Tell the worker to exit by closing its stdin, and wait for it to do so.
+
+        Parameters
+        ----------
+        timeout : float (seconds)
+            Maximum time to wait for the worker to exit before it's terminated.
+        """
+        try:
+            self.stdin.close()
+            subprocess.Popen.wait(self, timeout)
+        except (OSError, subprocess.TimeoutExpired):
+            self.terminate()
+        finally:
+            self.stdout.close()
+            self.close_files()
+
+
+def _write_message(stream, msg):
+    """
+    Write a message with a length prefix to a binary stream.
+
+    Parameters
+    ----------
+    stream : file
+        The stream.
+    msg : dict
+        The message.
+    """
+    body = json.dumps(msg).encode()
+    stream.write(b'%d\n' % len(body))
+    stream.write(body)
+    stream.flush()
+
+
+def _read_message(stream):
+    """
+    Read a message with a length prefix from a binary stream.
+
+    Parameters
+    ----------
+    stream : file
+        The stream.
+
+    Returns
+    -------
+    dict or None
+        The message, or None if the end of the stream has been reached.
+    """
+    header = stream.readline()
+    if not header:
+        return None
+
+    size = int(header)
+    body = stream.read(size)
+    if len(body) < size:
+        return None
+
+    return json.loads(body.decode())
+
+
+def serve_requests(run):
+    """
+    Do the runs requested by an ExternalCodeComp until it stops the worker.
+
+    This is the worker side of the protocol used by :class:`WorkerProc`.  Since replies are
+    written to stdout, anything the runs print is sent to stderr instead.
+
+    Parameters
+    ----------
+    run : function
+        Function that does a run.  It's called in the directory of the run with the arguments
+        of the command, and returns the return code of the run, where None means 0.  If it
+        raises an exception, the return code is 1.
+    """
+    stdin = sys.stdin.buffer
+    stdout = sys.stdout.buffer
+    sys.stdout = sys.stderr
+
+    while True:
+        request = _read_message(stdin)
+        if request is None:
+            break
+
+        command = request['command']
+        args = shlex.split(command) if isinstance(command, str) else command
+
+        try:
+            os.chdir(request['cwd'])
+            return_code = run(args)
+            reply = {'return_code': 0 if return_code is None else return_code}
+        except Exception:
+            error = traceback.format_exc()
+            sys.stderr.write(error)
+            sys.stderr.flush()
+            reply = {'return_code': 1, 'error': error}
+
+        _write_message(stdout, reply)
+
+
 def call(args, stdin=None, stdout=None, stderr=None, env=None,
          poll_delay=0., timeout=0.):
     """
@@ -302,7 +505,7 @@ def call(args, stdin=None, stdout=None, stderr=None, env=None,
         Environment variables for the command.
     poll_delay : float (seconds)
         Time to delay between polling for command completion.
-        A value of zero uses an internal default.
+        A value of zero waits for completion without polling.
     timeout : float (seconds)
         Maximum time to wait for command completion.
         A value of zero implies an infinite maximum wait.
@@ -348,7 +551,7 @@ def check_call(args, stdin=None, stdout=None, stderr=None, env=None,
         Environment variables for the command.
     poll_delay : float (seconds)
         Time to delay between polling for command completion.
-        A value of zero uses an internal default.
+        A value of zero waits for completion without polling.
     timeout : float (seconds)
         Maximum time to wait for command completion.
         A value of zero implies an infinite maximum wait.
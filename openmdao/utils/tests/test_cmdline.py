@@ -37,6 +37,9 @@ cmd_tests = [
     'openmdao scaffold -b ImplicitComponent -c Foo',
     'openmdao scaffold -p blahpkg --cmd=hello',
     'openmdao summary {}'.format(os.path.join(scriptdir, 'circle_opt.py')),
+    'openmdao timing {}'.format(os.path.join(scriptdir, 'circle_opt.py')),
+    'openmdao timing --setup_only -j timing.json {}'.format(os.path.join(scriptdir, 'circle_opt.py')),
+    'openmdao timing -e --csv timing.csv {}'.format(os.path.join(scriptdir, 'circle_opt.py')),
     'openmdao total_coloring {}'.format(os.path.join(scriptdir, 'circle_opt.py')),
     'openmdao trace {}'.format(os.path.join(scriptdir, 'circle_opt.py')),
     'openmdao tree -c {}'.format(os.path.join(scriptdir, 'circle_opt.py')),
@@ -0,0 +1,114 @@
+import threading
+import time
+import unittest
+from io import StringIO
+
+import openmdao.api as om
+from openmdao.core.explicitcomponent import ExplicitComponent
+from openmdao.solvers.nonlinear.nonlinear_block_gs import NonlinearBlockGS
+from openmdao.solvers.solver import NonlinearSolver
+from openmdao.test_suite.components.sellar import SellarDerivatives
+from openmdao.utils.exec_timing import ExecTimer, exec_timing
+from openmdao.utils.testing_utils import use_tempdirs
+
+
+@use_tempdirs
+class TestExecTiming(unittest.TestCase):
+
+    def test_timing(self):
+        prob = om.Problem(SellarDerivatives(linear_solver=om.DirectSolver))
+        prob.setup()
+
+        with exec_timing() as timer:
+            prob.run_model()
+            prob.compute_totals(of=['obj'], wrt=['x', 'z'])
+
+        # original methods are restored
+        self.assertFalse(hasattr(ExplicitComponent.__dict__['_solve_nonlinear'], '__wrapped__'))
+        self.assertFalse(hasattr(NonlinearBlockGS.__dict__['_run_apply'], '__wrapped__'))
+        self.assertFalse(hasattr(NonlinearSolver.__dict__['solve'], '__wrapped__'))
+
+        data = timer.get_data()
+        entries = {(d['pathname'], d['class'], d['method']): d for d in data}
+
+        niter = prob.model.nonlinear_solver._iter_count
+        self.assertEqual(entries[('', 'SellarDerivatives', '_solve_nonlinear')]['calls'], 1)
+        self.assertEqual(entries[('', 'NonlinearBlockGS', 'solve')]['calls'], 1)
+        self.assertTrue(entries[('d1', 'SellarDis1withDerivatives',
+                                 '_solve_nonlinear')]['calls'] >= niter)
+        self.assertEqual(entries[('d1', 'SellarDis1withDerivatives', '_linearize')]['calls'], 1)
+        self.assertEqual(entries[('', 'DirectSolver', '_linearize')]['calls'], 1)
+        self.assertTrue(entries[('', 'DirectSolver', 'solve')]['calls'] > 0)
+
+        for d in data:
+            self.assertEqual(d['rank'], 0)
+            self.assertTrue(d['self'] <= d['total'] + 1e-12)
+
+        # the model's total time includes the time spent in its solver
+        self.assertTrue(entries[('', 'SellarDerivatives', '_solve_nonlinear')]['total'] >=
+                        entries[('', 'NonlinearBlockGS', 'solve')]['total'])
+
+    def test_report_and_csv(self):
+        prob = om.Problem(SellarDerivatives())
+        prob.setup()
+
+        timer = ExecTimer()
+        with exec_timing(timer):
+            prob.run_model()
+        with exec_timing(timer):
+            prob.run_model()
+
+        entries = {(d['pathname'], d['method']): d for d in timer.get_data()}
+        self.assertEqual(entries[('', '_solve_nonlinear')]['calls'], 2)
+
+        stream = StringIO()
+        timer.report(stream, sort='calls')
+        self.assertTrue('Execution time by system and solver' in stream.getvalue())
+
+        timer.save_csv('timing.csv')
+        with open('timing.csv', 'r') as f:
+            lines = f.read().splitlines()
+
+        self.assertEqual(lines[0], 'rank,pathname,class,method,calls,total,self')
+        self.assertEqual(len(lines), len(timer.timings) + 1)
+
+    def test_threads(self):
+        barrier = threading.Barrier(3, timeout=10.)
+
+        class SleepComp(om.ExplicitComponent):
+            def setup(self):
+                self.add_input('x', 1.0)
+                self.add_output('y', 1.0)
+
+            def compute(self, inputs, outputs):
+                # make sure the components are running at the same time
+                barrier.wait()
+                time.sleep(0.05)
+                outputs['y'] = inputs['x']
+
+        prob = om.Problem()
+        par = prob.model.add_subsystem('par', om.ParallelGroup(num_threads=3))
+        for i in range(3):
+            par.add_subsystem('c%d' % i, SleepComp())
+        prob.setup()
+
+        with exec_timing() as timer:
+            prob.run_model()
+
+        self.assertFalse(barrier.broken)
+
+        entries = {(d['pathname'], d['method']): d for d in timer.get_data()}
+        for i in range(3):
+            d = entries[('par.c%d' % i, '_solve_nonlinear')]
+            self.assertEqual(d['calls'], 1)
+            self.assertTrue(d['self'] >= 0.05)
+            self.assertTrue(d['self'] <= d['total'] + 1e-12)
+
+        # the concurrent calls are nested in the group's call, not in each other
+        par_entry = entries[('par', '_solve_nonlinear')]
+        self.assertEqual(par_entry['calls'], 1)
+        self.assertTrue(par_entry['self'] < par_entry['total'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -610,6 +610,167 @@ class TestCase(unittest.TestCase):
         val = op.transfer_var(4, 4)
         self.assertEqual(val, '#$%')
 
+    def test_templated_input_compiled(self):
+        template = '\n'.join([
+            "Junk",
+            "Anchor",
+            " A 1, 2 34, Test 1e65",
+            " B 4 Stuff",
+            "Anchor",
+            " C 77 False Inf 333.444",
+            "0 0 0 0 0",
+            "0 0 0 0 0",
+            "0 0 0 0 0"
+        ])
+
+        outfile = open(self.templatename, 'w')
+        outfile.write(template)
+        outfile.close()
+
+        def transfer(values):
+            gen = InputFileGenerator()
+            gen.set_template_file(self.templatename)
+            gen.set_generated_file(self.filename)
+            gen.set_delimiters(', ')
+
+            gen.mark_anchor('Anchor')
+            gen.transfer_var(values[0], 1, 3)
+            gen.transfer_var(values[1], 1, 3)
+            gen.reset_anchor()
+            gen.transfer_var(values[2], 3, 2)
+            gen.mark_anchor('C 77')
+            gen.transfer_var(values[3], -3, 6)
+            gen.clearline(-5)
+            gen.transfer_array(values[4], 1, 2, 3, sep=' ')
+            gen.transfer_2Darray(values[5], 2, 3, 2, 4)
+            return gen
+
+        values = [3.0, 1.5, '55', 1.3e-37, array([1, 2, 3, 4.75]),
+                  array([[1.5, 2., 3.], [4., 5., 6.25]])]
+        gen = transfer(values)
+        gen.generate()
+
+        with open(self.filename, 'r') as f:
+            answer = f.read()
+
+        template = gen.compile()
+        template.set_generated_file('compiled.dat')
+        template.generate(values)
+
+        with open('compiled.dat', 'r') as f:
+            result = f.read()
+
+        self.assertEqual(answer, result)
+
+        # the same shapes, but different values and types
+        values = [7, 0.1, 'abc', -2.0, ['x', 2.5, 9, 1e-9],
+                  array([[0.1, 2., 1e10], [-4., 1. / 3., 7.]])]
+        transfer(values).generate()
+
+        with open(self.filename, 'r') as f:
+            answer = f.read()
+
+        self.assertEqual(answer, template.generate(values, return_data=True))
+
+        with open('compiled.dat', 'r') as f:
+            self.assertEqual(answer, f.read())
+
+        # Test some errors
+        with self.assertRaises(ValueError) as cm:
+            template.generate(values[:-1])
+
+        self.assertEqual(str(cm.exception), "Expected 6 values but got 5.")
+
+        values[4] = array([1, 2, 3])
+        with self.assertRaises(ValueError) as cm:
+            template.generate(values)
+
+        self.assertEqual(str(cm.exception),
+                         "Expected value 4 to have shape (4,) but it has shape (3,).")
+
+    def test_output_parse_compiled(self):
+        lines = [
+            "Junk",
+            "Anchor",
+            " A 1, 2 34, Test 1e65",
+            " B 4 Stuff",
+            "Anchor",
+            " C 77 False NaN 333.444",
+            " 1,2,3,4,5",
+            " Inf 1.#QNAN -1.#IND",
+            "Key a b c d e",
+            "10 20 30 40 50 60 70 80",
+            "11 21 31 41 51 61 71 81"
+        ]
+
+        with open(self.filename, 'w') as f:
+            f.write('\n'.join(lines))
+
+        def transfer(gen):
+            values = []
+            gen.set_delimiters(' ')
+            gen.mark_anchor('Anchor')
+            values.append(gen.transfer_var(1, 1))
+            gen.reset_anchor()
+            values.append(gen.transfer_var(3, 2))
+            gen.mark_anchor('Anchor', 2)
+            values.append(gen.transfer_var(1, 4))
+            values.append(gen.transfer_line(-1))
+            values.append(gen.transfer_keyvar('Key', 3))
+            values.append(gen.transfer_array(5, 1, 6, 3))
+            values.append(gen.transfer_2Darray(5, 2, 6, 5))
+            gen.set_delimiters(', ')
+            values.append(gen.transfer_var(2, 3))
+            gen.set_delimiters('columns')
+            values.append(gen.transfer_var(1, 17))
+            return values
+
+        def check(actual, expected):
+            self.assertEqual(len(actual), len(expected))
+            for act, exp in zip(actual, expected):
+                if isinstance(exp, numpy.ndarray):
+                    assert_equal_arrays(act, exp)
+                elif isinstance(exp, float) and isnan(exp):
+                    self.assertTrue(isnan(act))
+                else:
+                    self.assertEqual(act, exp)
+                    self.assertEqual(type(act), type(exp))
+
+        gen = FileParser()
+        gen.set_file(self.filename)
+        expected = transfer(gen)
+
+        parser = gen.compile()
+        check(parser.parse(self.filename), expected)
+
+        # the same layout with different values
+        lines[2] = " Z 1, 2 34, Test 1e65"
+        lines[5] = " C 77 False 2D2 333.5"
+        lines[6] = " 1,2,x,4,5"
+        lines[8] = "Key a b -1.5e-3 d e"
+        lines[9] = "10 20 30 40 50 60 70 80"
+        lines[10] = "11 2.5 31 41e2 51 61 71 81"
+        with open('other.dat', 'w') as f:
+            f.write('\n'.join(lines))
+
+        gen.set_file('other.dat')
+        expected = transfer(gen)
+        self.assertEqual(expected[0], 'Z')
+        self.assertEqual(expected[2], 200.)
+        self.assertEqual(expected[8], 333.5)
+        check(parser.parse('other.dat'), expected)
+
+        # a different layout
+        with open('other.dat', 'w') as f:
+            f.write('\n'.join(lines[:4] + lines[5:]))
+
+        with self.assertRaises(RuntimeError) as cm:
+            parser.parse('other.dat')
+
+        self.assertEqual(str(cm.exception),
+                         "Could not find pattern Anchor on line 5 of output file other.dat, so "
+                         "it doesn't have the layout the parser was compiled for.")
+
 
 class FileGenFeature(unittest.TestCase):
 
@@ -924,5 +1085,82 @@ class FileParserArrayColumnsFeature(unittest.TestCase):
                          numpy.array([11., 22., 33., 44., 55., 66.]))
 
 
+class FileCompileFeature(unittest.TestCase):
+
+    def setUp(self):
+        self.startdir = os.getcwd()
+        self.tempdir = tempfile.mkdtemp(prefix='omdao-')
+        os.chdir(self.tempdir)
+
+        with open('template.dat', 'w') as f:
+            f.write('\n'.join([
+                "INPUT",
+                "1 2 3",
+                "INPUT",
+                "10.1 20.2 30.3",
+                "A B C"
+            ]))
+
+        with open('output.dat', 'w') as f:
+            f.write('\n'.join([
+                "LOAD CASE 1",
+                "STRESS 1.3334e7 3.9342e7 NaN",
+                "LOAD CASE 2",
+                "STRESS 11 22 33"
+            ]))
+
+    def tearDown(self):
+        os.chdir(self.startdir)
+        try:
+            shutil.rmtree(self.tempdir)
+        except OSError:
+            pass
+
+    def test_compile_template(self):
+        from numpy import array
+        from openmdao.utils.file_wrap import InputFileGenerator
+
+        gen = InputFileGenerator()
+        gen.set_template_file('template.dat')
+        gen.set_generated_file('input.dat')
+
+        gen.mark_anchor("INPUT")
+        gen.transfer_var(7, 1, 2)
+        gen.mark_anchor("INPUT")
+        gen.transfer_array(array([4.0, 5.0, 6.0]), 1, 1, 3)
+
+        template = gen.compile()
+
+        for x in range(3):
+            template.generate([x, array([1.5, 2.5, x])])
+
+        with open('input.dat', 'r') as f:
+            self.assertEqual(f.read(), '\n'.join([
+                "INPUT",
+                "1 2 3",
+                "INPUT",
+                "1.5 2.5 2.0",
+                "A B C"
+            ]))
+
+    def test_compile_parser(self):
+        from openmdao.utils.file_wrap import FileParser
+
+        parser = FileParser()
+        parser.set_file('output.dat')
+
+        parser.mark_anchor("LOAD CASE")
+        parser.transfer_var(1, 2)
+        parser.mark_anchor("LOAD CASE")
+        parser.transfer_array(1, 2, 1, 4)
+
+        compiled = parser.compile()
+
+        stress1, stress2 = compiled.parse('output.dat')
+
+        assert_near_equal(stress1, 13334000.0)
+        assert_near_equal(stress2, numpy.array([11., 22., 33.]))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,76 @@
+import itertools
+import unittest
+
+import networkx as nx
+import numpy as np
+
+from openmdao.utils.graph_utils import get_min_feedback_order, get_feedback_weight
+
+
+def _random_graph(num_nodes, num_edges, seed):
+    rng = np.random.RandomState(seed)
+    graph = nx.DiGraph()
+    nodes = ['n%d' % i for i in range(num_nodes)]
+    graph.add_nodes_from(nodes)
+    while graph.number_of_edges() < num_edges:
+        src, tgt = rng.choice(num_nodes, 2, replace=False)
+        graph.add_edge(nodes[src], nodes[tgt], weight=int(rng.randint(1, 4)))
+    return graph, nodes
+
+
+class TestMinFeedbackOrder(unittest.TestCase):
+
+    def test_feedback_weight(self):
+        graph = nx.DiGraph([('a', 'b'), ('b', 'c'), ('c', 'a')])
+
+        self.assertEqual(get_feedback_weight(graph, ['a', 'b', 'c']), 1)
+        self.assertEqual(get_feedback_weight(graph, ['c', 'b', 'a']), 2)
+        self.assertEqual(get_feedback_weight(graph, ['c', 'b', 'a'], lambda src, tgt: 3), 6)
+
+    def test_acyclic(self):
+        graph = nx.DiGraph([('a', 'b'), ('b', 'c'), ('a', 'd')])
+
+        order = get_min_feedback_order(graph, ['d', 'c', 'b', 'a'])
+
+        self.assertEqual(order, ['a', 'd', 'b', 'c'])
+        self.assertEqual(get_feedback_weight(graph, order), 0)
+
+    def test_keeps_optimal_order(self):
+        graph = nx.DiGraph([('a', 'b'), ('b', 'c'), ('c', 'a'), ('d', 'e')])
+
+        # each rotation of the cycle has a single feedback edge
+        for order in (['a', 'b', 'c'], ['b', 'c', 'a'], ['c', 'a', 'b']):
+            order = order + ['d', 'e']
+            self.assertEqual(get_min_feedback_order(graph, order), order)
+
+    def test_exact_matches_brute_force(self):
+        for seed in range(20):
+            graph, nodes = _random_graph(6, 12, seed)
+
+            def weight(src, tgt):
+                return graph.edges[src, tgt]['weight']
+
+            best = min(get_feedback_weight(graph, order, weight)
+                       for order in itertools.permutations(nodes))
+
+            order = get_min_feedback_order(graph, nodes, weight)
+
+            self.assertEqual(sorted(order), sorted(nodes))
+            self.assertEqual(get_feedback_weight(graph, order, weight), best)
+
+    def test_greedy(self):
+        for seed in range(20):
+            graph, nodes = _random_graph(8, 20, seed)
+
+            order = get_min_feedback_order(graph, nodes, max_exact=0)
+            exact = get_min_feedback_order(graph, nodes)
+
+            self.assertEqual(sorted(order), sorted(nodes))
+            self.assertLessEqual(get_feedback_weight(graph, order),
+                                 get_feedback_weight(graph, nodes))
+            self.assertLessEqual(get_feedback_weight(graph, exact),
+                                 get_feedback_weight(graph, order))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import unittest
+import json
+from io import StringIO
+
+import openmdao.api as om
+from openmdao.core.group import Group
+from openmdao.core.system import System
+from openmdao.test_suite.components.sellar import SellarNoDerivatives
+from openmdao.utils.setup_timing import SetupTimer, setup_timing
+from openmdao.utils.testing_utils import use_tempdirs
+
+
+@use_tempdirs
+class TestSetupTiming(unittest.TestCase):
+
+    def test_timing(self):
+        prob = om.Problem(SellarNoDerivatives())
+
+        with setup_timing() as timer:
+            prob.setup()
+            prob.final_setup()
+
+        # original methods are restored
+        self.assertFalse(hasattr(Group.__dict__['_setup_var_data'], '__wrapped__'))
+        self.assertFalse(hasattr(System.__dict__['_setup_vectors'], '__wrapped__'))
+
+        data = timer.get_data()
+
+        for phase in ('setup', 'final_setup', '_setup_procs', '_setup_var_data',
+                      '_setup_global_connections', '_setup_vectors', '_setup_transfers',
+                      '_setup_relevance'):
+            self.assertTrue(phase in data['phases'], phase)
+
+        entries = {(d['class'], d['method']): d for d in data['classes']}
+
+        # one call per instance, calls to super() aren't counted separately
+        self.assertEqual(entries[('ExecComp', '_setup_var_data')]['calls'], 3)
+        self.assertEqual(entries[('SellarNoDerivatives', '_setup_var_data')]['calls'], 1)
+
+        for d in data['classes']:
+            self.assertTrue(d['self'] <= d['total'] + 1e-12)
+
+        # entries are sorted by decreasing self time
+        selftimes = [d['self'] for d in data['classes']]
+        self.assertEqual(selftimes, sorted(selftimes, reverse=True))
+
+        # the outermost setup includes everything else done during setup
+        self.assertTrue(data['phases']['setup'] >= data['phases']['_setup_procs'])
+
+    def test_report_and_json(self):
+        prob = om.Problem(SellarNoDerivatives())
+
+        timer = SetupTimer()
+        with setup_timing(timer):
+            prob.setup()
+        with setup_timing(timer):
+            prob.final_setup()
+
+        stream = StringIO()
+        timer.report(stream, sort='calls')
+        text = stream.getvalue()
+        self.assertTrue('Setup phases' in text)
+        self.assertTrue('Setup methods by class' in text)
+
+        timer.save_json('timing.json')
+        with open('timing.json', 'r') as f:
+            data = json.load(f)
+
+        self.assertEqual(set(data), {'phases', 'classes'})
+        self.assertTrue('_setup_vectors' in data['phases'])
+        self.assertEqual(set(data['classes'][0]), {'class', 'method', 'calls', 'self', 'total'})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,198 @@
+"""
+Base class for low overhead timing of methods of OpenMDAO objects.
+
+Timing is done by temporarily replacing methods of the relevant classes with wrappers that
+accumulate wall time and call counts.  Nothing is wrapped unless timing is active, so there is
+no cost when timing is not being used.
+"""
+
+import threading
+from time import perf_counter
+from collections import defaultdict
+from functools import wraps
+
+
+class _MethodTimer(object):
+    """
+    Accumulates the number of calls and time spent in a set of methods.
+
+    Each thread keeps its own stack of active calls, so methods that run concurrently in threads
+    are timed independently.
+
+    Attributes
+    ----------
+    timings : dict
+        Mapping of key to [number of calls, total time, self time]. Total time includes time
+        spent in timed calls made on other objects, while self time excludes it.
+    phases : dict
+        Mapping of method name to the wall time spent in its outermost calls.
+    _local : threading.local
+        Holds the stack of [object, method name, time of nested calls] entries for active calls
+        and the number of active calls for each method name for each thread.
+    _lock : threading.Lock
+        Lock protecting updates of timings and phases.
+    _orig : list
+        Entries of (owner, attribute name, original attribute) for each replaced attribute.
+    """
+
+    def __init__(self):
+        """
+        Initialize attributes.
+        """
+        self.timings = defaultdict(lambda: [0, 0.0, 0.0])
+        self.phases = defaultdict(float)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._orig = []
+
+    def _get_key(self, obj, name):
+        """
+        Return the key that timings of the given call are accumulated under.
+
+        Parameters
+        ----------
+        obj : object
+            The object whose method was called.
+        name : str
+            Name of the method.
+
+        Returns
+        -------
+        tuple
+            The key.
+        """
+        return (type(obj).__name__, name)
+
+    def _wrap(self, f, name, label=None):
+        """
+        Return a wrapper that times calls to the given method or function.
+
+        Parameters
+        ----------
+        f : function
+            The function being wrapped.
+        name : str
+            Name of the method or function.
+        label : str or None
+            If not None, f is a function rather than a method and timings are accumulated
+            under the key (label, name).
+
+        Returns
+        -------
+        function
+            The wrapper function.
+        """
+        local = self._local
+        lock = self._lock
+        timings = self.timings
+        phases = self.phases
+        get_key = self._get_key
+
+        @wraps(f)
+        def wrapper(*args, **kwargs):
+            obj = args[0] if label is None else label
+
+            try:
+                stack = local.stack
+                depth = local.depth
+            except AttributeError:
+                stack = local.stack = []
+                depth = local.depth = defaultdict(int)
+
+            # a call via super() is part of the call already being timed
+            if stack and stack[-1][0] is obj and stack[-1][1] == name:
+                return f(*args, **kwargs)
+
+            entry = [obj, name, 0.0]
+            stack.append(entry)
+            depth[name] += 1
+            start = perf_counter()
+            try:
+                return f(*args, **kwargs)
+            finally:
+                elapsed = perf_counter() - start
+                stack.pop()
+                depth[name] -= 1
+                if stack:
+                    stack[-1][2] += elapsed
+
+                key = (label, name) if label is not None else get_key(obj, name)
+                with lock:
+                    if depth[name] == 0:
+                        phases[name] += elapsed
+                    t = timings[key]
+                    t[0] += 1
+                    t[1] += elapsed
+                    t[2] += elapsed - entry[2]
+
+        return wrapper
+
+    def _replace(self, owner, name, wrapper):
+        """
+        Replace the named attribute of owner, saving the original so it can be restored.
+
+        Parameters
+        ----------
+        owner : class or module
+            Object owning the attribute.
+        name : str
+            Name of the attribute.
+        wrapper : function
+            The replacement.
+        """
+        self._orig.append((owner, name, owner.__dict__[name]))
+        setattr(owner, name, wrapper)
+
+    def _wrap_methods(self, base, methods):
+        """
+        Wrap the named methods in the given class and all of its currently defined subclasses.
+
+        Parameters
+        ----------
+        base : class
+            The base class.
+        methods : list of str
+            Names of the methods to wrap.
+        """
+        for klass in _all_subclasses(base):
+            for name in methods:
+                if name in klass.__dict__:
+                    self._replace(klass, name, self._wrap(klass.__dict__[name], name))
+
+    def start(self):
+        """
+        Start timing by wrapping the timed methods.
+        """
+        raise NotImplementedError()
+
+    def stop(self):
+        """
+        Stop timing and restore all of the original methods.
+        """
+        for owner, name, orig in reversed(self._orig):
+            setattr(owner, name, orig)
+        self._orig = []
+
+
+def _all_subclasses(klass):
+    """
+    Yield the given class and all of its currently defined subclasses.
+
+    Parameters
+    ----------
+    klass : class
+        The base class.
+
+    Yields
+    ------
+    class
+        The base class or one of its subclasses.
+    """
+    seen = set()
+    stack = [klass]
+    while stack:
+        k = stack.pop()
+        if k not in seen:
+            seen.add(k)
+            yield k
+            stack.extend(k.__subclasses__())
@@ -28,12 +28,14 @@ from openmdao.utils.general_utils import simple_warning, default_noraise
 from openmdao.utils.mpi import MPI
 from openmdao.visualization.html_utils import read_files, write_script, DiagramWriter
 from openmdao.utils.general_utils import warn_deprecation
-from openmdao.core.constants import _UNDEFINED
+from openmdao.core.constants import _UNDEFINED, INT_DTYPE
 
 _IND = 4  # HTML indentation (spaces)
 
 _MAX_ARRAY_SIZE_FOR_REPR_VAL = 1000  # If var has more elements than this do not pass to N2
 
+_VALUES_CHUNK_SIZE = 1000  # Number of variable values in each separately compressed chunk
+
 
 def _convert_nans_in_nested_list(val_as_list):
     """
@@ -77,12 +79,16 @@ def _convert_ndarray_to_support_nans_in_json(val):
     object : list, possibly nested
         The equivalent list with any nan values replaced with the string "nan".
     """
+    # only arrays containing nan or inf need their elements checked one by one
+    if val.dtype.kind in 'iub' or (val.dtype.kind in 'fc' and np.isfinite(val).all()):
+        return val.tolist()
+
     val_as_list = val.tolist()
     _convert_nans_in_nested_list(val_as_list)
     return(val_as_list)
 
 
-def _get_var_dict(system, typ, name):
+def _get_var_dict(system, typ, name, values=True):
     if name in system._var_discrete[typ]:
         meta = system._var_discrete[typ][name]
         is_discrete = True
@@ -125,16 +131,19 @@ def _get_var_dict(system, typ, name):
         else:
             var_dict['value'] = type(meta['value']).__name__
     else:
-        if meta['value'].size < _MAX_ARRAY_SIZE_FOR_REPR_VAL:
+        if values and meta['value'].size < _MAX_ARRAY_SIZE_FOR_REPR_VAL:
             var_dict['value'] = _convert_ndarray_to_support_nans_in_json(meta['value'])
         else:
             var_dict['value'] = None
 
+    if not values:
+        var_dict['value'] = None
+
     return var_dict
 
 
 def _get_tree_dict(system, component_execution_orders, component_execution_index,
-                   is_parallel=False):
+                   is_parallel=False, values=True):
     """Get a dictionary representation of the system hierarchy."""
     tree_dict = OrderedDict()
     tree_dict['name'] = system.name
@@ -165,10 +174,10 @@ def _get_tree_dict(system, component_execution_orders, component_execution_index
         children = []
         for typ in ['input', 'output']:
             for abs_name in system._var_abs2meta[typ]:
-                children.append(_get_var_dict(system, typ, abs_name))
+                children.append(_get_var_dict(system, typ, abs_name, values))
 
             for prom_name in system._var_discrete[typ]:
-                children.append(_get_var_dict(system, typ, prom_name))
+                children.append(_get_var_dict(system, typ, prom_name, values))
 
     else:
         if isinstance(system, ParallelGroup):
@@ -180,7 +189,7 @@ def _get_tree_dict(system, component_execution_orders, component_execution_index
         children = []
         for s in system._subsystems_myproc:
             children.append(_get_tree_dict(s, component_execution_orders,
-                            component_execution_index, is_parallel))
+                            component_execution_index, is_parallel, values))
 
         if system.comm.size > 1:
             if system._subsystems_myproc:
@@ -246,7 +255,9 @@ def _get_tree_dict(system, component_execution_orders, component_execution_index
             options[k] = system.options[k].SOLVER
         else:
             val = system.options._dict[k]['value']
-            if not system.options._dict[k]['recordable']:
+            if val is None:
+                options[k] = None
+            elif not system.options._dict[k]['recordable']:
                 options[k] = default_noraise(val)
             elif val is _UNDEFINED:
                 options[k] = str(val)
@@ -261,6 +272,29 @@ def _get_tree_dict(system, component_execution_orders, component_execution_index
     return tree_dict
 
 
+def _iter_var_dicts(tree_dict):
+    """
+    Yield the dicts of all variables in the given tree.
+
+    Parameters
+    ----------
+    tree_dict : dict
+        Dictionary representation of a system hierarchy.
+
+    Yields
+    ------
+    dict
+        Dictionary representation of a variable.
+    """
+    stack = [tree_dict]
+    while stack:
+        node = stack.pop()
+        if 'children' in node:
+            stack.extend(reversed(node['children']))
+        elif node.get('type') in ('input', 'output'):
+            yield node
+
+
 def _get_declare_partials(system):
     """
     Get a list of the declared partials.
@@ -293,7 +327,7 @@ def _get_declare_partials(system):
     return declare_partials_list
 
 
-def _get_viewer_data(data_source):
+def _get_viewer_data(data_source, values=True):
     """
     Get the data needed by the N2 viewer as a dictionary.
 
@@ -301,6 +335,8 @@ def _get_viewer_data(data_source):
     ----------
     data_source : <Problem> or <Group> or str
         A Problem or Group or case recorder file name containing the model or model data.
+    values : bool
+        If False, the value of every variable is None.
 
     Returns
     -------
@@ -344,6 +380,10 @@ def _get_viewer_data(data_source):
         if 'variables' in data_dict:
             del data_dict['variables']
 
+        if not values and 'tree' in data_dict:
+            for var_dict in _iter_var_dicts(data_dict['tree']):
+                var_dict['value'] = None
+
         return data_dict
 
     else:
@@ -353,7 +393,7 @@ def _get_viewer_data(data_source):
     data_dict = {}
     comp_exec_idx = [0]  # list so pass by ref
     orders = {}
-    data_dict['tree'] = _get_tree_dict(root_group, orders, comp_exec_idx)
+    data_dict['tree'] = _get_tree_dict(root_group, orders, comp_exec_idx, values=values)
 
     connections_list = []
 
@@ -371,30 +411,41 @@ def _get_viewer_data(data_source):
             for name in strong_comp:
                 sys_pathnames_dict[name] = len(sys_pathnames_dict)
 
-        for src, tgt in G.edges(strong_comp):
+        edges = list(G.edges(strong_comp))
+
+        # Arrays describing every edge out of a node in this SCC, so that the cycle arrows for
+        # each edge inside the SCC can be found without looping over all edges in python.
+        # Execution orders are nan for systems that aren't in orders, so they never match.
+        node_edges = {}
+        src_orders = np.empty(len(edges))
+        tgt_orders = np.empty(len(edges))
+        pairs = np.zeros((len(edges), 2), dtype=INT_DTYPE)
+        has_ids = np.zeros(len(edges), dtype=bool)
+        for i, (s, t) in enumerate(edges):
+            src_orders[i] = orders.get(s, np.nan)
+            tgt_orders[i] = orders.get(t, np.nan)
+            node_edges.setdefault(s, ([], []))[0].append(i)
+            node_edges.setdefault(t, ([], []))[1].append(i)
+            if s in sys_pathnames_dict and t in sys_pathnames_dict:
+                has_ids[i] = True
+                pairs[i] = (sys_pathnames_dict[s], sys_pathnames_dict[t])
+
+        for k, (src, tgt) in enumerate(edges):
             if src in strong_comp and tgt in strong_comp:
-                if src in orders:
-                    exe_src = orders[src]
-                else:
-                    exe_src = orders[src] = -1
-                if tgt in orders:
-                    exe_tgt = orders[tgt]
-                else:
-                    exe_tgt = orders[tgt] = -1
-
-                if exe_tgt < exe_src:
-                    exe_low = exe_tgt
-                    exe_high = exe_src
-                else:
-                    exe_low = exe_src
-                    exe_high = exe_tgt
-
-                edges_list = [
-                    (sys_pathnames_dict[s], sys_pathnames_dict[t]) for s, t in G.edges(strong_comp)
-                    if s in orders and exe_low <= orders[s] <= exe_high and t in orders and
-                    exe_low <= orders[t] <= exe_high and
-                    not (s == src and t == tgt) and t in sys_pathnames_dict
-                ]
+                for name in (src, tgt):
+                    if name not in orders:
+                        orders[name] = -1
+                        src_idxs, tgt_idxs = node_edges[name]
+                        src_orders[src_idxs] = -1
+                        tgt_orders[tgt_idxs] = -1
+
+                exe_low, exe_high = sorted((orders[src], orders[tgt]))
+
+                mask = ((src_orders >= exe_low) & (src_orders <= exe_high) &
+                        (tgt_orders >= exe_low) & (tgt_orders <= exe_high) & has_ids)
+                mask[k] = False
+                edges_list = pairs[mask].tolist()
+
                 for vsrc, vtgtlist in G.get_edge_data(src, tgt)['conns'].items():
                     for vtgt in vtgtlist:
                         connections_list.append({'src': vsrc, 'tgt': vtgt,
@@ -422,8 +473,75 @@ def _get_viewer_data(data_source):
     return data_dict
 
 
+def _compress(data):
+    """
+    Return the given data serialized as JSON, compressed, and base64 encoded.
+
+    Parameters
+    ----------
+    data : object
+        The data to be compressed.
+
+    Returns
+    -------
+    str
+        The compressed data.
+    """
+    raw_data = json.dumps(data, default=default_noraise).encode('utf8')
+    return str(base64.b64encode(zlib.compress(raw_data)).decode("ascii"))
+
+
+def _split_viewer_data(model_data):
+    """
+    Move the variable values out of the viewer data and store identical cycle arrows once.
+
+    The values are moved into chunks of _VALUES_CHUNK_SIZE values that are compressed
+    separately, so the viewer only needs to parse the tree at startup and inflates a chunk
+    of values when one of its values is displayed.  Each variable with a value is given a
+    'value_chunk' entry of [chunk index, index in chunk] instead.  Lists of cycle arrows that
+    are shared by many connections are replaced by an index into 'cycle_arrows_list'.
+
+    Parameters
+    ----------
+    model_data : dict
+        The viewer data, which is modified in place.
+
+    Returns
+    -------
+    list of str
+        The compressed chunks of values.
+    """
+    arrows_list = []
+    arrows_ids = {}
+    for conn in model_data.get('connections_list', ()):
+        arrows = conn.get('cycle_arrows')
+        if arrows:
+            key = tuple(tuple(arrow) for arrow in arrows)
+            if key not in arrows_ids:
+                arrows_ids[key] = len(arrows_list)
+                arrows_list.append(arrows)
+            conn['cycle_arrows'] = arrows_ids[key]
+    model_data['cycle_arrows_list'] = arrows_list
+
+    chunks = []
+    chunk = []
+    if 'tree' in model_data:
+        for var_dict in _iter_var_dicts(model_data['tree']):
+            if var_dict.get('value') is None:
+                continue
+            if len(chunk) == _VALUES_CHUNK_SIZE:
+                chunks.append(chunk)
+                chunk = []
+            var_dict['value_chunk'] = [len(chunks), len(chunk)]
+            chunk.append(var_dict.pop('value'))
+    if chunk:
+        chunks.append(chunk)
+
+    return [_compress(chunk) for chunk in chunks]
+
+
 def n2(data_source, outfile='n2.html', show_browser=True, embeddable=False,
-       title=None, use_declare_partial_info=False):
+       title=None, use_declare_partial_info=False, values=True):
     """
     Generate an HTML file containing a tree viewer.
 
@@ -452,9 +570,13 @@ def n2(data_source, outfile='n2.html', show_browser=True, embeddable=False,
         This option is no longer used because it is now always true.
         Still present for backwards compatibility.
 
+    values : bool, optional
+        If False, variable values are not included in the diagram, which makes the file
+        much smaller for very large models.
+
     """
     # grab the model viewer data
-    model_data = _get_viewer_data(data_source)
+    model_data = _get_viewer_data(data_source, values=values)
 
     # if MPI is active only display one copy of the viewer
     if MPI and MPI.COMM_WORLD.rank != 0:
@@ -467,9 +589,9 @@ def n2(data_source, outfile='n2.html', show_browser=True, embeddable=False,
         warn_deprecation("'use_declare_partial_info' is now the"
                          " default and the option is ignored.")
 
-    raw_data = json.dumps(model_data, default=default_noraise).encode('utf8')
-    b64_data = str(base64.b64encode(zlib.compress(raw_data)).decode("ascii"))
-    model_data = 'var compressedModel = "%s";' % b64_data
+    values_chunks = _split_viewer_data(model_data)
+    model_data = 'var compressedModel = "%s";\nvar compressedValues = [%s];' % \
+        (_compress(model_data), ', '.join(['"%s"' % chunk for chunk in values_chunks]))
 
     import openmdao
     openmdao_dir = os.path.dirname(inspect.getfile(openmdao))
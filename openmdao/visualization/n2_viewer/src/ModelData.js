@@ -10,6 +10,7 @@ class ModelData {
         this.declarePartialsList = modelJSON.declare_partials_list;
         this.useDeclarePartialsList = (this.declarePartialsList.length > 0);
         this.sysPathnamesList = modelJSON.sys_pathnames_list;
+        this.cycleArrowsList = modelJSON.cycle_arrows_list; // May be undefined.
 
         this.maxDepth = 1;
         this.unconnectedInputs = 0;
@@ -52,6 +53,29 @@ class ModelData {
         return JSON.parse(jsonStr);
     }
 
+    /**
+     * Variable values are stored apart from the tree in separately compressed chunks, so
+     * only the chunks holding values that are actually displayed are ever inflated. If the
+     * value of the node hasn't been loaded yet, inflate its chunk and store the value in it.
+     * @param {N2TreeNode} node The variable node.
+     */
+    static loadValue(node) {
+        if (!node.hasOwnProperty('value_chunk')) return;
+
+        if (!ModelData.valueChunks) ModelData.valueChunks = [];
+
+        const [chunkIdx, idx] = node.value_chunk;
+        let chunk = ModelData.valueChunks[chunkIdx];
+        if (!chunk) {
+            chunk = ModelData.valueChunks[chunkIdx] =
+                ModelData.uncompressModel(compressedValues[chunkIdx]);
+            compressedValues[chunkIdx] = null;
+        }
+
+        node.value = chunk[idx];
+        delete node.value_chunk;
+    }
+
     /**
      * For debugging: Make sure every tree member is an N2TreeNode.
      * @param {N2TreeNode} [node = this.root] The node to start with.
@@ -382,9 +406,14 @@ class ModelData {
              * each of which is an index into the sysPathnames array. Using that array we
              * can resolve the indexes to pathnames to the associated objects.
              */
-            if (Array.isPopulatedArray(conn.cycle_arrows)) {
+            // Identical lists of cycle arrows may be stored once and referenced by index.
+            let cycleArrows = conn.cycle_arrows;
+            if (typeof cycleArrows === 'number') {
+                cycleArrows = this.cycleArrowsList[cycleArrows];
+            }
+
+            if (Array.isPopulatedArray(cycleArrows)) {
                 let cycleArrowsArray = [];
-                let cycleArrows = conn.cycle_arrows;
                 for (let cycleArrow of cycleArrows) {
                     if (cycleArrow.length != 2) {
                         console.warn(throwLbl + "cycleArrowsSplitArray length not 2, got " +
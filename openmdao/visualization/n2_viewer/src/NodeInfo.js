@@ -538,6 +538,8 @@ class NodeInfo {
             this._addPropertyRow('Manually Expanded', obj.manuallyExpanded.toString(), obj)
         }
 
+        ModelData.loadValue(obj);
+
         for (const prop of this.propList) {
             if (prop.key === 'value') {
                 if (obj.hasOwnProperty('value')) {
@@ -16,7 +16,8 @@ import numpy
 
 from openmdao.api import Problem, IndepVarComp, ScipyOptimizeDriver, ExplicitComponent
 from openmdao.test_suite.components.sellar import SellarStateConnection
-from openmdao.visualization.n2_viewer.n2_viewer import _get_viewer_data, n2
+from openmdao.visualization.n2_viewer.n2_viewer import _get_viewer_data, n2, \
+     _iter_var_dicts, _split_viewer_data
 from openmdao.recorders.sqlite_recorder import SqliteRecorder
 from openmdao.test_suite.test_examples.test_betz_limit import ActuatorDisc
 from openmdao.utils.shell_proc import check_call
@@ -423,6 +424,50 @@ class TestViewModelData(unittest.TestCase):
         self.assertTrue(sqlite_model_data == compare_model_data,
                         'Model data from sqlite does not match data from Problem.')
 
+    def test_n2_values(self):
+        """
+        Test that variable values are stored in separately compressed chunks.
+        """
+        p = Problem()
+        p.model = SellarStateConnection()
+        p.setup()
+        p.final_setup()
+
+        expected = _get_viewer_data(p)
+        n2(p, outfile=self.problem_html_filename, show_browser=DEBUG_BROWSER)
+        model_data = self._extract_compressed_model(self.problem_html_filename)
+
+        with open(self.problem_html_filename, 'r') as f:
+            for line in f:
+                if re.search('var compressedValues', line):
+                    chunks = re.findall('"([^"]*)"', line)
+                    break
+
+        chunks = [json.loads(zlib.decompress(base64.b64decode(c)).decode("utf-8"))
+                  for c in chunks]
+        self.assertEqual(len(chunks), 1)
+
+        expected_vars = list(_iter_var_dicts(expected['tree']))
+        found_vars = list(_iter_var_dicts(model_data['tree']))
+        self.assertEqual(len(found_vars), len(expected_vars))
+        for exp, found in zip(expected_vars, found_vars):
+            self.assertNotIn('value', found)
+            chunk, idx = found['value_chunk']
+            self.assertEqual(chunks[chunk][idx], exp['value'])
+
+        # identical lists of cycle arrows are only stored once
+        arrows_list = model_data['cycle_arrows_list']
+        self.assertEqual(len(arrows_list), len(set(json.dumps(a) for a in arrows_list)))
+        for exp, found in zip(expected['connections_list'], model_data['connections_list']):
+            if exp.get('cycle_arrows'):
+                self.assertEqual(arrows_list[found['cycle_arrows']], exp['cycle_arrows'])
+
+        # without values, nothing is stored
+        model_data = _get_viewer_data(p, values=False)
+        for var_dict in _iter_var_dicts(model_data['tree']):
+            self.assertIsNone(var_dict['value'])
+        self.assertEqual(_split_viewer_data(model_data), [])
+
     def test_n2_command(self):
         """
         Check that there are no errors when running from the command line with a script.